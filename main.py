@@ -13,6 +13,7 @@ def main() -> None:
         config_window.get_config_colors_dict(),
         config_window.get_configuration_file_path(),
         config_window.get_difficulty_level(),
+        config_window.get_time_budget(),
     )
     game_window.run()
 
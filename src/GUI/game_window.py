@@ -6,6 +6,7 @@ game logic, and robot manipulation into a cohesive PyQt6 application.
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import List, Optional, cast
 
@@ -25,6 +26,9 @@ from PyQt6.QtWidgets import (
 )
 
 from src.checkers_game.game_controller import GameController
+from src.checkers_game.game_record import DEFAULT_GAME_RECORD_PATH
+from src.checkers_game.search_stats import SearchStats
+from src.checkers_game.search_telemetry import DEFAULT_TELEMETRY_PATH
 from src.common.configs import ColorConfig
 from src.common.enums import Color, GameReportField, GameStatus, MoveValidationResult
 from src.common.utils import CONFIG_PATH
@@ -43,6 +47,8 @@ class GameWindow:
         color_config: ColorConfig,
         config_name: str | Path,
         engine_depth: int = 3,
+        time_budget_s: Optional[float] = None,
+        ponder: bool = False,
     ) -> None:
         """Initialize the game window.
 
@@ -53,11 +59,16 @@ class GameWindow:
             color_config: Color configuration for detection.
             config_name: Calibration configuration filename.
             engine_depth: Search depth for the AI engine.
+            time_budget_s: Thinking time per robot move in seconds, or None to
+                search to `engine_depth`.
+            ponder: Search the robot's answers while the opponent is
+                thinking. Off by default, since the background search takes
+                CPU time from the camera and the GUI.
         """
         self._camera_port = camera_port
         self._cap: Optional[cv2.VideoCapture] = cv2.VideoCapture(self._camera_port)
 
-        self._game = GameController(robot_color, engine_depth)
+        self._shown_stats: Optional[SearchStats] = None
         self._robot = RobotManipulator(
             port=robot_port,
             config_path=CONFIG_PATH,
@@ -89,6 +100,17 @@ class GameWindow:
 
         self._setup_ui()
 
+        # Created last, so a window that fails to build leaves no open files
+        # or worker processes behind; `run` closes it however it ends
+        self._game = GameController(
+            robot_color,
+            engine_depth,
+            time_budget_s,
+            ponder=ponder,
+            telemetry_path=DEFAULT_TELEMETRY_PATH,
+            record_path=DEFAULT_GAME_RECORD_PATH,
+        )
+
     def _create_image_label(self, width: int, height: int, bg_color: str) -> QLabel:
         """Create a QLabel for displaying images.
 
@@ -248,6 +270,10 @@ class GameWindow:
                 self._move_status.setText("Wrong robot move! Please correct it.")
                 return
 
+            if validation_result == MoveValidationResult.OPPONENT_MOVE_TAKEN_BACK:
+                self._move_status.setText("Move taken back.")
+                return
+
             # Check game status
             report = self._game.generate_report()
             status = cast(GameStatus, report.get(GameReportField.STATUS))
@@ -261,14 +287,27 @@ class GameWindow:
             robot_color = report.get(GameReportField.ROBOT_COLOR)
 
             if turn_of == robot_color:
+                if report.get(GameReportField.IS_PLANNING):
+                    self._move_status.setText("Robot is planning its move...")
+                    return
+
                 self._move_status.setText("Robot's turn...")
                 robot_move = report.get(GameReportField.ROBOT_MOVE)
                 is_crowning = bool(report.get(GameReportField.IS_CROWNED, False))
+                self._show_search_stats(
+                    cast(
+                        Optional[SearchStats], report.get(GameReportField.SEARCH_STATS)
+                    )
+                )
 
                 if robot_move is not None:
+                    start_time = time.perf_counter()
                     self._robot.execute_move(
                         cast(List[int], robot_move), is_crown=is_crowning
                     )
+                    self._output_view.appendPlainText(
+                        f"Robot moved in {time.perf_counter() - start_time:.2f}s"
+                    )
 
                 self._frame_skip = 20
             else:
@@ -277,6 +316,18 @@ class GameWindow:
         except Exception as error:
             self._output_view.appendPlainText(f"Error: {error}")
 
+    def _show_search_stats(self, stats: Optional[SearchStats]) -> None:
+        """Write the statistics of a new robot decision to the output view.
+
+        Args:
+            stats: Statistics of the robot's most recent decision, if any.
+        """
+        if stats is None or stats is self._shown_stats:
+            return
+
+        self._shown_stats = stats
+        self._output_view.appendPlainText(stats.summary())
+
     def _handle_game_end(
         self, status: GameStatus, report: dict[GameReportField, object]
     ) -> None:
@@ -297,13 +348,20 @@ class GameWindow:
         self._window.close()
 
     def run(self) -> None:
-        """Start the game window and event loop."""
-        self._window.show()
-        self._timer.start(30)
-        self._app.exec()
+        """Start the game window and event loop.
 
-        if self._cap is not None:
-            self._cap.release()
+        The game controller and the camera are released however the event
+        loop ends, including when the window is closed.
+        """
+        try:
+            self._window.show()
+            self._timer.start(30)
+            self._app.exec()
+        finally:
+            self._game.close()
+
+            if self._cap is not None:
+                self._cap.release()
 
 
 if __name__ == "__main__":
@@ -26,6 +26,7 @@ from PyQt6.QtWidgets import (
 )
 from serial.tools import list_ports
 
+from src.checkers_game.negamax import time_budget_for_difficulty
 from src.common.configs import ColorConfig
 from src.common.enums import CalibrationMethod, Color
 from src.common.utils import CONFIG_PATH, detect_available_camera_ports
@@ -795,6 +796,9 @@ class ConfigurationWindow:
     def get_difficulty_level(self) -> int:
         return self._get_property_if_exist("_difficulty_level")
 
+    def get_time_budget(self) -> float:
+        return time_budget_for_difficulty(self.get_difficulty_level())
+
     def run(self) -> None:
         self._window.exec()
         self._stop_camera_preview()
@@ -809,5 +813,6 @@ if __name__ == "__main__":
     print(f"Colors config: {window.get_config_colors_dict()}")
     print(f"File config: {window.get_configuration_file_path()}")
     print(f"Difficulty level: {window.get_difficulty_level()}")
+    print(f"Time budget: {window.get_time_budget()}s")
     print(f"Robot color: {window.get_robot_color()}")
     print(f"Robot port: {window.get_robot_port()}")
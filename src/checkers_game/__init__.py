@@ -6,12 +6,17 @@ and AI decision engine for the checkers robot.
 
 from __future__ import annotations
 
+from src.checkers_game.bitboard import BitboardPosition
 from src.checkers_game.checkers_game import CheckersGame
 from src.checkers_game.game_controller import GameController
 from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.search_position import SearchPosition, UndoRecord
 
 __all__ = [
+    "BitboardPosition",
     "CheckersGame",
     "GameController",
     "NegamaxDecisionEngine",
+    "SearchPosition",
+    "UndoRecord",
 ]
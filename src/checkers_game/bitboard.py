@@ -0,0 +1,587 @@
+"""Bitboard position representation for the checkers engine.
+
+This module provides a compact alternative to the 8x8 NumPy board used by
+`CheckersGame`. A position is stored as three 32-bit masks over the playable
+squares, where bit `n` corresponds to tile ID `n + 1`. Move and jump detection
+is done with shift-and-mask operations over whole piece sets, so the search
+does not have to index the board cell by cell.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from src.common.enums import Color
+from src.common.utils import grid_coords_to_tile_id, tile_id_to_grid_coords
+
+__all__ = ["BitboardPosition", "find_longest_jumps", "move_key"]
+
+# Constants
+BOARD_SIZE = 8
+SQUARE_COUNT = 32
+FULL_MASK = (1 << SQUARE_COUNT) - 1
+EMPTY_TILE = 0
+ORANGE_MAN = 1
+BLUE_MAN = -1
+ORANGE_KING = 2
+BLUE_KING = -2
+
+# Same direction order as the CheckersGame generators, so that both produce
+# identical move lists.
+DIRECTIONS: Tuple[Tuple[int, int], ...] = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+OPPOSITE_DIRECTION: Tuple[int, ...] = (2, 3, 0, 1)
+ORANGE_FORWARD: Tuple[int, ...] = (1, 0)
+BLUE_FORWARD: Tuple[int, ...] = (2, 3)
+
+# Squares on which a man of the given color is promoted.
+ORANGE_PROMOTION_MASK = 0xF << 28
+BLUE_PROMOTION_MASK = 0xF
+
+# A side has 12 pieces, so no capture sequence is longer than 12 jumps
+MAX_JUMPS = 12
+
+
+def _build_square_coords() -> Tuple[Tuple[int, int], ...]:
+    """Map every square index (0-31) to its (x, y) grid coordinates."""
+    return tuple(tile_id_to_grid_coords(square + 1) for square in range(SQUARE_COUNT))
+
+
+def _build_neighbors(
+    coords: Tuple[Tuple[int, int], ...],
+) -> Tuple[Tuple[int, ...], ...]:
+    """Build the diagonal neighbor of every square in every direction.
+
+    Returns:
+        Table indexed by [direction][square] holding the neighbor square,
+        or -1 if the neighbor lies outside the board.
+    """
+    table = []
+    for dx, dy in DIRECTIONS:
+        row = []
+        for x, y in coords:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < BOARD_SIZE and 0 <= ny < BOARD_SIZE:
+                row.append(grid_coords_to_tile_id(nx, ny) - 1)
+            else:
+                row.append(-1)
+        table.append(tuple(row))
+    return tuple(table)
+
+
+def _build_rays(
+    neighbors: Tuple[Tuple[int, ...], ...],
+) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Build the full diagonal ray from every square in every direction."""
+    table = []
+    for direction in range(len(DIRECTIONS)):
+        row = []
+        for square in range(SQUARE_COUNT):
+            ray = []
+            current = neighbors[direction][square]
+            while current >= 0:
+                ray.append(current)
+                current = neighbors[direction][current]
+            row.append(tuple(ray))
+        table.append(tuple(row))
+    return tuple(table)
+
+
+def _build_shifts(
+    neighbors: Tuple[Tuple[int, ...], ...],
+) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """Group the neighbor table into (shift, source mask) pairs per direction.
+
+    On the 32-square layout a diagonal step is a shift by 3, 4 or 5 bits
+    depending on row parity, so every direction is described by two shifts,
+    each applied to the squares it is valid for.
+    """
+    table = []
+    for direction in range(len(DIRECTIONS)):
+        masks: Dict[int, int] = {}
+        for square, neighbor in enumerate(neighbors[direction]):
+            if neighbor >= 0:
+                delta = neighbor - square
+                masks[delta] = masks.get(delta, 0) | (1 << square)
+        table.append(tuple(sorted(masks.items())))
+    return tuple(table)
+
+
+SQUARE_COORDS = _build_square_coords()
+NEIGHBORS = _build_neighbors(SQUARE_COORDS)
+RAYS = _build_rays(NEIGHBORS)
+SHIFTS = _build_shifts(NEIGHBORS)
+
+_ARRAY_X = np.array([x for x, _ in SQUARE_COORDS])
+_ARRAY_Y = np.array([y for _, y in SQUARE_COORDS])
+
+
+def shift_mask(mask: int, direction: int) -> int:
+    """Move every set bit of a mask one diagonal step in a direction.
+
+    Bits that would leave the board are dropped.
+
+    Args:
+        mask: Set of squares.
+        direction: Index into `DIRECTIONS`.
+
+    Returns:
+        Set of the neighboring squares.
+    """
+    result = 0
+    for delta, source_mask in SHIFTS[direction]:
+        if delta > 0:
+            result |= (mask & source_mask) << delta
+        else:
+            result |= (mask & source_mask) >> -delta
+    return result
+
+
+def move_key(move: List[int]) -> int:
+    """Encode a move as a single integer.
+
+    The key packs the start square, the end square and the mask of captured
+    squares, which identifies a move among the legal moves of a position.
+
+    Args:
+        move: Sequence of tile IDs representing the move.
+
+    Returns:
+        Integer key of the move (fits in 42 bits).
+    """
+    captured = 0
+    for tile in move[1:-1]:
+        if tile < 0:
+            captured |= 1 << (-tile - 1)
+    return (move[0] - 1) | (move[-1] - 1) << 5 | captured << 10
+
+
+def find_longest_jumps(
+    square: int, is_king: bool, opponents: int, blockers: int
+) -> List[List[int]]:
+    """Find the longest capture sequences of one piece.
+
+    The sequences are searched depth first with an explicit stack instead of
+    recursion. The stack, the path of the current sequence and the mask of
+    the pieces captured so far are kept in place and updated as the search
+    goes down and back up, so a sequence is only copied out once it is
+    complete and at least as long as the longest one found so far. Captured
+    pieces stay on the board until the sequence ends: they block the way and
+    cannot be captured twice. The result, including its order, is the same
+    as that of `CheckersGame._get_man_jumps` and `_get_king_jumps`.
+
+    Args:
+        square: Square of the piece.
+        is_king: Whether the piece is a flying king.
+        opponents: Mask of opponent pieces.
+        blockers: Mask of occupied squares, excluding the moving piece.
+
+    Returns:
+        Longest jump sequences of the piece, or an empty list if it cannot
+        capture.
+    """
+    # Per depth: square reached, direction being searched, index on its ray
+    # of the next landing square (0 before the direction is scanned) and the
+    # piece captured in that direction
+    squares = [square] * (MAX_JUMPS + 1)
+    directions = [0] * (MAX_JUMPS + 1)
+    landings = [0] * (MAX_JUMPS + 1)
+    targets = [0] * (MAX_JUMPS + 1)
+    path = [square + 1] * (2 * MAX_JUMPS + 1)
+
+    captured = 0
+    longest = 1
+    jumps: List[List[int]] = []
+    depth = 0
+    continued = False
+
+    while True:
+        current = squares[depth]
+        direction = directions[depth]
+        index = landings[depth]
+        land = -1
+
+        # Find the next jump from the current square
+        while direction < 4:
+            ray = RAYS[direction][current]
+            size = len(ray)
+            if index == 0:
+                # A king slides to the first occupied square, a man cannot
+                target_index = 0
+                if is_king:
+                    while target_index < size and not blockers >> ray[target_index] & 1:
+                        target_index += 1
+                index = size
+                if target_index < size:
+                    target = ray[target_index]
+                    if opponents >> target & 1 and not captured >> target & 1:
+                        targets[depth] = target
+                        index = target_index + 1
+
+            if index < size and not blockers >> ray[index] & 1:
+                land = ray[index]
+                # A king may land on any free square behind the captured
+                # piece, a man only right behind it
+                landings[depth] = index + 1 if is_king else size
+                break
+
+            direction += 1
+            index = 0
+
+        if land >= 0:
+            directions[depth] = direction
+            target = targets[depth]
+            captured |= 1 << target
+            path[2 * depth + 1] = -(target + 1)
+            path[2 * depth + 2] = land + 1
+            depth += 1
+            squares[depth] = land
+            directions[depth] = 0
+            landings[depth] = 0
+            continued = False
+            continue
+
+        # Every jump from here has been searched; a square without any ends
+        # a sequence
+        if not continued and depth > 0:
+            length = 2 * depth + 1
+            if length > longest:
+                longest = length
+                jumps = [path[:length]]
+            elif length == longest:
+                jumps.append(path[:length])
+        if depth == 0:
+            return jumps
+
+        depth -= 1
+        captured &= ~(1 << targets[depth])
+        continued = True
+
+
+def iter_squares(mask: int):
+    """Yield the indices of set bits in ascending order."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+class BitboardPosition:
+    """Compact checkers position stored as three 32-bit masks.
+
+    Attributes:
+        orange: Squares occupied by orange pieces.
+        blue: Squares occupied by blue pieces.
+        kings: Squares occupied by kings of either color.
+    """
+
+    __slots__ = ("orange", "blue", "kings")
+
+    def __init__(self, orange: int = 0, blue: int = 0, kings: int = 0) -> None:
+        """Initialize a position from raw masks.
+
+        Args:
+            orange: Mask of orange pieces.
+            blue: Mask of blue pieces.
+            kings: Mask of kings (subset of orange | blue).
+        """
+        self.orange = orange
+        self.blue = blue
+        self.kings = kings
+
+    @classmethod
+    def from_array(cls, game_state: np.ndarray) -> BitboardPosition:
+        """Build a position from the 8x8 board used by `CheckersGame`.
+
+        Args:
+            game_state: 8x8 board indexed as `game_state[x][y]`.
+
+        Returns:
+            Equivalent bitboard position.
+        """
+        values = np.asarray(game_state)[_ARRAY_X, _ARRAY_Y]
+        orange = blue = kings = 0
+        for square, value in enumerate(values.tolist()):
+            bit = 1 << square
+            if value > 0:
+                orange |= bit
+            elif value < 0:
+                blue |= bit
+            if value in (ORANGE_KING, BLUE_KING):
+                kings |= bit
+        return cls(orange, blue, kings)
+
+    def to_array(self) -> np.ndarray:
+        """Convert the position back to the 8x8 `CheckersGame` board.
+
+        Returns:
+            8x8 NumPy array indexed as `game_state[x][y]`.
+        """
+        values = [self.get_square_value(square) for square in range(SQUARE_COUNT)]
+        game_state = np.zeros((BOARD_SIZE, BOARD_SIZE), dtype=int)
+        game_state[_ARRAY_X, _ARRAY_Y] = values
+        return game_state
+
+    def copy(self) -> BitboardPosition:
+        """Return an independent copy of the position."""
+        return BitboardPosition(self.orange, self.blue, self.kings)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitboardPosition):
+            return NotImplemented
+        return (
+            self.orange == other.orange
+            and self.blue == other.blue
+            and self.kings == other.kings
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.orange, self.blue, self.kings))
+
+    def __repr__(self) -> str:
+        return (
+            f"BitboardPosition(orange={self.orange:#010x}, "
+            f"blue={self.blue:#010x}, kings={self.kings:#010x})"
+        )
+
+    def get_square_value(self, square: int) -> int:
+        """Return the `CheckersGame` tile value of a square.
+
+        Args:
+            square: 0-based square index (tile ID - 1).
+
+        Returns:
+            Integer value of the tile (0, 1, -1, 2, -2).
+        """
+        bit = 1 << square
+        value = 2 if self.kings & bit else 1
+        if self.orange & bit:
+            return value
+        if self.blue & bit:
+            return -value
+        return EMPTY_TILE
+
+    def is_irreversible_move(self, move: List[int]) -> bool:
+        """Check whether a move can never be undone by later moves.
+
+        Captures and man moves are irreversible, so no position reached before
+        them can occur again.
+
+        Args:
+            move: Sequence of tile IDs representing the move.
+
+        Returns:
+            True if the move captures a piece or moves a man.
+        """
+        return len(move) > 2 or not self.kings >> (move[0] - 1) & 1
+
+    def get_color_poss_opts(self, color: Color) -> List[List[int]]:
+        """Get all possible moves and jumps for a given color.
+
+        The result matches `CheckersGame.get_color_poss_opts` element for
+        element, including the order of the moves.
+
+        Args:
+            color: Player color (ORANGE or BLUE).
+
+        Returns:
+            List of possible move sequences.
+        """
+        jumps = self.get_captures(color)
+        if jumps:
+            return jumps
+        return list(self._iter_quiet_moves(color))
+
+    def iter_moves(self, color: Color) -> Iterator[List[int]]:
+        """Generate the legal moves of a color lazily, captures first.
+
+        Each capture or quiet move is only built when it is asked for, so a
+        caller that stops early, e.g. at the first move it is looking for,
+        skips the rest. The moves come in the order of
+        `get_color_poss_opts`. Quiet moves only follow if there is no
+        capture, since capturing is mandatory.
+
+        Args:
+            color: Player color (ORANGE or BLUE).
+
+        Yields:
+            Legal move sequences.
+        """
+        own, opponents = self._split_sides(color)
+        occupied = self.orange | self.blue
+        own_kings = own & self.kings
+        jumpers = self._get_jumpers(own, opponents)
+        for square in iter_squares(jumpers):
+            # The moving piece has left its square for the whole sequence.
+            yield from find_longest_jumps(
+                square,
+                bool(own_kings >> square & 1),
+                opponents,
+                occupied & ~(1 << square),
+            )
+        if not jumpers:
+            yield from self._iter_quiet_moves(color)
+
+    def get_captures(self, color: Color) -> List[List[int]]:
+        """Get the capture sequences of a color, without its quiet moves.
+
+        Args:
+            color: Player color (ORANGE or BLUE).
+
+        Returns:
+            The longest capture sequences of every piece that can capture,
+            or an empty list.
+        """
+        own, opponents = self._split_sides(color)
+        jumpers = self._get_jumpers(own, opponents)
+        if not jumpers:
+            return []
+
+        occupied = self.orange | self.blue
+        own_kings = own & self.kings
+        all_jumps: List[List[int]] = []
+        for square in iter_squares(jumpers):
+            # The moving piece has left its square for the whole sequence.
+            all_jumps.extend(
+                find_longest_jumps(
+                    square,
+                    bool(own_kings >> square & 1),
+                    opponents,
+                    occupied & ~(1 << square),
+                )
+            )
+        return all_jumps
+
+    def has_any_move(self, color: Color) -> bool:
+        """Check whether a color has a legal move, without generating moves.
+
+        Args:
+            color: Player color (ORANGE or BLUE).
+
+        Returns:
+            True if the color can move or capture.
+        """
+        own, opponents = self._split_sides(color)
+        empty = ~(self.orange | self.blue) & FULL_MASK
+        own_men = own & ~self.kings
+        own_kings = own & self.kings
+        forward = ORANGE_FORWARD if color == Color.ORANGE else BLUE_FORWARD
+
+        for direction in forward:
+            if shift_mask(own_men, direction) & empty:
+                return True
+        if own_kings:
+            for direction in range(len(DIRECTIONS)):
+                if shift_mask(own_kings, direction) & empty:
+                    return True
+        return bool(self._get_jumpers(own, opponents))
+
+    def _split_sides(self, color: Color) -> Tuple[int, int]:
+        """Return the masks of the pieces of a color and of its opponent."""
+        if color == Color.ORANGE:
+            return self.orange, self.blue
+        return self.blue, self.orange
+
+    def _get_jumpers(self, own: int, opponents: int) -> int:
+        """Return the pieces of one side that have a capture available."""
+        occupied = self.orange | self.blue
+        empty = ~occupied & FULL_MASK
+        jumpers = self._get_man_jumpers(own & ~self.kings, opponents, empty)
+        own_kings = own & self.kings
+        if own_kings:
+            jumpers |= self._get_king_jumpers(own_kings, opponents, occupied)
+        return jumpers
+
+    def _get_man_jumpers(self, men: int, opponents: int, empty: int) -> int:
+        """Return the men that have at least one capture available."""
+        jumpers = 0
+        for direction in range(len(DIRECTIONS)):
+            landings = shift_mask(shift_mask(men, direction) & opponents, direction)
+            landings &= empty
+            if landings:
+                back = OPPOSITE_DIRECTION[direction]
+                jumpers |= shift_mask(shift_mask(landings, back), back)
+        return jumpers
+
+    def _get_king_jumpers(self, kings: int, opponents: int, occupied: int) -> int:
+        """Return the kings that have at least one capture available."""
+        jumpers = 0
+        for square in iter_squares(kings):
+            for direction in range(len(DIRECTIONS)):
+                ray = RAYS[direction][square]
+                for index, target in enumerate(ray):
+                    if occupied >> target & 1:
+                        if (
+                            opponents >> target & 1
+                            and index + 1 < len(ray)
+                            and not occupied >> ray[index + 1] & 1
+                        ):
+                            jumpers |= 1 << square
+                        break
+                if jumpers >> square & 1:
+                    break
+        return jumpers
+
+    def _iter_quiet_moves(self, color: Color) -> Iterator[List[int]]:
+        """Generate the non-capturing moves of one side lazily."""
+        own, _ = self._split_sides(color)
+        forward = ORANGE_FORWARD if color == Color.ORANGE else BLUE_FORWARD
+        occupied = self.orange | self.blue
+        empty = ~occupied & FULL_MASK
+        own_kings = own & self.kings
+        own_men = own & ~self.kings
+
+        targets = [shift_mask(own_men, direction) & empty for direction in forward]
+        movers = own_kings
+        for direction, direction_targets in zip(forward, targets):
+            back = OPPOSITE_DIRECTION[direction]
+            movers |= shift_mask(direction_targets, back)
+
+        for square in iter_squares(movers):
+            if own_kings >> square & 1:
+                for direction in range(len(DIRECTIONS)):
+                    for target in RAYS[direction][square]:
+                        if occupied >> target & 1:
+                            break
+                        yield [square + 1, target + 1]
+            else:
+                for direction, direction_targets in zip(forward, targets):
+                    target = NEIGHBORS[direction][square]
+                    if target >= 0 and direction_targets >> target & 1:
+                        yield [square + 1, target + 1]
+
+    def get_outcome_of_move(self, move: List[int]) -> BitboardPosition:
+        """Apply a move and return the resulting position.
+
+        Args:
+            move: Sequence of tile IDs representing the move.
+
+        Returns:
+            New position after the move.
+        """
+        start_bit = 1 << (move[0] - 1)
+        end_bit = 1 << (move[-1] - 1)
+
+        captured = 0
+        for tile in move[1:-1]:
+            if tile < 0:
+                captured |= 1 << (-tile - 1)
+
+        orange, blue, kings = self.orange, self.blue, self.kings
+        is_king = kings & start_bit
+        kings &= ~(start_bit | captured)
+
+        if orange & start_bit:
+            orange = (orange & ~start_bit) | end_bit
+            blue &= ~captured
+            promotion_mask = ORANGE_PROMOTION_MASK
+        else:
+            blue = (blue & ~start_bit) | end_bit
+            orange &= ~captured
+            promotion_mask = BLUE_PROMOTION_MASK
+
+        if is_king or end_bit & promotion_mask:
+            kings |= end_bit
+
+        return BitboardPosition(orange, blue, kings)
@@ -7,10 +7,14 @@ It supports move validation, jump sequences, king promotion, and draw detection.
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import List, Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple
+from uuid import uuid4
 
 import numpy as np
 
+from src.checkers_game.bitboard import BitboardPosition, find_longest_jumps
+from src.checkers_game.repetition import RepetitionTracker
+from src.checkers_game.zobrist import hash_game_state, move_hash_delta
 from src.common.enums import Color, GameStatus
 from src.common.exceptions import (
     CheckersGameEndError,
@@ -47,19 +51,77 @@ class CheckersGame:
 
     def __init__(self) -> None:
         """Initialize a new checkers game with standard starting positions."""
-        self.game_state: np.ndarray = self._create_initial_board()
-        self.turn_of: Color = Color.BLUE
-        self.turn_player_opts: List[List[int]] = self.get_color_poss_opts(
-            self.turn_of, self.game_state
-        )
+        self._start_from(self._create_initial_board(), Color.BLUE)
+
+    @classmethod
+    def from_position(cls, game_state: np.ndarray, turn_of: Color) -> CheckersGame:
+        """Create a game that starts from an arbitrary position.
+
+        The move log, the scores and the repetition history start at the
+        given position. If the side to move has no legal move, the game is
+        already won by the other side.
+
+        Args:
+            game_state: 8x8 board indexed as `game_state[x][y]`; copied.
+            turn_of: Side to move.
+
+        Returns:
+            The new game.
+        """
+        game = cls.__new__(cls)
+        game._start_from(np.array(game_state, dtype=int), turn_of)
+        return game
+
+    def _start_from(self, game_state: np.ndarray, turn_of: Color) -> None:
+        """Set up the game state for a game starting at a position.
+
+        Args:
+            game_state: Starting board, owned by the game from now on.
+            turn_of: Side to move.
+        """
+        self.game_id: str = uuid4().hex
+        self.game_state: np.ndarray = game_state
+        self.turn_of: Color = turn_of
+        self._turn_player_opts: Optional[List[List[int]]] = None
         self.log: List[List[int]] = []
         self.draw_criteria_log: List[Tuple[Color, np.ndarray]] = [
             (self.turn_of, self.game_state.copy())
         ]
+        self.position_hash: int = hash_game_state(self.game_state, self.turn_of)
+        self.repetitions: RepetitionTracker = RepetitionTracker()
+        self.repetitions.push(self.position_hash)
         self.orange_score: int = 0
         self.blue_score: int = 0
         self.status: GameStatus = GameStatus.IN_PROGRESS
         self.winning_player: Optional[Color] = None
+        self._move_listener: Optional[
+            Callable[[CheckersGame, List[int], Optional[float]], None]
+        ] = None
+
+        if not self.has_any_move(self.turn_of, self.game_state):
+            self.status = GameStatus.WON
+            self.winning_player = (
+                Color.BLUE if self.turn_of == Color.ORANGE else Color.ORANGE
+            )
+
+    def __getstate__(self) -> dict:
+        """Return the state to copy, without the move listener.
+
+        Copies of the game, such as the ones the engine searches, play moves
+        that must not reach the listener of the game they were copied from.
+        """
+        state = self.__dict__.copy()
+        state["_move_listener"] = None
+        return state
+
+    @property
+    def turn_player_opts(self) -> List[List[int]]:
+        """Possible moves of the player to move, generated on first use."""
+        if self._turn_player_opts is None:
+            self._turn_player_opts = self.get_color_poss_opts(
+                self.turn_of, self.game_state
+            )
+        return self._turn_player_opts
 
     @staticmethod
     def _create_initial_board() -> np.ndarray:
@@ -175,6 +237,10 @@ class CheckersGame:
     ) -> Optional[List[List[int]]]:
         """Recursively find all possible jump sequences for a man piece.
 
+        Reference implementation of the jump rules; the moves of the game
+        come from `find_longest_jumps`, which is checked against this one by
+        `src.checkers_game.tools.jump_generator_check`.
+
         Args:
             tile_id: ID of the man piece.
             game_state: Current board state.
@@ -251,6 +317,8 @@ class CheckersGame:
     ) -> Optional[List[List[int]]]:
         """Recursively find all possible jump sequences for a king piece.
 
+        Reference implementation of the jump rules, like `_get_man_jumps`.
+
         Args:
             tile_id: ID of the king piece.
             game_state: Current board state.
@@ -330,6 +398,56 @@ class CheckersGame:
 
         return jumps
 
+    @classmethod
+    def iter_color_opts(
+        cls, color: Color, game_state: np.ndarray
+    ) -> Iterator[List[int]]:
+        """Generate the possible moves and jumps of a color lazily.
+
+        The jumps of every piece are generated before any simple move, and
+        simple moves only follow if no piece can jump, since jumps take
+        precedence. A caller that stops early skips the remaining pieces.
+        The moves come in the order of `get_color_poss_opts`.
+
+        Args:
+            color: Player color (ORANGE or BLUE).
+            game_state: Current board state.
+
+        Yields:
+            Possible move sequences.
+        """
+        position = BitboardPosition.from_array(game_state)
+        occupied = position.orange | position.blue
+        opponents = position.blue if color == Color.ORANGE else position.orange
+
+        own_tiles = []
+        has_jumps = False
+        for tile_id in range(1, 33):
+            x, y = tile_id_to_grid_coords(tile_id)
+            val = game_state[x][y]
+
+            if (color == Color.ORANGE and val > 0) or (color == Color.BLUE and val < 0):
+                square = tile_id - 1
+                is_king = abs(val) != 1
+                own_tiles.append((tile_id, is_king))
+                jumps = find_longest_jumps(
+                    square, is_king, opponents, occupied & ~(1 << square)
+                )
+                if jumps:
+                    has_jumps = True
+                    yield from jumps
+
+        if has_jumps:
+            return
+
+        for tile_id, is_king in own_tiles:
+            if is_king:
+                moves = cls._get_king_moves(tile_id, game_state)
+            else:
+                moves = cls._get_man_moves(tile_id, game_state)
+            if moves:
+                yield from moves
+
     @classmethod
     def get_color_poss_opts(
         cls, color: Color, game_state: np.ndarray
@@ -337,6 +455,8 @@ class CheckersGame:
         """Get all possible moves and jumps for a given color.
 
         Jumps take precedence over simple moves per standard checkers rules.
+        The jump sequences are found on bitmasks of the board by
+        `find_longest_jumps`.
 
         Args:
             color: Player color (ORANGE or BLUE).
@@ -345,27 +465,23 @@ class CheckersGame:
         Returns:
             List of possible move sequences.
         """
-        all_moves = []
-        all_jumps = []
+        return list(cls.iter_color_opts(color, game_state))
 
-        for tile_id in range(1, 33):
-            x, y = tile_id_to_grid_coords(tile_id)
-            val = game_state[x][y]
+    @staticmethod
+    def has_any_move(color: Color, game_state: np.ndarray) -> bool:
+        """Check whether a color has a legal move, without generating moves.
 
-            if (color == Color.ORANGE and val > 0) or (color == Color.BLUE and val < 0):
-                if abs(val) == 1:
-                    moves = cls._get_man_moves(tile_id, game_state)
-                    jumps = cls._get_man_jumps(tile_id, game_state)
-                else:
-                    moves = cls._get_king_moves(tile_id, game_state)
-                    jumps = cls._get_king_jumps(tile_id, game_state)
+        Answers from the masks of the board and returns at the first piece
+        that can move or jump, which is all the end-of-game check needs.
 
-                if moves:
-                    all_moves.extend(moves)
-                if jumps:
-                    all_jumps.extend(jumps)
+        Args:
+            color: Player color (ORANGE or BLUE).
+            game_state: Current board state.
 
-        return all_jumps if all_jumps else all_moves
+        Returns:
+            True if the color can move or jump.
+        """
+        return BitboardPosition.from_array(game_state).has_any_move(color)
 
     @classmethod
     def get_outcome_of_move(cls, game_state: np.ndarray, move: List[int]) -> np.ndarray:
@@ -403,14 +519,30 @@ class CheckersGame:
 
         return new_state
 
+    def get_game_id(self) -> str:
+        """Return the identifier of the game, shared by copies of the game."""
+        return self.game_id
+
     def get_game_state(self) -> np.ndarray:
         """Return a copy of the current game state."""
         return self.game_state.copy()
 
+    def get_move_log(self) -> List[List[int]]:
+        """Return the moves played so far, in order."""
+        return self.log
+
     def get_draw_criteria_log(self) -> List[Tuple[Color, np.ndarray]]:
         """Return the log of states used for draw detection."""
         return self.draw_criteria_log
 
+    def get_position_hash(self) -> int:
+        """Return the Zobrist hash of the current position and side to move."""
+        return self.position_hash
+
+    def get_repetition_tracker(self) -> RepetitionTracker:
+        """Return the tracker counting positions since the last irreversible move."""
+        return self.repetitions
+
     def get_status(self) -> GameStatus:
         """Return the current game status."""
         return self.status
@@ -439,11 +571,25 @@ class CheckersGame:
         """Return the color of the player whose turn it is."""
         return self.turn_of
 
-    def perform_move(self, move: List[int]) -> None:
+    def set_move_listener(
+        self,
+        listener: Optional[Callable[[CheckersGame, List[int], Optional[float]], None]],
+    ) -> None:
+        """Set a function to call after every move, such as a game record writer.
+
+        Args:
+            listener: Called with the game, the move and the confidence
+                passed to `perform_move` after each move; None to remove it.
+        """
+        self._move_listener = listener
+
+    def perform_move(self, move: List[int], confidence: Optional[float] = None) -> None:
         """Execute a move and update the game state.
 
         Args:
             move: Sequence of tile IDs representing the move.
+            confidence: How sure the board recognition is of the move, between
+                0 and 1; only passed on to the move listener.
 
         Raises:
             CheckersGameEndError: If the game has already ended.
@@ -463,33 +609,38 @@ class CheckersGame:
             self.blue_score += captured_count
 
         # Apply move
+        start_x, start_y = tile_id_to_grid_coords(move[0])
+        is_irreversible = captured_count > 0 or self.game_state[start_x][start_y] in (
+            ORANGE_MAN,
+            BLUE_MAN,
+        )
+        self.position_hash ^= move_hash_delta(self.game_state, move)
         self.game_state = self.get_outcome_of_move(self.game_state, move)
         self.log.append(move)
 
         # Switch turns
         self.turn_of = Color.BLUE if self.turn_of == Color.ORANGE else Color.ORANGE
-        self.turn_player_opts = self.get_color_poss_opts(self.turn_of, self.game_state)
+        self._turn_player_opts = None
 
         # Update draw log
         self.draw_criteria_log.append((self.turn_of, self.game_state.copy()))
+        self.repetitions.push(self.position_hash, is_irreversible)
 
         # Check for draw
         self._check_draw_conditions()
 
         # Check for win
-        if not self.turn_player_opts:
+        if not self.has_any_move(self.turn_of, self.game_state):
             self.status = GameStatus.WON
             self.winning_player = (
                 Color.BLUE if self.turn_of == Color.ORANGE else Color.ORANGE
             )
 
+        if self._move_listener is not None:
+            self._move_listener(self, move, confidence)
+
     def _check_draw_conditions(self) -> None:
         """Check if the game has ended in a draw based on repetition rules."""
-        current_state = self.game_state
-        repetitions = sum(
-            1
-            for color, state in self.draw_criteria_log
-            if color == self.turn_of and np.array_equal(state, current_state)
-        )
+        repetitions = self.repetitions.count(self.position_hash)
         if repetitions >= MAX_DRAW_REPETITIONS:
             self.status = GameStatus.DRAW
@@ -0,0 +1,285 @@
+"""Vectorized static evaluation for the checkers engine.
+
+Every evaluation term is computed with NumPy over whole batches of
+positions. A batch is stored as an (N, 32) array of square values over the
+playable squares, in the same square order as the bitboards, so a stack of
+(N, 8, 8) boards and a batch of bitboard masks are both first gathered into
+that layout. All per-square weights are precomputed once.
+
+A single position is scored with the same tables through bitboard
+operations instead, because the overhead of a NumPy call dwarfs the work
+for one position.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from src.checkers_game.bitboard import (
+    BLUE_FORWARD,
+    BOARD_SIZE,
+    DIRECTIONS,
+    NEIGHBORS,
+    ORANGE_FORWARD,
+    SQUARE_COORDS,
+    SQUARE_COUNT,
+    BitboardPosition,
+    iter_squares,
+    shift_mask,
+)
+from src.common.configs import EvaluationConfig
+
+__all__ = ["PositionEvaluator"]
+
+# Constants
+LAST_ROW = BOARD_SIZE - 1
+CENTER = (BOARD_SIZE - 1) / 2
+CENTER_COLUMNS = (2, 3, 4, 5)
+
+_SQUARE_X = np.array([x for x, _ in SQUARE_COORDS])
+_SQUARE_Y = np.array([y for _, y in SQUARE_COORDS])
+_SQUARE_BITS = np.arange(SQUARE_COUNT, dtype=np.uint64)
+
+
+def _step_matrix(directions: Sequence[int]) -> np.ndarray:
+    """Build the matrix of single diagonal steps in the given directions.
+
+    Args:
+        directions: Indices into `DIRECTIONS`.
+
+    Returns:
+        Matrix of shape (32, 32) where entry [t, s] counts the directions
+        leading from square `s` to its neighbor `t`.
+    """
+    matrix = np.zeros((SQUARE_COUNT, SQUARE_COUNT))
+    for direction in directions:
+        for square, neighbor in enumerate(NEIGHBORS[direction]):
+            if neighbor >= 0:
+                matrix[neighbor, square] += 1
+    return matrix
+
+
+def _runaway_cones(forward_sign: int) -> np.ndarray:
+    """Build the squares from which an opposing piece can stop each man.
+
+    A man moving towards `forward_sign` can be stopped by any piece in the
+    cone that widens by one column per row ahead of it.
+
+    Args:
+        forward_sign: 1 for orange men, -1 for blue men.
+
+    Returns:
+        Boolean matrix of shape (32, 32); row `s` marks the cone of square `s`.
+    """
+    rows_ahead = forward_sign * (_SQUARE_Y[None, :] - _SQUARE_Y[:, None])
+    columns_apart = np.abs(_SQUARE_X[None, :] - _SQUARE_X[:, None])
+    return (rows_ahead > 0) & (columns_apart <= rows_ahead)
+
+
+class PositionEvaluator:
+    """Scores positions from orange's point of view.
+
+    The score is the sum of:
+        - material, with separate values for men and kings;
+        - piece-square tables rewarding advanced men on central columns;
+        - a back-rank guard bonus for men still on their own back rank;
+        - mobility, the number of simple moves of each side's pieces;
+        - runaway men, which no opposing piece can stop from promoting;
+        - king centralization.
+    Each term is computed for orange minus blue.
+    """
+
+    def __init__(self, config: Optional[EvaluationConfig] = None) -> None:
+        """Precompute the weight tables.
+
+        Args:
+            config: Weights of the evaluation terms. Defaults to
+                `EvaluationConfig()`.
+        """
+        self.config = config if config is not None else EvaluationConfig()
+        config = self.config
+
+        center_bonus = np.where(
+            np.isin(_SQUARE_X, CENTER_COLUMNS), config.center_column, 0.0
+        )
+        self._orange_man_table = (
+            config.man_value + config.advancement * _SQUARE_Y + center_bonus
+        )
+        self._blue_man_table = (
+            config.man_value
+            + config.advancement * (LAST_ROW - _SQUARE_Y)
+            + center_bonus
+        )
+        self._orange_man_table[_SQUARE_Y == 0] += config.back_rank_guard
+        self._blue_man_table[_SQUARE_Y == LAST_ROW] += config.back_rank_guard
+
+        distance_from_center = np.maximum(
+            np.abs(_SQUARE_X - CENTER), np.abs(_SQUARE_Y - CENTER)
+        )
+        self._king_table = config.king_value + config.king_centralization * (
+            1.0 - (distance_from_center - 0.5) / CENTER
+        )
+
+        self._orange_runaway_bonus = config.runaway * (_SQUARE_Y + 1) / BOARD_SIZE
+        self._blue_runaway_bonus = (
+            config.runaway * (BOARD_SIZE - _SQUARE_Y) / BOARD_SIZE
+        )
+
+        # Batched tables over the one-hot layout of (N, 128) piece indicators:
+        # orange men, blue men, orange kings and blue kings per square
+        self._piece_weights = np.concatenate(
+            [
+                self._orange_man_table,
+                -self._blue_man_table,
+                self._king_table,
+                -self._king_table,
+            ]
+        )
+        king_steps = _step_matrix(range(len(DIRECTIONS)))
+        self._mobility_matrix = config.mobility * np.concatenate(
+            [
+                _step_matrix(ORANGE_FORWARD),
+                -_step_matrix(BLUE_FORWARD),
+                king_steps,
+                -king_steps,
+            ],
+            axis=1,
+        )
+        cone_matrix = np.zeros((2 * SQUARE_COUNT, 2 * SQUARE_COUNT))
+        cone_matrix[:SQUARE_COUNT, :SQUARE_COUNT] = _runaway_cones(1).T
+        cone_matrix[SQUARE_COUNT:, SQUARE_COUNT:] = _runaway_cones(-1).T
+        self._cone_matrix = cone_matrix
+        self._runaway_weights = np.concatenate(
+            [self._orange_runaway_bonus, -self._blue_runaway_bonus]
+        )
+
+        # Scalar copies of the tables for single positions
+        self._orange_man_values = self._orange_man_table.tolist()
+        self._blue_man_values = self._blue_man_table.tolist()
+        self._king_values = self._king_table.tolist()
+        self._orange_runaway_values = self._orange_runaway_bonus.tolist()
+        self._blue_runaway_values = self._blue_runaway_bonus.tolist()
+        self._orange_cone_masks = [
+            sum(1 << square for square in np.flatnonzero(cone).tolist())
+            for cone in _runaway_cones(1)
+        ]
+        self._blue_cone_masks = [
+            sum(1 << square for square in np.flatnonzero(cone).tolist())
+            for cone in _runaway_cones(-1)
+        ]
+
+    def evaluate_position(self, position: BitboardPosition) -> float:
+        """Score a single bitboard position.
+
+        Args:
+            position: Position to score.
+
+        Returns:
+            Score from orange's point of view; equal to what `evaluate_masks`
+            returns for the same position.
+        """
+        orange = position.orange
+        blue = position.blue
+        kings = position.kings
+        orange_men = orange & ~kings
+        blue_men = blue & ~kings
+        empty = ~(orange | blue)
+
+        score = 0.0
+        for square in iter_squares(orange_men):
+            score += self._orange_man_values[square]
+            if not blue & self._orange_cone_masks[square]:
+                score += self._orange_runaway_values[square]
+        for square in iter_squares(blue_men):
+            score -= self._blue_man_values[square]
+            if not orange & self._blue_cone_masks[square]:
+                score -= self._blue_runaway_values[square]
+        for square in iter_squares(orange & kings):
+            score += self._king_values[square]
+        for square in iter_squares(blue & kings):
+            score -= self._king_values[square]
+
+        mobility = 0
+        for direction in ORANGE_FORWARD:
+            mobility += (shift_mask(orange_men, direction) & empty).bit_count()
+        for direction in BLUE_FORWARD:
+            mobility -= (shift_mask(blue_men, direction) & empty).bit_count()
+        for direction in range(len(DIRECTIONS)):
+            mobility += (shift_mask(orange & kings, direction) & empty).bit_count()
+            mobility -= (shift_mask(blue & kings, direction) & empty).bit_count()
+
+        return score + self.config.mobility * mobility
+
+    def evaluate_boards(self, boards: np.ndarray) -> np.ndarray:
+        """Score a stack of 8x8 boards in one call.
+
+        Args:
+            boards: Array of shape (N, 8, 8), or a single (8, 8) board, indexed
+                as `board[x][y]` like the `CheckersGame` board.
+
+        Returns:
+            Array of N scores from orange's point of view.
+        """
+        boards = np.asarray(boards)
+        if boards.ndim == 2:
+            boards = boards[None]
+        return self.evaluate_squares(boards[:, _SQUARE_X, _SQUARE_Y])
+
+    def evaluate_masks(
+        self, orange: np.ndarray, blue: np.ndarray, kings: np.ndarray
+    ) -> np.ndarray:
+        """Score a batch of bitboard positions in one call.
+
+        Args:
+            orange: Orange masks, one per position.
+            blue: Blue masks, one per position.
+            kings: King masks, one per position.
+
+        Returns:
+            Array of N scores from orange's point of view.
+        """
+        orange_bits = (orange[:, None] >> _SQUARE_BITS) & 1
+        blue_bits = (blue[:, None] >> _SQUARE_BITS) & 1
+        king_bits = (kings[:, None] >> _SQUARE_BITS) & 1
+        values = (orange_bits.astype(np.int8) - blue_bits.astype(np.int8)) * (
+            1 + king_bits.astype(np.int8)
+        )
+        return self.evaluate_squares(values)
+
+    def evaluate_squares(self, values: np.ndarray) -> np.ndarray:
+        """Score a batch of positions given as values of the playable squares.
+
+        Args:
+            values: Array of shape (N, 32) with the `CheckersGame` piece
+                values (1, 2 for orange, -1, -2 for blue, 0 for empty).
+
+        Returns:
+            Array of N scores from orange's point of view.
+        """
+        values = np.asarray(values)
+        pieces = np.concatenate(
+            [values == 1, values == -1, values == 2, values == -2], axis=1
+        ).astype(np.float64)
+        empty = (values == 0).astype(np.float64)
+
+        # Material and piece-square tables
+        score = pieces @ self._piece_weights
+
+        # Mobility: empty neighbors in the directions each piece can move
+        score += np.einsum("ij,ij->i", pieces, empty @ self._mobility_matrix)
+
+        # Runaway men: no opposing piece inside the cone ahead
+        blue_pieces = (
+            pieces[:, SQUARE_COUNT : 2 * SQUARE_COUNT] + pieces[:, 3 * SQUARE_COUNT :]
+        )
+        orange_pieces = (
+            pieces[:, :SQUARE_COUNT] + pieces[:, 2 * SQUARE_COUNT : 3 * SQUARE_COUNT]
+        )
+        unstoppable = (
+            np.concatenate([blue_pieces, orange_pieces], axis=1) @ self._cone_matrix
+        ) == 0
+        score += (pieces[:, : 2 * SQUARE_COUNT] * unstoppable) @ self._runaway_weights
+
+        return score
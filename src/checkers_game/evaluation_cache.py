@@ -0,0 +1,101 @@
+"""Cache of static evaluations for the checkers search.
+
+The same leaf positions are reached again in every iteration of the
+iterative deepening, in sibling subtrees and on the following turns of the
+game. The cache remembers their static evaluations by Zobrist hash, so each
+position is only evaluated once while it stays in the cache.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+__all__ = ["EvaluationCache"]
+
+# Constants
+DEFAULT_EVALUATION_CACHE_ENTRIES = 1 << 18
+
+
+class EvaluationCache:
+    """Bounded cache of static evaluations with clock eviction.
+
+    Scores are stored from orange's point of view, as the evaluator returns
+    them, and the hash covers the side to move, so one entry serves engines
+    of both colors and every search perspective; the caller applies its own
+    sign. Entries live in fixed slots. Once the cache is full, a clock hand
+    sweeps over the slots, giving every entry that was read since the last
+    sweep a second chance, and evicts the first entry that was not.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_EVALUATION_CACHE_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of stored evaluations.
+        """
+        self.capacity = max(1, capacity)
+
+        self._slots: Dict[int, int] = {}
+        self._keys: List[int] = []
+        self._scores: List[float] = []
+        self._referenced: List[bool] = []
+        self._hand = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored evaluations."""
+        return len(self._keys)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._slots.clear()
+        self._keys.clear()
+        self._scores.clear()
+        self._referenced.clear()
+        self._hand = 0
+
+    def get(self, key: int) -> Optional[float]:
+        """Look up the evaluation of a position.
+
+        Args:
+            key: Zobrist hash of the position.
+
+        Returns:
+            Score from orange's point of view, or None if not stored.
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+
+        self._referenced[slot] = True
+        return self._scores[slot]
+
+    def put(self, key: int, score: float) -> None:
+        """Store the evaluation of a position, evicting one if the cache is full.
+
+        Args:
+            key: Zobrist hash of the position.
+            score: Score from orange's point of view.
+        """
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._scores[slot] = score
+            return
+
+        if len(self._keys) < self.capacity:
+            self._slots[key] = len(self._keys)
+            self._keys.append(key)
+            self._scores.append(score)
+            self._referenced.append(False)
+            return
+
+        # Skip recently read entries, clearing their bit for the next sweep
+        while self._referenced[self._hand]:
+            self._referenced[self._hand] = False
+            self._hand = (self._hand + 1) % self.capacity
+
+        slot = self._hand
+        del self._slots[self._keys[slot]]
+        self._slots[key] = slot
+        self._keys[slot] = key
+        self._scores[slot] = score
+        self._hand = (self._hand + 1) % self.capacity
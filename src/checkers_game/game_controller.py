@@ -6,12 +6,22 @@ move validation based on computer vision input.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from copy import deepcopy
+from pathlib import Path
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 
 from src.checkers_game.checkers_game import CheckersGame
-from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.game_record import GameRecordWriter
+from src.checkers_game.negamax import MAX_SEARCH_DEPTH, NegamaxDecisionEngine
+from src.checkers_game.opening_book import load_opening_book
+from src.checkers_game.ponder import Ponderer
+from src.checkers_game.search_stats import SearchStats
+from src.checkers_game.search_telemetry import SearchTelemetryLog
+from src.checkers_game.tablebase import load_tablebase
+from src.checkers_game.zobrist import hash_game_state
 from src.common.enums import (
     Color,
     GameReportField,
@@ -25,25 +35,90 @@ class GameController:
     """Orchestrates the checkers game, handling AI moves and state updates.
 
     This class manages the interaction between the game logic, the AI engine,
-    and the external state updates provided by computer vision.
+    and the external state updates provided by computer vision. The robot's
+    moves are planned in a background thread, so updates return immediately
+    while the engine searches.
     """
 
-    def __init__(self, robot_color: Color, engine_depth: int = 3) -> None:
+    def __init__(
+        self,
+        robot_color: Color,
+        engine_depth: int = 3,
+        time_budget_s: Optional[float] = None,
+        ponder: bool = False,
+        use_opening_book: bool = True,
+        use_tablebase: bool = True,
+        telemetry_path: Optional[Union[str, Path]] = None,
+        record_path: Optional[Union[str, Path]] = None,
+    ) -> None:
         """Initialize the game controller.
 
         Args:
             robot_color: The color assigned to the robot player.
             engine_depth: Search depth for the AI decision engine.
+            time_budget_s: Thinking time per robot move in seconds. If set, the
+                engine deepens until the budget runs out and `engine_depth`
+                is ignored.
+            ponder: Search the robot's answers to the opponent's likely
+                replies while the opponent is thinking.
+            use_opening_book: Play the moves of the default opening book,
+                if it is available, without searching.
+            use_tablebase: Score endgame positions with the default endgame
+                tablebase, if it is available.
+            telemetry_path: JSON-lines file that the statistics of every
+                robot decision are appended to, or None to not log them.
+            record_path: Game record file that the game is appended to as it
+                is played, or None to not archive it.
         """
         self.game = CheckersGame()
         self.computer_color = robot_color
+        self._opening_book = load_opening_book() if use_opening_book else None
+        self._tablebase = load_tablebase() if use_tablebase else None
         self.decision_engine = NegamaxDecisionEngine(
-            computer_color=self.computer_color, search_depth=engine_depth
+            computer_color=self.computer_color,
+            search_depth=engine_depth if time_budget_s is None else MAX_SEARCH_DEPTH,
+            time_budget_s=time_budget_s,
+            opening_book=self._opening_book,
+            tablebase=self._tablebase,
+        )
+        self._ponderer = Ponderer(self.decision_engine) if ponder else None
+        self._telemetry = (
+            SearchTelemetryLog(telemetry_path) if telemetry_path is not None else None
         )
+        self._last_search_stats: Optional[SearchStats] = None
+        self._game_record = (
+            GameRecordWriter(record_path) if record_path is not None else None
+        )
+        if self._game_record is not None:
+            self._game_record.start_game(self.game)
+            self.game.set_move_listener(self._game_record.record_move)
 
         # State tracking
         self._planned_move: Optional[List[int]] = None
         self._is_crowning_move: Optional[bool] = None
+        self._game_before_opponent_move: Optional[CheckersGame] = None
+
+        # Background planning
+        self._planning_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="planning"
+        )
+        self._planning: Optional[Future] = None
+
+    def close(self) -> None:
+        """Stop background searches and release the engine, book and tablebase."""
+        self.cancel_planning()
+        self._planning_executor.shutdown()
+        if self._ponderer is not None:
+            self._ponderer.stop()
+        self.decision_engine.close()
+        if self._opening_book is not None:
+            self._opening_book.close()
+        if self._tablebase is not None:
+            self._tablebase.close()
+        if self._telemetry is not None:
+            self._telemetry.close()
+        if self._game_record is not None:
+            self._game_record.close()
 
     def generate_report(self) -> Dict[GameReportField, object]:
         """Generate a comprehensive report of the current game state.
@@ -51,6 +126,7 @@ class GameController:
         Returns:
             Dictionary mapping report fields to their current values.
         """
+        self._collect_planned_move()
         return {
             GameReportField.GAME_STATE: self.game.get_game_state(),
             GameReportField.POINTS: self.game.get_points(),
@@ -61,10 +137,33 @@ class GameController:
             GameReportField.ROBOT_COLOR: self.computer_color,
             GameReportField.ROBOT_MOVE: self._planned_move,
             GameReportField.IS_CROWNED: self._is_crowning_move,
+            GameReportField.IS_PLANNING: self.is_planning(),
+            GameReportField.SEARCH_STATS: self._last_search_stats,
         }
 
+    def is_planning(self) -> bool:
+        """Return True while the robot's move is being searched for."""
+        return self._planning is not None
+
+    def cancel_planning(self) -> None:
+        """Abandon the search for the robot's move, if one is running.
+
+        Returns once the search has stopped. The next update of the game
+        state on the robot's turn starts a new search.
+        """
+        if self._planning is None:
+            return
+
+        if not self._planning.cancel():
+            self.decision_engine.request_stop()
+            wait([self._planning])
+        self._planning = None
+
     def update_game_state(
-        self, observed_board: np.ndarray, allow_different_robot_moves: bool = False
+        self,
+        observed_board: np.ndarray,
+        allow_different_robot_moves: bool = False,
+        confidence: Optional[float] = None,
     ) -> MoveValidationResult:
         """Update the game state based on the observed board from computer vision.
 
@@ -75,10 +174,14 @@ class GameController:
             observed_board: The 8x8 board state detected by CV.
             allow_different_robot_moves: If True, accept any valid robot move
                 even if it differs from the planned move.
+            confidence: How sure the board recognition is of the observed
+                board, between 0 and 1; stored in the game record with the
+                move it shows.
 
         Returns:
             MoveValidationResult indicating the outcome of the update.
         """
+        self._collect_planned_move()
         is_robot_turn = self.game.get_turn_of() == self.computer_color
 
         # Normalize states for comparison (CV cannot distinguish kings from men)
@@ -94,6 +197,11 @@ class GameController:
                 return MoveValidationResult.NO_ROBOT_MOVE
             return MoveValidationResult.NO_OPPONENT_MOVE
 
+        if is_robot_turn and self._is_opponent_move_taken_back(
+            observed_board, observed_rotated
+        ):
+            return self._take_back_opponent_move()
+
         # Validate the move performed
         move_performed = self._find_matching_move(observed_board, observed_rotated)
 
@@ -106,9 +214,11 @@ class GameController:
 
         # Execute the move
         if is_robot_turn:
-            return self._handle_robot_move(move_performed, allow_different_robot_moves)
+            return self._handle_robot_move(
+                move_performed, allow_different_robot_moves, confidence
+            )
         else:
-            return self._handle_opponent_move(move_performed)
+            return self._handle_opponent_move(move_performed, confidence)
 
     def _normalize_state_for_comparison(self, state: np.ndarray) -> np.ndarray:
         """Convert king pieces to men for comparison with CV output.
@@ -152,6 +262,10 @@ class GameController:
     ) -> Optional[List[int]]:
         """Find the move that results in the observed board state.
 
+        Outcomes are indexed by their Zobrist hash (without side to move), so
+        the observed board is looked up instead of compared with every
+        outcome. A hash hit is confirmed with a full comparison.
+
         Args:
             observed: Raw observed board.
             observed_rotated: Observed board rotated 180 degrees.
@@ -159,20 +273,142 @@ class GameController:
         Returns:
             The move sequence if found, otherwise None.
         """
-        possible_outcomes = self.game.get_possible_outcomes()
+        outcomes_by_hash: Dict[int, List[int]] = {}
+        normalized_outcomes = []
 
-        for move, outcome_state in possible_outcomes:
+        for index, (move, outcome_state) in enumerate(
+            self.game.get_possible_outcomes()
+        ):
             normalized_outcome = self._normalize_state_for_comparison(outcome_state)
+            normalized_outcomes.append((move, normalized_outcome))
+            outcomes_by_hash.setdefault(
+                hash_game_state(normalized_outcome, None), []
+            ).append(index)
+
+        candidates = set(outcomes_by_hash.get(hash_game_state(observed, None), []))
+        candidates.update(
+            outcomes_by_hash.get(hash_game_state(observed_rotated, None), [])
+        )
+
+        for index in sorted(candidates):
+            move, normalized_outcome = normalized_outcomes[index]
             if self._states_match(observed, normalized_outcome, observed_rotated):
                 return move
 
         return None
 
     def _ensure_move_is_planned(self) -> None:
-        """Plan a move if one hasn't been planned yet."""
-        if self._planned_move is None or self._is_crowning_move is None:
-            self._planned_move = self.decision_engine.decide_move(self.game)
-            self._is_crowning_move = self._check_if_crowning_move(self._planned_move)
+        """Start planning a move if one hasn't been planned yet."""
+        if (
+            self._planned_move is None or self._is_crowning_move is None
+        ) and self._planning is None:
+            self._start_planning()
+
+    def _start_planning(self) -> None:
+        """Start searching for the robot's move in the background."""
+        self.decision_engine.stop_event.clear()
+        self._planning = self._planning_executor.submit(
+            self._decide_robot_move, deepcopy(self.game)
+        )
+
+    def _collect_planned_move(self) -> None:
+        """Take over the result of the background search once it finishes.
+
+        Raises:
+            DecisionEngineError: If the search failed.
+        """
+        if self._planning is None or not self._planning.done():
+            return
+
+        planning, self._planning = self._planning, None
+        stats = planning.result()
+        self._last_search_stats = stats
+        self._planned_move = stats.best_move
+        self._is_crowning_move = self._check_if_crowning_move(self._planned_move)
+
+    def _decide_robot_move(self, game: CheckersGame) -> SearchStats:
+        """Decide the robot's move, using the pondering result if there is one.
+
+        Runs in the planning thread. The decision is added to the telemetry
+        log, if there is one.
+
+        Args:
+            game: Copy of the game with the robot to move.
+
+        Returns:
+            Statistics of the decision, with the move sequence the robot
+            should play as `best_move`, or None there if the search was
+            cancelled.
+        """
+        stats = None
+        if self._ponderer is not None:
+            stats = self._ponderer.take_result(game)
+        if stats is None:
+            stats = self.decision_engine.decide(game)
+
+        if self._telemetry is not None:
+            self._telemetry.record(
+                stats,
+                game_id=game.get_game_id(),
+                move_number=len(game.get_move_log()) + 1,
+                robot_color=self.computer_color.name.lower(),
+            )
+        return stats
+
+    def _is_opponent_move_taken_back(
+        self, observed: np.ndarray, observed_rotated: np.ndarray
+    ) -> bool:
+        """Check if the board shows the position before the opponent's move.
+
+        Args:
+            observed: Raw observed board.
+            observed_rotated: Observed board rotated 180 degrees.
+
+        Returns:
+            True if the opponent's last move has been undone on the board.
+        """
+        if self._game_before_opponent_move is None:
+            return False
+
+        previous_state = self._normalize_state_for_comparison(
+            self._game_before_opponent_move.get_game_state()
+        )
+        return self._states_match(observed, previous_state, observed_rotated)
+
+    def _take_back_opponent_move(self) -> MoveValidationResult:
+        """Restore the game to the position before the opponent's last move.
+
+        Returns:
+            MoveValidationResult indicating the take-back.
+        """
+        self.cancel_planning()
+        self.game = self._game_before_opponent_move
+        self._game_before_opponent_move = None
+        if self._game_record is not None:
+            self._game_record.record_take_back()
+            self.game.set_move_listener(self._game_record.record_move)
+        self._planned_move = None
+        self._is_crowning_move = None
+        self._start_pondering()
+        return MoveValidationResult.OPPONENT_MOVE_TAKEN_BACK
+
+    def _start_pondering(self) -> None:
+        """Start pondering on the opponent's time if the game goes on."""
+        if (
+            self._ponderer is not None
+            and self.game.get_status() == GameStatus.IN_PROGRESS
+        ):
+            self._ponderer.start(self.game)
+
+    def _perform_move(self, move: List[int], confidence: Optional[float]) -> None:
+        """Play a move in the game and let the engine age its tables.
+
+        Args:
+            move: The move sequence to play.
+            confidence: Board recognition confidence of the move, or None.
+        """
+        self.game.perform_move(move, confidence)
+        self.decision_engine.notify_move(self.game.get_game_id(), move)
 
     def _check_if_crowning_move(self, move: List[int]) -> bool:
         """Determine if a move results in a king promotion.
@@ -204,46 +440,54 @@ class GameController:
         return is_blue_crowning or is_orange_crowning
 
     def _handle_robot_move(
-        self, move: List[int], allow_different: bool
+        self, move: List[int], allow_different: bool, confidence: Optional[float]
     ) -> MoveValidationResult:
         """Process a move made by the robot.
 
         Args:
             move: The move sequence performed.
             allow_different: Whether to accept moves different from the plan.
+            confidence: Board recognition confidence of the move, or None.
 
         Returns:
             MoveValidationResult indicating success or deviation.
         """
         if move == self._planned_move:
-            self.game.perform_move(move)
+            self._perform_move(move, confidence)
             self._planned_move = None
             self._is_crowning_move = None
+            self._game_before_opponent_move = None
+            self._start_pondering()
             return MoveValidationResult.VALID_RIGHT_ROBOT_MOVE
 
         if allow_different:
-            self.game.perform_move(move)
+            self.cancel_planning()
+            self._perform_move(move, confidence)
             self._planned_move = None
             self._is_crowning_move = None
+            self._game_before_opponent_move = None
+            self._start_pondering()
 
         return MoveValidationResult.VALID_WRONG_ROBOT_MOVE
 
-    def _handle_opponent_move(self, move: List[int]) -> MoveValidationResult:
-        """Process a move made by the opponent and plan the robot's response.
+    def _handle_opponent_move(
+        self, move: List[int], confidence: Optional[float]
+    ) -> MoveValidationResult:
+        """Process a move made by the opponent and start planning the response.
 
         Args:
             move: The opponent's move sequence.
+            confidence: Board recognition confidence of the move, or None.
 
         Returns:
             MoveValidationResult indicating a valid opponent move.
         """
-        self.game.perform_move(move)
+        self._game_before_opponent_move = deepcopy(self.game)
+        self._perform_move(move, confidence)
+        self._planned_move = None
+        self._is_crowning_move = None
 
         if self.game.get_status() == GameStatus.IN_PROGRESS:
-            self._planned_move = self.decision_engine.decide_move(self.game)
-            self._is_crowning_move = self._check_if_crowning_move(self._planned_move)
-        else:
-            self._planned_move = None
-            self._is_crowning_move = None
+            self._start_planning()
 
         return MoveValidationResult.VALID_OPPONENT_MOVE
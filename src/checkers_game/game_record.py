@@ -0,0 +1,375 @@
+"""Compact, append-only archive of played games.
+
+`CheckersGame` only keeps its moves in memory. The game record writer
+streams every game to a binary file as it is played, one small record per
+event, and the reader turns the file back into games one at a time, so
+thousands of archived games can be replayed for analysis without loading
+the whole archive.
+
+The file holds any number of games one after another:
+
+    header:     magic b"CKGR", version (u16)
+    game start: tag (u8), game ID (16 bytes), start time (f64, Unix seconds),
+                orange, blue and king masks (u32 each), side to move (i8)
+    move:       tag (u8), tile count (u8), tiles (i8 each),
+                [milliseconds since the start (u32)], [confidence (u8)]
+    take-back:  tag (u8)
+    game end:   tag (u8), status (u8), winner (i8, 0 for none)
+
+All numbers are little-endian. Moves are stored as their tile sequences,
+with captured tiles negative; a simple move takes four bytes. The flags in
+the tag of a move tell whether the optional timestamp and board recognition
+confidence follow; the confidence is stored in steps of 1/255. A take-back
+undoes the last move of the game. The file is opened for every record and
+closed right after it, so the archive is complete up to the last move even
+if the application is killed.
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Self, Union
+
+import numpy as np
+
+from src.checkers_game.bitboard import BitboardPosition
+from src.checkers_game.checkers_game import CheckersGame
+from src.common.enums import Color, GameStatus
+from src.common.exceptions import GameRecordError
+
+__all__ = [
+    "GameRecord",
+    "GameRecordWriter",
+    "PlyRecord",
+    "iter_game_records",
+]
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_GAME_RECORD_PATH = Path("logs") / "games.ckgr"
+RECORD_MAGIC = b"CKGR"
+RECORD_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sH")
+GAME_START_FORMAT = struct.Struct("<16sdIIIb")
+GAME_END_FORMAT = struct.Struct("<Bb")
+TAG_FORMAT = struct.Struct("<B")
+TIMESTAMP_FORMAT = struct.Struct("<I")
+CONFIDENCE_FORMAT = struct.Struct("<B")
+
+TAG_GAME_START = 0x01
+TAG_MOVE = 0x02
+TAG_TAKE_BACK = 0x03
+TAG_GAME_END = 0x04
+TAG_TYPE_MASK = 0x0F
+MOVE_HAS_TIMESTAMP = 0x40
+MOVE_HAS_CONFIDENCE = 0x80
+CONFIDENCE_STEPS = 255
+
+
+@dataclass
+class PlyRecord:
+    """One move of an archived game.
+
+    Attributes:
+        move: Tile sequence of the move.
+        timestamp_s: When the move was played, in Unix seconds, or None if
+            timestamps were not recorded.
+        confidence: Board recognition confidence of the move between 0 and
+            1, or None if none was given.
+    """
+
+    move: List[int]
+    timestamp_s: Optional[float] = None
+    confidence: Optional[float] = None
+
+
+@dataclass
+class GameRecord:
+    """An archived game.
+
+    Attributes:
+        game_id: Identifier of the game.
+        started_at: When the game record was started, in Unix seconds.
+        start_state: Starting board indexed as `game_state[x][y]`.
+        turn_of: Side to move at the start.
+        plies: Moves of the game without the taken-back ones, in order.
+        take_backs: Number of moves that were taken back.
+        status: Final status; IN_PROGRESS for a game that was abandoned.
+        winner: Winning color, or None.
+    """
+
+    game_id: str
+    started_at: float
+    start_state: np.ndarray
+    turn_of: Color
+    plies: List[PlyRecord] = field(default_factory=list)
+    take_backs: int = 0
+    status: GameStatus = GameStatus.IN_PROGRESS
+    winner: Optional[Color] = None
+
+    def replay(self) -> Iterator[CheckersGame]:
+        """Play the game again from its starting position.
+
+        The same game object is yielded at the start and after every move,
+        so it must be copied to be kept.
+
+        Yields:
+            The game at each position of the record.
+
+        Raises:
+            CheckersGameNotPermittedMoveError: If a recorded move is illegal.
+        """
+        game = CheckersGame.from_position(self.start_state, self.turn_of)
+        yield game
+        for ply in self.plies:
+            game.perform_move(ply.move)
+            yield game
+
+
+class GameRecordWriter:
+    """Streams games to an append-only game record file.
+
+    `record_move` has the signature of a `CheckersGame` move listener, so
+    the writer follows a game once it is attached with
+    `CheckersGame.set_move_listener`. Can be used as a context manager,
+    which stops the writer on exit.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_GAME_RECORD_PATH,
+        record_timestamps: bool = True,
+    ) -> None:
+        """Create the file if needed and check that it is a game record.
+
+        Args:
+            path: Path of the game record file.
+            record_timestamps: Store when every move was played.
+
+        Raises:
+            GameRecordError: If the file exists but is not a game record.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.record_timestamps = record_timestamps
+        self._closed = False
+        self._started_at = time.time()
+
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            self._write(HEADER_FORMAT.pack(RECORD_MAGIC, RECORD_VERSION))
+        else:
+            with open(self.path, "rb") as record_file:
+                header = record_file.read(HEADER_FORMAT.size)
+            if header != HEADER_FORMAT.pack(RECORD_MAGIC, RECORD_VERSION):
+                self.close()
+                raise GameRecordError(f"{self.path} is not a version 1 game record.")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop writing; later records are dropped."""
+        self._closed = True
+
+    def start_game(self, game: CheckersGame) -> None:
+        """Start the record of a game at its current position.
+
+        Args:
+            game: The game to record.
+        """
+        self._started_at = time.time()
+        position = BitboardPosition.from_array(game.get_game_state())
+        self._write(
+            TAG_FORMAT.pack(TAG_GAME_START)
+            + GAME_START_FORMAT.pack(
+                bytes.fromhex(game.get_game_id()),
+                self._started_at,
+                position.orange,
+                position.blue,
+                position.kings,
+                int(game.get_turn_of()),
+            )
+        )
+
+    def record_move(
+        self,
+        game: CheckersGame,
+        move: List[int],
+        confidence: Optional[float] = None,
+    ) -> None:
+        """Append a move, and the result if the move ended the game.
+
+        Args:
+            game: The game after the move.
+            move: Tile sequence of the move.
+            confidence: Board recognition confidence of the move between 0
+                and 1, or None.
+        """
+        tag = TAG_MOVE
+        extra = b""
+        if self.record_timestamps:
+            tag |= MOVE_HAS_TIMESTAMP
+            elapsed_ms = round((time.time() - self._started_at) * 1000)
+            extra += TIMESTAMP_FORMAT.pack(max(elapsed_ms, 0))
+        if confidence is not None:
+            tag |= MOVE_HAS_CONFIDENCE
+            steps = round(min(max(confidence, 0.0), 1.0) * CONFIDENCE_STEPS)
+            extra += CONFIDENCE_FORMAT.pack(steps)
+
+        record = (
+            TAG_FORMAT.pack(tag)
+            + struct.pack(f"<B{len(move)}b", len(move), *move)
+            + extra
+        )
+        if game.get_status() != GameStatus.IN_PROGRESS:
+            winner = game.get_winning_player()
+            record += TAG_FORMAT.pack(TAG_GAME_END) + GAME_END_FORMAT.pack(
+                game.get_status().value, int(winner) if winner is not None else 0
+            )
+        self._write(record)
+
+    def record_take_back(self) -> None:
+        """Append the take-back of the last move of the game."""
+        self._write(TAG_FORMAT.pack(TAG_TAKE_BACK))
+
+    def _write(self, data: bytes) -> None:
+        """Append bytes to the file, unless the writer is closed."""
+        if self._closed:
+            return
+        with open(self.path, "ab") as record_file:
+            record_file.write(data)
+
+
+def _read_exactly(record_file: BinaryIO, size: int) -> Optional[bytes]:
+    """Read a number of bytes, or return None at a truncated end of file."""
+    data = record_file.read(size)
+    if len(data) < size:
+        return None
+    return data
+
+
+def _read_ply(
+    record_file: BinaryIO, tag: int, started_at: float
+) -> Optional[PlyRecord]:
+    """Read the rest of a move record whose tag has been read.
+
+    Args:
+        record_file: File positioned after the tag.
+        tag: Tag of the record, with its flags.
+        started_at: Start time of the game, in Unix seconds.
+
+    Returns:
+        The move, or None if the file ends inside the record.
+    """
+    count_data = _read_exactly(record_file, 1)
+    if count_data is None:
+        return None
+    tiles_data = _read_exactly(record_file, count_data[0])
+    if tiles_data is None:
+        return None
+    ply = PlyRecord(list(struct.unpack(f"<{count_data[0]}b", tiles_data)))
+
+    if tag & MOVE_HAS_TIMESTAMP:
+        data = _read_exactly(record_file, TIMESTAMP_FORMAT.size)
+        if data is None:
+            return None
+        ply.timestamp_s = started_at + TIMESTAMP_FORMAT.unpack(data)[0] / 1000
+    if tag & MOVE_HAS_CONFIDENCE:
+        data = _read_exactly(record_file, CONFIDENCE_FORMAT.size)
+        if data is None:
+            return None
+        ply.confidence = CONFIDENCE_FORMAT.unpack(data)[0] / CONFIDENCE_STEPS
+    return ply
+
+
+def iter_game_records(
+    path: Union[str, Path] = DEFAULT_GAME_RECORD_PATH,
+) -> Iterator[GameRecord]:
+    """Read the games of a game record file one at a time.
+
+    Only the game being read is held in memory. A record cut off at the end
+    of the file, left by an application that was killed while writing it,
+    ends the last game.
+
+    Args:
+        path: Path of the game record file.
+
+    Yields:
+        The archived games, in the order they were started.
+
+    Raises:
+        GameRecordError: If the file is not a valid game record.
+    """
+    path = Path(path)
+    with open(path, "rb") as record_file:
+        header = record_file.read(HEADER_FORMAT.size)
+        if header != HEADER_FORMAT.pack(RECORD_MAGIC, RECORD_VERSION):
+            raise GameRecordError(f"{path} is not a version 1 game record.")
+
+        record: Optional[GameRecord] = None
+        while True:
+            offset = record_file.tell()
+            tag_data = record_file.read(TAG_FORMAT.size)
+            if not tag_data:
+                break
+            tag = tag_data[0]
+            record_type = tag & TAG_TYPE_MASK
+
+            if record_type == TAG_GAME_START:
+                data = _read_exactly(record_file, GAME_START_FORMAT.size)
+                if data is None:
+                    logger.warning("%s ends inside a record at %d", path, offset)
+                    break
+                if record is not None:
+                    yield record
+                game_id, started_at, orange, blue, kings, turn_of = (
+                    GAME_START_FORMAT.unpack(data)
+                )
+                record = GameRecord(
+                    game_id=game_id.hex(),
+                    started_at=started_at,
+                    start_state=BitboardPosition(orange, blue, kings).to_array(),
+                    turn_of=Color(turn_of),
+                )
+                continue
+
+            if record is None:
+                raise GameRecordError(
+                    f"{path} has a record without a game at byte {offset}."
+                )
+
+            if record_type == TAG_MOVE:
+                ply = _read_ply(record_file, tag, record.started_at)
+                if ply is None:
+                    logger.warning("%s ends inside a record at %d", path, offset)
+                    break
+                record.plies.append(ply)
+            elif record_type == TAG_TAKE_BACK:
+                if record.plies:
+                    record.plies.pop()
+                record.take_backs += 1
+                record.status = GameStatus.IN_PROGRESS
+                record.winner = None
+            elif record_type == TAG_GAME_END:
+                data = _read_exactly(record_file, GAME_END_FORMAT.size)
+                if data is None:
+                    logger.warning("%s ends inside a record at %d", path, offset)
+                    break
+                status, winner = GAME_END_FORMAT.unpack(data)
+                record.status = GameStatus(status)
+                record.winner = Color(winner) if winner != 0 else None
+            else:
+                raise GameRecordError(
+                    f"{path} has an unknown record tag {tag:#04x} at byte {offset}."
+                )
+
+        if record is not None:
+            yield record
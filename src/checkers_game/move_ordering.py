@@ -0,0 +1,244 @@
+"""Move ordering strategies for the Negamax search.
+
+Alpha-beta pruning cuts off a node as soon as one move is good enough, so the
+earlier the best move is searched, the smaller the tree. An orderer sorts the
+legal moves of a node before they are searched and learns from the moves
+that caused cutoffs.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+from src.checkers_game.bitboard import (
+    BLUE_PROMOTION_MASK,
+    ORANGE_PROMOTION_MASK,
+    SQUARE_COUNT,
+    move_key,
+)
+from src.checkers_game.search_position import SearchPosition
+from src.common.enums import Color
+
+__all__ = ["HeuristicMoveOrderer", "MoveOrderer"]
+
+# Constants
+KILLER_SLOTS = 2
+TT_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 24
+CAPTURE_LENGTH_SCORE = 1 << 16
+PROMOTION_SCORE = 1 << 22
+KILLER_SCORE = 1 << 20
+HISTORY_LIMIT = KILLER_SCORE - 1
+
+
+class MoveOrderer:
+    """Base move orderer that keeps the generator's order.
+
+    Subclasses override `order_moves` and the learning hooks to implement
+    an ordering policy. The base class is also useful as a baseline when
+    measuring the gain of an ordering.
+    """
+
+    def clear(self) -> None:
+        """Forget everything learned from previous searches."""
+
+    def age(self, plies: int) -> None:
+        """Adapt what was learned to a root that moved forward.
+
+        Called when the game advances between searches whose data is kept.
+
+        Args:
+            plies: Number of moves played since the last search.
+        """
+
+    def order_moves(
+        self,
+        position: SearchPosition,
+        moves: List[List[int]],
+        ply: int,
+        tt_move_key: Optional[int] = None,
+    ) -> List[List[int]]:
+        """Return the moves in the order they should be searched.
+
+        Args:
+            position: Position the moves are played from.
+            moves: Legal moves of the position.
+            ply: Distance of the position from the search root.
+            tt_move_key: Key of the best move stored in the transposition
+                table or found by the previous iteration, if any.
+
+        Returns:
+            The moves, best candidates first.
+        """
+        return moves
+
+    def is_killer(self, move: List[int], ply: int) -> bool:
+        """Check if a move is one of the killer moves of a ply.
+
+        Args:
+            move: Move to check.
+            ply: Distance of the position from the search root.
+
+        Returns:
+            True if the move recently caused a cutoff at this ply.
+        """
+        return False
+
+    def record_cutoff(
+        self, position: SearchPosition, move: List[int], ply: int, depth: int
+    ) -> None:
+        """Learn from a move that caused a beta cutoff.
+
+        Args:
+            position: Position the move was played from.
+            move: Move that caused the cutoff.
+            ply: Distance of the position from the search root.
+            depth: Remaining depth of the node.
+        """
+
+
+class HeuristicMoveOrderer(MoveOrderer):
+    """Orders moves by TT move, captures, promotions, killers and history.
+
+    Scores, from highest to lowest priority:
+        - the transposition table move;
+        - captures, longer capture sequences first;
+        - promotions;
+        - the killer moves of the ply (quiet moves that caused cutoffs in
+          sibling nodes);
+        - the history score of the move (depth-weighted count of cutoffs).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty killer and history tables."""
+        self._killers: List[List[int]] = []
+        self._history: List[List[int]] = [
+            [0] * (SQUARE_COUNT * SQUARE_COUNT) for _ in range(2)
+        ]
+
+    def clear(self) -> None:
+        """Forget all killer moves and history scores."""
+        self._killers = []
+        for table in self._history:
+            for index in range(len(table)):
+                table[index] = 0
+
+    def age(self, plies: int) -> None:
+        """Shift the killers to the new root and fade the history scores.
+
+        The killers of ply N of the last search belong to ply N - `plies`
+        of the next one. History scores are halved once per move, so the
+        cutoffs of the current part of the game weigh more.
+
+        Args:
+            plies: Number of moves played since the last search.
+        """
+        del self._killers[:plies]
+        for table in self._history:
+            for index in range(len(table)):
+                table[index] >>= plies
+
+    def order_moves(
+        self,
+        position: SearchPosition,
+        moves: List[List[int]],
+        ply: int,
+        tt_move_key: Optional[int] = None,
+    ) -> List[List[int]]:
+        """Sort the moves by descending heuristic score.
+
+        Args:
+            position: Position the moves are played from.
+            moves: Legal moves of the position.
+            ply: Distance of the position from the search root.
+            tt_move_key: Key of the preferred move, if any.
+
+        Returns:
+            The moves, best candidates first. Moves with equal scores keep
+            the generator's order.
+        """
+        if len(moves) < 2:
+            return moves
+
+        killers = self._killers[ply] if ply < len(self._killers) else ()
+        history = self._history[self._color_index(position.turn_of)]
+        men = ~position.kings
+        promotion_mask = (
+            ORANGE_PROMOTION_MASK
+            if position.turn_of == Color.ORANGE
+            else BLUE_PROMOTION_MASK
+        )
+
+        scored = []
+        for index, move in enumerate(moves):
+            key = move_key(move)
+            start = move[0] - 1
+            end = move[-1] - 1
+
+            promotes = men >> start & 1 and promotion_mask >> end & 1
+
+            if key == tt_move_key:
+                score = TT_MOVE_SCORE
+            elif len(move) > 2:
+                score = CAPTURE_SCORE + CAPTURE_LENGTH_SCORE * (len(move) // 2)
+                if promotes:
+                    score += PROMOTION_SCORE
+            elif promotes:
+                score = PROMOTION_SCORE
+            elif key in killers:
+                score = KILLER_SCORE - killers.index(key)
+            else:
+                score = history[start * SQUARE_COUNT + end]
+            scored.append((-score, index, move))
+
+        scored.sort()
+        return [move for _, _, move in scored]
+
+    def is_killer(self, move: List[int], ply: int) -> bool:
+        """Check if a move is one of the killer moves of a ply.
+
+        Args:
+            move: Move to check.
+            ply: Distance of the position from the search root.
+
+        Returns:
+            True if the move recently caused a cutoff at this ply.
+        """
+        return ply < len(self._killers) and move_key(move) in self._killers[ply]
+
+    def record_cutoff(
+        self, position: SearchPosition, move: List[int], ply: int, depth: int
+    ) -> None:
+        """Update killers and history for a quiet move that caused a cutoff.
+
+        Captures are forced by the rules, so they are not worth remembering.
+
+        Args:
+            position: Position the move was played from.
+            move: Move that caused the cutoff.
+            ply: Distance of the position from the search root.
+            depth: Remaining depth of the node.
+        """
+        if len(move) > 2:
+            return
+
+        while len(self._killers) <= ply:
+            self._killers.append([])
+        killers = self._killers[ply]
+        key = move_key(move)
+        if key in killers:
+            killers.remove(key)
+        killers.insert(0, key)
+        del killers[KILLER_SLOTS:]
+
+        history = self._history[self._color_index(position.turn_of)]
+        index = (move[0] - 1) * SQUARE_COUNT + move[-1] - 1
+        history[index] += depth * depth
+        if history[index] > HISTORY_LIMIT:
+            for slot in range(len(history)):
+                history[slot] //= 2
+
+    @staticmethod
+    def _color_index(color: Color) -> int:
+        """Return the history table index of a color."""
+        return 0 if color == Color.ORANGE else 1
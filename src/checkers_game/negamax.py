@@ -7,22 +7,155 @@ to determine optimal moves for the computer player in a checkers game.
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
+import threading
 import time
-from copy import deepcopy
-from typing import List, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
+from src.checkers_game.bitboard import move_key
 from src.checkers_game.checkers_game import CheckersGame
-from src.common.enums import Color
-from src.common.exceptions import DecisionEngineError
+from src.checkers_game.evaluation import PositionEvaluator
+from src.checkers_game.evaluation_cache import (
+    DEFAULT_EVALUATION_CACHE_ENTRIES,
+    EvaluationCache,
+)
+from src.checkers_game.move_ordering import HeuristicMoveOrderer, MoveOrderer
+from src.checkers_game.opening_book import OpeningBook
+from src.checkers_game.repetition import RepetitionTracker
+from src.checkers_game.search_policy import SearchPolicy
+from src.checkers_game.search_position import SearchPosition
+from src.checkers_game.search_stats import SearchStats
+from src.checkers_game.tablebase import EndgameTablebase
+from src.checkers_game.transposition import DEFAULT_TT_SIZE_MB, TranspositionTable
+from src.common.enums import BoundType, Color, ReplacementPolicy, TablebaseResult
+from src.common.exceptions import DecisionEngineError, SearchAbortedError
 
 logger = logging.getLogger(__name__)
 
 # Constants
-MAX_ASSESSMENT_VALUE = 24
+# Score of a won position; above any static evaluation
+MAX_ASSESSMENT_VALUE = 10000
 DEFAULT_SEARCH_DEPTH = 10
 DRAW_REPETITION_THRESHOLD = 3
+MAX_SEARCH_DEPTH = 64
+TIME_CHECK_INTERVAL_NODES = 512
+DEFAULT_QUIESCENCE_NODE_LIMIT = 256
+DEFAULT_ASPIRATION_WINDOW = 25.0
+DEFAULT_BATCH_DEPTH = 0
+NULL_WINDOW_WIDTH = 1e-6
+WORKER_POLL_INTERVAL_S = 0.01
+# Scores between this and MAX_ASSESSMENT_VALUE are tablebase results, which
+# count the plies from the root to the end of the game
+TABLEBASE_SCORE_FLOOR = MAX_ASSESSMENT_VALUE - 1000
+
+# Child of an expanded node in the batched search: a known value, a leaf
+# awaiting evaluation as (leaf index, perspective), or the node's children
+_SubtreeNode = Union[float, Tuple[int, int], List[Tuple[List[int], "_SubtreeNode"]]]
+
+# Time budget in seconds for each difficulty level of the configuration window
+DIFFICULTY_TIME_BUDGETS = (0.1, 0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 8.0)
+
+
+def time_budget_for_difficulty(level: int) -> float:
+    """Map a difficulty level (1-10) to a time budget per move.
+
+    Args:
+        level: Difficulty level; values outside 1-10 are clamped.
+
+    Returns:
+        Time budget in seconds.
+    """
+    index = min(max(level, 1), len(DIFFICULTY_TIME_BUDGETS)) - 1
+    return DIFFICULTY_TIME_BUDGETS[index]
+
+
+def usable_cores() -> int:
+    """Return the number of CPU cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+# Engine owned by each worker process of a parallel search
+_worker_engine: Optional[NegamaxDecisionEngine] = None
+
+
+def _init_worker(engine_kwargs: Dict[str, Any], stop_event: Any) -> None:
+    """Create the engine used by a worker process.
+
+    Args:
+        engine_kwargs: Keyword arguments for `NegamaxDecisionEngine`.
+        stop_event: Event set by the main process to abandon the tasks.
+    """
+    global _worker_engine
+    _worker_engine = NegamaxDecisionEngine(**engine_kwargs)
+    _worker_engine.stop_event = stop_event
+
+
+def _clear_worker_tables() -> None:
+    """Forget the transposition table and move ordering data of a worker."""
+    _worker_engine.clear_tables()
+
+
+def _search_root_move(
+    game_id: Optional[str],
+    game_ply: int,
+    masks: Tuple[int, int, int],
+    turn_of: Color,
+    repetitions: RepetitionTracker,
+    move: List[int],
+    depth: int,
+    root_depth: int,
+    alpha: float,
+    beta: float,
+    deadline: Optional[float],
+) -> Tuple[Optional[float], int]:
+    """Search one root move in a worker process.
+
+    The worker keeps its tables between tasks, iterations and decisions,
+    aged like the main engine's as the game advances. Each worker is fed
+    the same root moves in the same order every time, so the result only
+    depends on the game, never on the timing of the processes.
+
+    Args:
+        game_id: Identifier of the game being searched, or None if the
+            owner of the engine manages its tables.
+        game_ply: Number of moves played in the game.
+        masks: Orange, blue and kings masks of the root position.
+        turn_of: Side to move at the root.
+        repetitions: Positions reached before the root, for draw detection.
+        move: Root move to search.
+        depth: Remaining depth after the move.
+        root_depth: Depth of the iteration at the root.
+        alpha: Alpha value of the root.
+        beta: Beta value of the root.
+        deadline: Wall-clock time after which the search is abandoned, or
+            None to always complete it.
+
+    Returns:
+        Tuple of (score of the move from the root's perspective, or None if
+        the search was abandoned; number of positions visited).
+    """
+    engine = _worker_engine
+    engine._follow_game(game_id, game_ply)
+    engine.computer_color = turn_of
+    engine._reset_counters()
+    engine._deadline = deadline
+    engine._root_depth = root_depth
+
+    position = SearchPosition(*masks, turn_of)
+    is_irreversible = position.is_irreversible_move(move)
+    position.make_move(move)
+    repetitions.push(position.zobrist_hash, is_irreversible)
+    try:
+        score, _ = engine._search_child(position, repetitions, depth, alpha, beta, 1, 0)
+    except SearchAbortedError:
+        score = None
+    return score, engine._nodes
 
 
 class NegamaxDecisionEngine:
@@ -37,27 +170,312 @@ class NegamaxDecisionEngine:
         self,
         computer_color: Color = Color.ORANGE,
         search_depth: int = DEFAULT_SEARCH_DEPTH,
+        tt_size_mb: float = DEFAULT_TT_SIZE_MB,
+        tt_replacement_policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED,
+        time_budget_s: Optional[float] = None,
+        move_orderer: Optional[MoveOrderer] = None,
+        workers: int = 1,
+        quiescence_node_limit: int = DEFAULT_QUIESCENCE_NODE_LIMIT,
+        principal_variation: bool = True,
+        aspiration_window: Optional[float] = DEFAULT_ASPIRATION_WINDOW,
+        search_policy: Optional[SearchPolicy] = None,
+        evaluator: Optional[PositionEvaluator] = None,
+        batch_depth: int = DEFAULT_BATCH_DEPTH,
+        evaluation_cache_entries: int = DEFAULT_EVALUATION_CACHE_ENTRIES,
+        evaluation_cache: Optional[EvaluationCache] = None,
+        opening_book: Optional[OpeningBook] = None,
+        tablebase: Optional[EndgameTablebase] = None,
+        transposition_table: Optional[TranspositionTable] = None,
+        keep_tables: bool = False,
+        node_pause_s: float = 0.0,
     ) -> None:
         """Initialize the decision engine.
 
         Args:
             computer_color: The color assigned to the AI player.
             search_depth: Maximum depth for the game tree search.
+            tt_size_mb: Memory budget of the transposition table in megabytes.
+            tt_replacement_policy: Replacement policy of the transposition table.
+            time_budget_s: Wall-clock time allowed per decision in seconds, or
+                None to always search to `search_depth`.
+            move_orderer: Strategy used to order moves before searching them.
+                Defaults to a `HeuristicMoveOrderer`.
+            workers: Number of processes searching each decision. With more
+                than one, the root moves are split between the engine and
+                `workers - 1` worker processes, each with its own tables,
+                the engine taking the first move. The chosen move is the
+                same on every run of the same game with the same number of
+                workers. Capped at the number of usable CPU cores, since
+                processes sharing a core slow each other down.
+            quiescence_node_limit: Maximum number of positions the quiescence
+                search may visit below each leaf of the main search. Zero
+                disables the quiescence search.
+            principal_variation: Search every move after the first with a
+                null window, and repeat the search with a full window only
+                if the move turns out better (principal variation search).
+            aspiration_window: Half-width of the window around the previous
+                iteration's score that each iteration starts with, or None
+                to always search with a full window.
+            search_policy: Policy that reduces and extends the depth of
+                individual moves. Defaults to a `SearchPolicy`, which
+                searches every move to the nominal depth.
+            evaluator: Static evaluation of the leaf positions. Defaults to a
+                `PositionEvaluator` with the default weights.
+            batch_depth: Remaining depth from which a node expands its whole
+                subtree and scores all its leaves with one batched
+                evaluation, instead of searching it with alpha-beta. Zero
+                evaluates every leaf on its own.
+            evaluation_cache_entries: Capacity of the cache of static
+                evaluations. Zero disables the cache.
+            evaluation_cache: Cache to use, for sharing one cache between
+                engines. Defaults to a new cache of
+                `evaluation_cache_entries` entries. The cache is kept for
+                the engine's lifetime, across iterations and decisions,
+                since an evaluation never goes stale.
+            opening_book: Book consulted before every search; a position
+                with a legal book move is answered with the book move of the
+                highest weight without searching.
+            tablebase: Endgame tablebase probed below the root; a position
+                it covers is scored with its exact result instead of being
+                searched.
+            transposition_table: Table to search with, for sharing one table
+                between engines. Defaults to a new table built from
+                `tt_size_mb` and `tt_replacement_policy`.
+            keep_tables: Leave the transposition table and move ordering
+                data entirely to the owner, who clears them with
+                `clear_tables`. Otherwise the engine keeps them between the
+                decisions of one game, ages them as the game advances (see
+                `notify_move`) and clears them when a new game starts.
+            node_pause_s: Time to sleep every `TIME_CHECK_INTERVAL_NODES`
+                positions, so that a search running in the background leaves
+                the CPU and the interpreter lock to other threads. Zero never
+                sleeps.
         """
         self.computer_color = computer_color
         self.search_depth = search_depth
+        self.time_budget_s = time_budget_s
+        self.tt_size_mb = tt_size_mb
+        self.tt_replacement_policy = tt_replacement_policy
+        self.workers = min(max(1, workers), usable_cores())
+        if self.workers < workers:
+            logger.warning(
+                "Using %d of the %d workers asked for, one per usable CPU core",
+                self.workers,
+                workers,
+            )
+        self.quiescence_node_limit = quiescence_node_limit
+        self.principal_variation = principal_variation
+        self.aspiration_window = aspiration_window
+        self.search_policy = (
+            search_policy if search_policy is not None else SearchPolicy()
+        )
+        self.evaluator = evaluator if evaluator is not None else PositionEvaluator()
+        self.batch_depth = batch_depth
+        self.evaluation_cache_entries = evaluation_cache_entries
+        self.evaluation_cache: Optional[EvaluationCache] = evaluation_cache
+        if self.evaluation_cache is None and evaluation_cache_entries > 0:
+            self.evaluation_cache = EvaluationCache(evaluation_cache_entries)
+        self.opening_book = opening_book
+        self.tablebase = tablebase
+        self.keep_tables = keep_tables
+        self.node_pause_s = node_pause_s
+        self.transposition_table = (
+            transposition_table
+            if transposition_table is not None
+            else TranspositionTable(tt_size_mb, tt_replacement_policy)
+        )
+        self.move_orderer = (
+            move_orderer if move_orderer is not None else HeuristicMoveOrderer()
+        )
+        self.last_stats: Optional[SearchStats] = None
+        self.stop_event = threading.Event()
+
+        self._nodes = 0
+        self._cutoffs = 0
+        self._first_move_cutoffs = 0
+        self._quiescence_nodes = 0
+        self._quiescence_budget = 0
+        self._null_window_searches = 0
+        self._researches = 0
+        self._aspiration_researches = 0
+        self._reductions = 0
+        self._reduction_researches = 0
+        self._extensions = 0
+        self._batches = 0
+        self._batched_leaves = 0
+        self._evaluation_cache_probes = 0
+        self._evaluation_cache_hits = 0
+        self._tablebase_hits = 0
+        self._tt_probes_start = 0
+        self._tt_hits_start = 0
+        self._root_depth = 0
+        self._deadline: Optional[float] = None
+        self._worker_nodes = 0
+
+        # One single-process pool per worker, so every worker gets its own
+        # tasks in a fixed order
+        self._lanes: List[ProcessPoolExecutor] = []
+        self._worker_stop: Optional[Any] = None
+
+        # Game the tables belong to, the number of moves played in it and
+        # the move keys of the expected continuation
+        self._game_id: Optional[str] = None
+        self._game_ply = 0
+        self._principal_variation: List[int] = []
+
+    def close(self) -> None:
+        """Shut down the worker processes of the parallel search, if any."""
+        if self._worker_stop is not None:
+            self._worker_stop.set()
+        for lane in self._lanes:
+            lane.shutdown(cancel_futures=True)
+        self._lanes = []
+
+    def request_stop(self) -> None:
+        """Ask a running search to stop as soon as possible.
+
+        Can be called from another thread. The stop request stays in effect,
+        also for later decisions, until `stop_event` is cleared. The worker
+        processes of a parallel search stop with the engine. A stopped
+        decision returns the best move of its last completed iteration, or
+        None if not even the first iteration completed.
+        """
+        self.stop_event.set()
+
+    def clear_tables(self) -> None:
+        """Forget the transposition table and move ordering data.
+
+        The tables of the worker processes are cleared too, before their
+        next task.
+        """
+        self.transposition_table.clear()
+        self.move_orderer.clear()
+        self._principal_variation = []
+        for lane in self._lanes:
+            lane.submit(_clear_worker_tables)
+
+    def notify_move(self, game_id: str, move: List[int]) -> None:
+        """Tell the engine about a move played in a game.
+
+        The tables of the game are kept for the next decision: transposition
+        table entries become stale, so new results replace them freely,
+        killer moves are shifted to the new root, history scores fade, and
+        the expected continuation advances if the move was the one expected.
+        A move of another game clears the tables first.
+
+        Args:
+            game_id: Identifier of the game (see `CheckersGame.get_game_id`).
+            move: Move that was played.
+        """
+        if game_id != self._game_id:
+            self._start_game(game_id, 0)
+        self._advance(move)
+        self._game_ply += 1
+
+    def _sync_with_game(self, game: CheckersGame) -> None:
+        """Bring the tables up to date with a game about to be searched.
 
-    def decide_move(self, game: Optional[CheckersGame] = None) -> List[int]:
+        Moves the engine was not notified about are taken from the game's
+        log. A game that went back, by a take-back, keeps its tables but
+        loses the expected continuation.
+
+        Args:
+            game: Game to search.
+        """
+        move_log = game.get_move_log()
+        if game.get_game_id() != self._game_id:
+            self._start_game(game.get_game_id(), len(move_log))
+            return
+
+        if len(move_log) < self._game_ply:
+            self._principal_variation = []
+        for move in move_log[self._game_ply :]:
+            self._advance(move)
+        self._game_ply = len(move_log)
+
+    def _start_game(self, game_id: str, game_ply: int) -> None:
+        """Clear the tables for a game seen for the first time.
+
+        Args:
+            game_id: Identifier of the game.
+            game_ply: Number of moves already played in the game.
+        """
+        self.clear_tables()
+        self._game_id = game_id
+        self._game_ply = game_ply
+
+    def _advance(self, move: List[int]) -> None:
+        """Age the tables by one move of the current game.
+
+        Args:
+            move: Move that was played.
+        """
+        self.transposition_table.new_generation()
+        self.move_orderer.age(1)
+        if self._principal_variation and self._principal_variation[0] == move_key(move):
+            del self._principal_variation[0]
+        else:
+            self._principal_variation = []
+
+    def _follow_game(self, game_id: Optional[str], game_ply: int) -> None:
+        """Bring the tables of a worker process up to date with a game.
+
+        Works like `_sync_with_game` from the number of moves alone, since a
+        worker never searches from the played moves themselves.
+
+        Args:
+            game_id: Identifier of the game, or None if the owner of the
+                main engine manages its tables.
+            game_ply: Number of moves played in the game.
+        """
+        if game_id != self._game_id:
+            self._start_game(game_id, game_ply)
+            return
+
+        for _ in range(game_ply - self._game_ply):
+            self.transposition_table.new_generation()
+        if game_ply > self._game_ply:
+            self.move_orderer.age(game_ply - self._game_ply)
+        self._game_ply = game_ply
+
+    def decide_move(self, game: Optional[CheckersGame] = None) -> Optional[List[int]]:
         """Determine the best move for the current game state.
 
+        The search deepens one ply at a time up to `search_depth`. With a time
+        budget it stops as soon as the budget runs out and returns the best
+        move of the last completed iteration.
+
+        Args:
+            game: The current game state. If None, a new game is created.
+
+        Returns:
+            The optimal move sequence as a list of tile IDs, or None if the
+            search was stopped before its first iteration completed.
+
+        Raises:
+            DecisionEngineError: If it's not the computer's turn or the
+                computer has no legal move.
+        """
+        return self.decide(game).best_move
+
+    def decide(self, game: Optional[CheckersGame] = None) -> SearchStats:
+        """Determine the best move together with the statistics of its search.
+
+        Works like `decide_move`, but returns the whole record of the
+        decision: the move, its score, the search counters, the time of
+        each iteration and the principal variation.
+
         Args:
             game: The current game state. If None, a new game is created.
 
         Returns:
-            The optimal move sequence as a list of tile IDs.
+            Statistics of the decision, with the chosen move as `best_move`,
+            or None there if the search was stopped before its first
+            iteration completed.
 
         Raises:
-            DecisionEngineError: If it's not the computer's turn or game is invalid.
+            DecisionEngineError: If it's not the computer's turn or the
+                computer has no legal move.
         """
         if game is None:
             game = CheckersGame()
@@ -65,170 +483,1264 @@ class NegamaxDecisionEngine:
         if game.get_turn_of() is None or game.get_turn_of() != self.computer_color:
             raise DecisionEngineError("It is not the computer's turn to move.")
 
-        # If only one move is available, return it immediately
         possible_moves = game.get_possible_opts()
+        if not possible_moves:
+            raise DecisionEngineError("No valid move found by the decision engine.")
+
+        # If only one move is available, return it immediately
         if len(possible_moves) == 1:
             chosen_move = possible_moves[0]
             logger.info("Only one move available: %s", chosen_move)
-            return chosen_move
+            self.last_stats = SearchStats(
+                best_move=chosen_move, principal_variation=[chosen_move]
+            )
+            return self.last_stats
 
-        logger.info("Starting Negamax search with depth %d", self.search_depth)
+        if self.opening_book is not None:
+            book_move = self.opening_book.choose_move(
+                game.get_position_hash(), possible_moves
+            )
+            if book_move is not None:
+                logger.info("Book move: %s", book_move)
+                self.last_stats = SearchStats(
+                    best_move=book_move,
+                    principal_variation=[book_move],
+                    from_book=True,
+                )
+                return self.last_stats
+
+        logger.info(
+            "Starting Negamax search with depth %d and time budget %s",
+            self.search_depth,
+            f"{self.time_budget_s:.2f}s" if self.time_budget_s is not None else "none",
+        )
         start_time = time.time()
 
-        chosen_move, score, max_depth_reached = self._negamax(
-            game_state=game.get_game_state(),
-            draw_log=game.get_draw_criteria_log(),
-            depth=self.search_depth,
-            alpha=-MAX_ASSESSMENT_VALUE,
-            beta=MAX_ASSESSMENT_VALUE,
-            perspective=1,
+        position = SearchPosition.from_array(game.get_game_state(), game.get_turn_of())
+        repetitions = game.get_repetition_tracker().copy()
+        if not self.keep_tables:
+            self._sync_with_game(game)
+
+        if self.workers > 1:
+            self._start_workers()
+        stats = self._search_iteratively(position, repetitions, start_time)
+        stats.elapsed_s = time.time() - start_time
+        stats.principal_variation = self._extract_principal_variation(
+            SearchPosition.from_array(game.get_game_state(), game.get_turn_of()),
+            stats.best_move,
+            stats.depth_reached,
         )
+        self._principal_variation = [
+            move_key(move) for move in stats.principal_variation
+        ]
+        self.last_stats = stats
 
-        elapsed = time.time() - start_time
         logger.info(
-            "Negamax completed in %.2fs | Move: %s | Score: %d | Max depth: %d",
-            elapsed,
-            chosen_move,
-            score,
-            max_depth_reached,
+            "Negamax completed in %.2fs | Move: %s | Score: %d | Depth: %d | "
+            "Nodes: %d (%.0f nps) | First-move cutoffs: %.0f%%",
+            stats.elapsed_s,
+            stats.best_move,
+            stats.score,
+            stats.depth_reached,
+            stats.nodes,
+            stats.nodes_per_second,
+            100.0 * stats.first_move_cutoff_rate,
         )
 
-        if chosen_move is None:
-            raise DecisionEngineError("No valid move found by the decision engine.")
+        return stats
+
+    def get_last_stats(self) -> Optional[SearchStats]:
+        """Return the statistics of the most recent decision, if any."""
+        return self.last_stats
+
+    def _extract_principal_variation(
+        self, position: SearchPosition, best_move: Optional[List[int]], plies: int
+    ) -> List[List[int]]:
+        """Follow the best moves stored in the transposition table.
+
+        Args:
+            position: Root position of the decision; modified in place.
+            best_move: Move chosen at the root.
+            plies: Largest number of moves to follow.
+
+        Returns:
+            Moves of the expected continuation, starting with the chosen
+            move.
+        """
+        if best_move is None:
+            return []
+
+        variation = [best_move]
+        seen = {position.zobrist_hash}
+        position.make_move(best_move)
+        while len(variation) < plies and position.zobrist_hash not in seen:
+            seen.add(position.zobrist_hash)
+            entry = self.transposition_table.probe(position.zobrist_hash)
+            if entry is None:
+                break
+            moves = {
+                move_key(move): move
+                for move in position.get_color_poss_opts(position.turn_of)
+            }
+            move = moves.get(entry[3])
+            if move is None:
+                break
+            variation.append(move)
+            position.make_move(move)
+        return variation
+
+    def _search_iteratively(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        start_time: float,
+    ) -> SearchStats:
+        """Run iterative deepening from the root position.
+
+        The first iteration always completes; later iterations are abandoned
+        when the time budget runs out. The transposition table carries the
+        best move of each iteration into the next one, where it is searched
+        first. With worker processes, every iteration after the first one
+        splits the root moves across the engine and the workers.
+
+        Args:
+            position: Root position; left in an undefined state if an
+                iteration is abandoned.
+            repetitions: Positions reached so far, for draw detection.
+            start_time: Time at which the decision started.
+
+        Returns:
+            Statistics with the best move of the last completed iteration.
+        """
+        stats = SearchStats()
+        self._reset_counters()
+        self._deadline = None
+        # Scores alternate with the parity of the depth, so the root split
+        # expects the lower of the last two
+        scores: List[float] = []
+
+        for depth in range(1, self.search_depth + 1):
+            iteration_start = time.time()
+            iteration_start_nodes = self._nodes
+            try:
+                if self._lanes and stats.depth_reached > 0:
+                    best_move, score = self._search_root_split(
+                        position, repetitions, depth, min(scores[-2:])
+                    )
+                else:
+                    best_move, score = self._search_root(
+                        position,
+                        repetitions,
+                        depth,
+                        stats.score if stats.depth_reached > 0 else None,
+                    )
+            except SearchAbortedError as error:
+                logger.info("Depth %d abandoned: %s", depth, error)
+                break
+
+            stats.best_move = best_move
+            stats.score = score
+            stats.depth_reached = depth
+            scores.append(score)
+            stats.iteration_times_s.append(time.time() - iteration_start)
+            stats.iteration_nodes.append(self._nodes - iteration_start_nodes)
+            logger.debug(
+                "Depth %d done | Move: %s | Score: %d | Nodes: %d",
+                depth,
+                best_move,
+                score,
+                self._nodes,
+            )
+
+            # A forced win or loss will not change with more depth
+            if abs(score) >= MAX_ASSESSMENT_VALUE:
+                break
+
+            if self.time_budget_s is not None:
+                self._deadline = start_time + self.time_budget_s
+                if time.time() >= self._deadline:
+                    break
+
+        self._fill_counters(stats)
+        return stats
+
+    def _search_root(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        depth: int,
+        previous_score: Optional[float],
+    ) -> Tuple[Optional[List[int]], float]:
+        """Search the root position to a given depth.
+
+        With an aspiration window and the previous iteration's score, the
+        search starts with a narrow window around that score. If the score
+        falls outside the window, the search is repeated with the window
+        opened on that side.
+
+        Args:
+            position: Root position.
+            repetitions: Positions reached so far, for draw detection.
+            depth: Search depth.
+            previous_score: Score of the previous iteration, if any.
+
+        Returns:
+            Tuple of (best move, score).
+        """
+        alpha = -float(MAX_ASSESSMENT_VALUE)
+        beta = float(MAX_ASSESSMENT_VALUE)
+        if self.aspiration_window is not None and previous_score is not None:
+            alpha = max(alpha, previous_score - self.aspiration_window)
+            beta = min(beta, previous_score + self.aspiration_window)
+
+        self._root_depth = depth
+        while True:
+            best_move, score, _ = self._negamax(
+                position=position,
+                repetitions=repetitions,
+                depth=depth,
+                alpha=alpha,
+                beta=beta,
+                perspective=1,
+            )
+            if score <= alpha and alpha > -MAX_ASSESSMENT_VALUE:
+                alpha = -float(MAX_ASSESSMENT_VALUE)
+            elif score >= beta and beta < MAX_ASSESSMENT_VALUE:
+                beta = float(MAX_ASSESSMENT_VALUE)
+            else:
+                return best_move, score
+
+            self._aspiration_researches += 1
+            logger.debug("Aspiration window failed at depth %d", depth)
+
+    def _search_root_split(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        depth: int,
+        expected_score: float,
+    ) -> Tuple[Optional[List[int]], float]:
+        """Search the root position with the root moves split across workers.
+
+        The engine searches the first root move with a full window while the
+        other moves are tested with a null window against the expected score,
+        a score the first move is likely to reach. The moves whose bound does
+        not rule them out are tested again against the score of the first
+        move, and the ones that beat it are searched for their exact score.
+        The later moves of every round are dealt out to the engine and the
+        workers by their index.
+
+        All windows come from scores that do not depend on the timing of the
+        processes, every process searches its moves in a fixed order, and
+        ties go to the move that comes first in the root ordering, so the
+        chosen move does not depend on the timing either.
+
+        Args:
+            position: Root position; left in an undefined state if the search
+                is abandoned.
+            repetitions: Positions reached so far, for draw detection.
+            depth: Search depth.
+            expected_score: Score the later moves are first tested against.
+
+        Returns:
+            Tuple of (best move, score).
+
+        Raises:
+            SearchAbortedError: If a stop was requested or the time budget
+                ran out.
+        """
+        self._count_node()
+        self._root_depth = depth
+        root_entry = self.transposition_table.probe(position.zobrist_hash)
+        preferred_move_key = None
+        if root_entry is not None:
+            preferred_move_key = root_entry[3]
+        elif self._principal_variation:
+            preferred_move_key = self._principal_variation[0]
+        root_moves = self.move_orderer.order_moves(
+            position, position.get_possible_opts(), 0, preferred_move_key
+        )
+        child_depths = []
+        for move in root_moves:
+            extension = self.search_policy.extension(
+                position, root_moves, move, 0, depth
+            )
+            self._extensions += extension
+            child_depths.append(depth - 1 + extension)
+
+        later_moves = list(range(1, len(root_moves)))
+        tasks = self._submit_root_moves(
+            position,
+            repetitions,
+            root_moves,
+            child_depths,
+            later_moves,
+            expected_score,
+            expected_score + NULL_WINDOW_WIDTH,
+        )
+        try:
+            first_score = self._search_one_root_move(
+                position,
+                repetitions,
+                root_moves[0],
+                child_depths[0],
+                -float(MAX_ASSESSMENT_VALUE),
+                float(MAX_ASSESSMENT_VALUE),
+            )
+        except SearchAbortedError:
+            self._abandon_workers(tasks)
+            raise
+        bounds = self._finish_root_round(
+            position,
+            repetitions,
+            root_moves,
+            child_depths,
+            later_moves,
+            tasks,
+            expected_score,
+            expected_score + NULL_WINDOW_WIDTH,
+        )
+
+        # A move that fails low returns an upper bound on its score, so it
+        # cannot beat the first move if that bound does not
+        candidates = [
+            index
+            for index in later_moves
+            if bounds[index] > expected_score or bounds[index] > first_score
+        ]
+        tests = self._search_root_round(
+            position,
+            repetitions,
+            root_moves,
+            child_depths,
+            candidates,
+            first_score,
+            first_score + NULL_WINDOW_WIDTH,
+        )
+        self._null_window_searches += len(bounds) + len(tests)
+
+        better_moves = [index for index in candidates if tests[index] > first_score]
+        scores = self._search_root_round(
+            position,
+            repetitions,
+            root_moves,
+            child_depths,
+            better_moves,
+            first_score,
+            float(MAX_ASSESSMENT_VALUE),
+        )
+        self._researches += len(scores)
+
+        best_index = 0
+        best_score = first_score
+        for index in better_moves:
+            if scores[index] > best_score:
+                best_index = index
+                best_score = scores[index]
+
+        best_move = root_moves[best_index]
+        self.transposition_table.store(
+            position.zobrist_hash,
+            depth,
+            BoundType.EXACT,
+            self._score_to_table(best_score, 0),
+            move_key(best_move),
+        )
+        return best_move, best_score
+
+    def _search_root_round(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        root_moves: List[List[int]],
+        child_depths: List[int],
+        indices: List[int],
+        alpha: float,
+        beta: float,
+    ) -> Dict[int, float]:
+        """Search root moves with the same window across the engine and workers.
+
+        Args:
+            position: Root position; restored before returning.
+            repetitions: Positions reached so far, for draw detection.
+            root_moves: Ordered root moves.
+            child_depths: Remaining depth after each root move.
+            indices: Indices of the moves to search, from 1.
+            alpha: Alpha value of the root.
+            beta: Beta value of the root.
+
+        Returns:
+            Score of each move by move index.
+
+        Raises:
+            SearchAbortedError: If a stop was requested or the time budget
+                ran out.
+        """
+        tasks = self._submit_root_moves(
+            position, repetitions, root_moves, child_depths, indices, alpha, beta
+        )
+        return self._finish_root_round(
+            position,
+            repetitions,
+            root_moves,
+            child_depths,
+            indices,
+            tasks,
+            alpha,
+            beta,
+        )
+
+    def _finish_root_round(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        root_moves: List[List[int]],
+        child_depths: List[int],
+        indices: List[int],
+        tasks: Dict[int, Future],
+        alpha: float,
+        beta: float,
+    ) -> Dict[int, float]:
+        """Search the engine's share of a round and collect the workers' share.
+
+        Args:
+            position: Root position; restored before returning.
+            repetitions: Positions reached so far, for draw detection.
+            root_moves: Ordered root moves.
+            child_depths: Remaining depth after each root move.
+            indices: Indices of the moves of the round, from 1.
+            tasks: Tasks of the workers' share by move index.
+            alpha: Alpha value of the root.
+            beta: Beta value of the root.
+
+        Returns:
+            Score of each move of the round by move index.
+
+        Raises:
+            SearchAbortedError: If a stop was requested or the time budget
+                ran out.
+        """
+        scores = {}
+        try:
+            for index in indices:
+                if index not in tasks:
+                    scores[index] = self._search_one_root_move(
+                        position,
+                        repetitions,
+                        root_moves[index],
+                        child_depths[index],
+                        alpha,
+                        beta,
+                    )
+        except SearchAbortedError:
+            self._abandon_workers(tasks)
+            raise
+        scores.update(self._wait_for_workers(tasks))
+        return scores
+
+    def _search_one_root_move(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        move: List[int],
+        depth: int,
+        alpha: float,
+        beta: float,
+    ) -> float:
+        """Search one root move on its own.
+
+        Args:
+            position: Root position; restored before returning.
+            repetitions: Positions reached so far, for draw detection.
+            move: Root move to search.
+            depth: Remaining depth after the move.
+            alpha: Alpha value of the root.
+            beta: Beta value of the root.
+
+        Returns:
+            Score of the move from the root's perspective.
+        """
+        is_irreversible = position.is_irreversible_move(move)
+        undo = position.make_move(move)
+        repetitions.push(position.zobrist_hash, is_irreversible)
+        score, _ = self._search_child(position, repetitions, depth, alpha, beta, 1, 0)
+        repetitions.pop()
+        position.unmake_move(undo)
+        return score
+
+    def _start_workers(self) -> None:
+        """Start the worker processes if needed and clear their stop event."""
+        if not self._lanes:
+            self._worker_stop = multiprocessing.Event()
+            self._lanes = [
+                ProcessPoolExecutor(
+                    max_workers=1,
+                    initializer=_init_worker,
+                    initargs=(self._worker_kwargs(), self._worker_stop),
+                )
+                for _ in range(self.workers - 1)
+            ]
+        self._worker_stop.clear()
+
+    def _submit_root_moves(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        root_moves: List[List[int]],
+        child_depths: List[int],
+        indices: Iterable[int],
+        alpha: float,
+        beta: float,
+    ) -> Dict[int, Future]:
+        """Hand root moves to the workers by their index.
+
+        Args:
+            position: Root position.
+            repetitions: Positions reached so far, for draw detection.
+            root_moves: Root moves in search order.
+            child_depths: Remaining depth after each root move.
+            indices: Indices of the moves to search, from 1; the moves
+                the engine searches itself are left out.
+            alpha: Alpha value of the root.
+            beta: Beta value of the root.
+
+        Returns:
+            Dictionary of the tasks by move index.
+        """
+        masks = (position.orange, position.blue, position.kings)
+        root_repetitions = repetitions.copy()
+        return {
+            index: self._lanes[index % self.workers - 1].submit(
+                _search_root_move,
+                self._game_id,
+                self._game_ply,
+                masks,
+                position.turn_of,
+                root_repetitions,
+                root_moves[index],
+                child_depths[index],
+                self._root_depth,
+                alpha,
+                beta,
+                self._deadline,
+            )
+            for index in indices
+            if index % self.workers != 0
+        }
+
+    def _wait_for_workers(self, tasks: Dict[int, Future]) -> Dict[int, float]:
+        """Wait for the scores of root moves searched by the workers.
+
+        Args:
+            tasks: Tasks by move index.
 
-        return chosen_move
+        Returns:
+            Score of each move by move index.
+
+        Raises:
+            SearchAbortedError: If a stop was requested or the time budget
+                ran out before all tasks completed.
+        """
+        pending = set(tasks.values())
+        while pending:
+            _, pending = wait(pending, timeout=WORKER_POLL_INTERVAL_S)
+            if pending and self.stop_event.is_set():
+                self._abandon_workers(tasks)
+                raise SearchAbortedError("Search stopped on request.")
+
+        scores = {}
+        for index, task in tasks.items():
+            score, nodes = task.result()
+            self._worker_nodes += nodes
+            if score is None:
+                raise SearchAbortedError("Search time budget exhausted.")
+            scores[index] = score
+        return scores
+
+    def _abandon_workers(self, tasks: Dict[int, Future]) -> None:
+        """Stop the workers and wait for their tasks to finish.
+
+        Args:
+            tasks: Tasks by move index.
+        """
+        self._worker_stop.set()
+        for task in tasks.values():
+            self._worker_nodes += task.result()[1]
+
+    def _worker_kwargs(self) -> Dict[str, Any]:
+        """Return the settings a worker process needs to rebuild this engine."""
+        return {
+            "computer_color": self.computer_color,
+            "search_depth": self.search_depth,
+            "tt_size_mb": self.tt_size_mb,
+            "tt_replacement_policy": self.tt_replacement_policy,
+            "quiescence_node_limit": self.quiescence_node_limit,
+            "principal_variation": self.principal_variation,
+            "search_policy": self.search_policy,
+            "evaluator": self.evaluator,
+            "batch_depth": self.batch_depth,
+            "evaluation_cache_entries": self.evaluation_cache_entries,
+            "tablebase": self.tablebase,
+        }
+
+    def _reset_counters(self) -> None:
+        """Reset the node and cutoff counters before a search."""
+        self._nodes = 0
+        self._cutoffs = 0
+        self._first_move_cutoffs = 0
+        self._quiescence_nodes = 0
+        self._null_window_searches = 0
+        self._researches = 0
+        self._aspiration_researches = 0
+        self._reductions = 0
+        self._reduction_researches = 0
+        self._extensions = 0
+        self._batches = 0
+        self._batched_leaves = 0
+        self._evaluation_cache_probes = 0
+        self._evaluation_cache_hits = 0
+        self._tablebase_hits = 0
+        self._tt_probes_start = self.transposition_table.probes
+        self._tt_hits_start = self.transposition_table.hits
+        self._worker_nodes = 0
+
+    def _fill_counters(self, stats: SearchStats) -> None:
+        """Copy the node and cutoff counters into search statistics.
+
+        Args:
+            stats: Statistics to fill in.
+        """
+        stats.nodes = self._nodes
+        stats.cutoffs = self._cutoffs
+        stats.first_move_cutoffs = self._first_move_cutoffs
+        stats.quiescence_nodes = self._quiescence_nodes
+        stats.null_window_searches = self._null_window_searches
+        stats.researches = self._researches
+        stats.aspiration_researches = self._aspiration_researches
+        stats.reductions = self._reductions
+        stats.reduction_researches = self._reduction_researches
+        stats.extensions = self._extensions
+        stats.batches = self._batches
+        stats.batched_leaves = self._batched_leaves
+        stats.evaluation_cache_probes = self._evaluation_cache_probes
+        stats.evaluation_cache_hits = self._evaluation_cache_hits
+        stats.tablebase_hits = self._tablebase_hits
+        stats.tt_probes = self.transposition_table.probes - self._tt_probes_start
+        stats.tt_hits = self.transposition_table.hits - self._tt_hits_start
+        stats.worker_nodes = self._worker_nodes
+
+    def _count_node(self) -> None:
+        """Count a visited position and check whether to stop searching.
+
+        Raises:
+            SearchAbortedError: If a stop was requested or the time budget
+                ran out.
+        """
+        self._nodes += 1
+        if self._nodes % TIME_CHECK_INTERVAL_NODES == 0:
+            if self.node_pause_s > 0:
+                time.sleep(self.node_pause_s)
+            if self.stop_event.is_set():
+                raise SearchAbortedError("Search stopped on request.")
+            if self._deadline is not None and time.time() >= self._deadline:
+                raise SearchAbortedError("Search time budget exhausted.")
 
     def _negamax(
         self,
-        game_state: np.ndarray,
-        draw_log: List[Tuple[Color, np.ndarray]],
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
         depth: int,
         alpha: float,
         beta: float,
         perspective: int,
+        ply: int = 0,
     ) -> Tuple[Optional[List[int]], float, int]:
         """Recursive Negamax algorithm with alpha-beta pruning.
 
+        The position is modified in place with make/unmake, and the repetition
+        tracker is pushed and popped along the current search path, so no board
+        is copied while the tree is explored. Results are stored in the
+        transposition table; below the root, a stored result that is deep
+        enough narrows the window or ends the search of the node. Moves are
+        searched in the order given by the move orderer, which is told about
+        every cutoff. With principal variation search, moves after the first
+        are searched with a null window first.
+
         Args:
-            game_state: Current board state.
-            draw_log: History of states for draw detection.
+            position: Current position; restored before returning.
+            repetitions: Positions reached so far, for draw detection.
             depth: Remaining search depth.
             alpha: Alpha value for pruning.
             beta: Beta value for pruning.
             perspective: 1 for maximizing, -1 for minimizing.
+            ply: Distance from the root of the search.
 
         Returns:
             Tuple of (best_move, evaluation_score, max_depth_reached).
         """
-        # Determine whose turn it is
-        current_color = (
-            self.computer_color if perspective == 1 else self._opponent_color()
-        )
+        self._count_node()
+        current_color = position.turn_of
 
         # Check for draw by repetition
-        if self._is_draw_by_repetition(current_color, game_state, draw_log):
+        if self._is_draw_by_repetition(position.zobrist_hash, repetitions):
             return None, 0.0, 0
 
-        # Get possible moves for the current player
-        possible_moves = CheckersGame.get_color_poss_opts(current_color, game_state)
+        # Positions with few pieces left have an exact result in the tablebase
+        if (
+            ply > 0
+            and self.tablebase is not None
+            and self.tablebase.covers(position.orange, position.blue)
+        ):
+            entry = self.tablebase.probe(position.zobrist_hash)
+            if entry is not None:
+                self._tablebase_hits += 1
+                return None, self._tablebase_value(*entry, ply), depth
+
+        # Depth limit reached - resolve pending captures, then evaluate
+        if depth <= 0:
+            captures = position.get_captures(current_color)
+            if not captures and not position.has_any_move(current_color):
+                return None, -float(MAX_ASSESSMENT_VALUE), 0
+
+            self._quiescence_budget = self.quiescence_node_limit
+            return (
+                None,
+                self._quiescence(position, captures, alpha, beta, perspective),
+                0,
+            )
+
+        # Probe the transposition table
+        alpha_original = alpha
+        position_hash = position.zobrist_hash
+        tt_entry = self.transposition_table.probe(position_hash)
+        tt_move_key: Optional[int] = None
+
+        if tt_entry is not None:
+            tt_depth, tt_bound, tt_score, tt_move_key = tt_entry
+            tt_score = self._score_from_table(tt_score, ply)
+
+            if ply > 0 and tt_depth >= depth:
+                if tt_bound == BoundType.EXACT:
+                    return None, tt_score, tt_depth
+                if tt_bound == BoundType.LOWER:
+                    alpha = max(alpha, tt_score)
+                else:
+                    beta = min(beta, tt_score)
+                if alpha >= beta:
+                    return None, tt_score, tt_depth
+
+        # The root's entry may have been replaced since the previous decision
+        # expected this position
+        if ply == 0 and tt_move_key is None and self._principal_variation:
+            tt_move_key = self._principal_variation[0]
+
+        # Positions without moves are never stored, so the moves are only
+        # generated once the table could not answer
+        possible_moves = position.get_color_poss_opts(current_color)
 
         # No moves available means loss
         if not possible_moves:
             return None, -float(MAX_ASSESSMENT_VALUE), 0
 
-        # Depth limit reached - evaluate the position
-        if depth <= 0:
-            return None, perspective * self._evaluate_position(game_state), 0
+        # Near the horizon, score all leaves of the subtree in one batch
+        if depth <= self.batch_depth:
+            best_move, best_value = self._batched_negamax(
+                position, repetitions, possible_moves, depth, perspective
+            )
+            self.transposition_table.store(
+                position_hash,
+                depth,
+                BoundType.EXACT,
+                self._score_to_table(best_value, ply),
+                move_key(best_move),
+            )
+            return best_move, best_value, depth
+
+        possible_moves = self.move_orderer.order_moves(
+            position, possible_moves, ply, tt_move_key
+        )
 
         # Search child nodes
         best_move: Optional[List[int]] = None
         best_value = -float(MAX_ASSESSMENT_VALUE)
         max_depth = 1
 
-        for move in possible_moves:
-            child_state = CheckersGame.get_outcome_of_move(deepcopy(game_state), move)
-            child_draw_log = self._extend_draw_log(draw_log, current_color, child_state)
-
-            _, child_value, child_depth = self._negamax(
-                game_state=child_state,
-                draw_log=child_draw_log,
-                depth=depth - 1,
-                alpha=-beta,
-                beta=-alpha,
-                perspective=-perspective,
+        for move_index, move in enumerate(possible_moves):
+            extension = self.search_policy.extension(
+                position, possible_moves, move, ply, self._root_depth
             )
+            reduction = 0
+            if move_index > 0 and not extension:
+                reduction = self.search_policy.reduction(
+                    position,
+                    move,
+                    move_index,
+                    depth,
+                    self.move_orderer.is_killer(move, ply),
+                )
+            child_search_depth = depth - 1 + extension
+            self._extensions += extension
+
+            is_irreversible = position.is_irreversible_move(move)
+            undo = position.make_move(move)
+            repetitions.push(position.zobrist_hash, is_irreversible)
+
+            if move_index == 0:
+                value, child_depth = self._search_child(
+                    position,
+                    repetitions,
+                    child_search_depth,
+                    alpha,
+                    beta,
+                    perspective,
+                    ply,
+                )
+            else:
+                # Search late moves cheaply first: reduced and, with principal
+                # variation search, with a null window that proves they are
+                # not better
+                scout_beta = beta
+                if self.principal_variation:
+                    scout_beta = alpha + NULL_WINDOW_WIDTH
+                    self._null_window_searches += 1
+                if reduction:
+                    self._reductions += 1
+
+                value, child_depth = self._search_child(
+                    position,
+                    repetitions,
+                    child_search_depth - reduction,
+                    alpha,
+                    scout_beta,
+                    perspective,
+                    ply,
+                )
+                if reduction and value > alpha:
+                    self._reduction_researches += 1
+                    value, child_depth = self._search_child(
+                        position,
+                        repetitions,
+                        child_search_depth,
+                        alpha,
+                        scout_beta,
+                        perspective,
+                        ply,
+                    )
+                if self.principal_variation and alpha < value < beta:
+                    self._researches += 1
+                    value, child_depth = self._search_child(
+                        position,
+                        repetitions,
+                        child_search_depth,
+                        alpha,
+                        beta,
+                        perspective,
+                        ply,
+                    )
+
+            repetitions.pop()
+            position.unmake_move(undo)
 
             max_depth = max(max_depth, child_depth + 1)
-            negated_value = -child_value
 
-            if negated_value > best_value:
-                best_value = negated_value
+            if best_move is None or value > best_value:
+                best_value = value
                 best_move = move
 
             alpha = max(alpha, best_value)
 
             # Alpha-beta cutoff
             if alpha >= beta:
+                self._cutoffs += 1
+                if move_index == 0:
+                    self._first_move_cutoffs += 1
+                self.move_orderer.record_cutoff(position, move, ply, depth)
                 break
 
+        if best_value <= alpha_original:
+            bound = BoundType.UPPER
+        elif best_value >= beta:
+            bound = BoundType.LOWER
+        else:
+            bound = BoundType.EXACT
+        self.transposition_table.store(
+            position_hash,
+            depth,
+            bound,
+            self._score_to_table(best_value, ply),
+            move_key(best_move),
+        )
+
         return best_move, best_value, max_depth
 
-    def _evaluate_position(self, game_state: np.ndarray) -> float:
+    def _batched_negamax(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        possible_moves: List[List[int]],
+        depth: int,
+        perspective: int,
+    ) -> Tuple[List[int], float]:
+        """Search a subtree by expanding it fully and scoring its leaves at once.
+
+        All leaves without a pending capture are collected first and scored
+        with a single batched evaluation; the Negamax values are then backed
+        up through the expanded tree. Leaves found in the evaluation cache are
+        not evaluated again, and the batch results are added to it. The
+        subtree is searched without pruning, so the value is exact.
+
+        Args:
+            position: Position at the top of the subtree; restored before
+                returning.
+            repetitions: Positions reached so far, for draw detection.
+            possible_moves: Legal moves of the position.
+            depth: Depth of the subtree.
+            perspective: 1 for maximizing, -1 for minimizing.
+
+        Returns:
+            Tuple of (best_move, evaluation_score).
+        """
+        leaves: List[Tuple[int, int, int]] = []
+        leaf_keys: List[int] = []
+        children = self._expand_subtree(
+            position, repetitions, possible_moves, depth, perspective, leaves, leaf_keys
+        )
+
+        leaf_scores: List[float] = []
+        if leaves:
+            orange, blue, kings = (
+                np.array(masks, dtype=np.uint64) for masks in zip(*leaves)
+            )
+            scores = self.evaluator.evaluate_masks(orange, blue, kings)
+            if self.evaluation_cache is not None:
+                for key, score in zip(leaf_keys, scores.tolist()):
+                    self.evaluation_cache.put(key, score)
+            if self.computer_color != Color.ORANGE:
+                scores = -scores
+            leaf_scores = scores.tolist()
+            self._batches += 1
+            self._batched_leaves += len(leaves)
+
+        best_move: Optional[List[int]] = None
+        best_value = -float(MAX_ASSESSMENT_VALUE)
+        for move, child in children:
+            value = -self._subtree_value(child, leaf_scores)
+            if best_move is None or value > best_value:
+                best_value = value
+                best_move = move
+        return best_move, best_value
+
+    def _expand_subtree(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        possible_moves: List[List[int]],
+        depth: int,
+        perspective: int,
+        leaves: List[Tuple[int, int, int]],
+        leaf_keys: List[int],
+    ) -> List[Tuple[List[int], _SubtreeNode]]:
+        """Expand every move of a position down to the given depth.
+
+        Args:
+            position: Current position; restored before returning.
+            repetitions: Positions reached so far, for draw detection.
+            possible_moves: Legal moves of the position.
+            depth: Remaining depth.
+            perspective: 1 for maximizing, -1 for minimizing.
+            leaves: Masks of the leaves to evaluate; extended in place.
+            leaf_keys: Hashes of the leaves to evaluate; extended in place.
+
+        Returns:
+            One (move, child) pair per move. A child is its known value from
+            its side to move's perspective, a (leaf index, perspective) pair
+            for a leaf awaiting evaluation, or the list of its own children.
+        """
+        children: List[Tuple[List[int], _SubtreeNode]] = []
+        for move in possible_moves:
+            is_irreversible = position.is_irreversible_move(move)
+            undo = position.make_move(move)
+            repetitions.push(position.zobrist_hash, is_irreversible)
+            self._count_node()
+
+            child: _SubtreeNode
+            if self._is_draw_by_repetition(position.zobrist_hash, repetitions):
+                child = 0.0
+            elif depth > 1:
+                replies = position.get_color_poss_opts(position.turn_of)
+                if replies:
+                    child = self._expand_subtree(
+                        position,
+                        repetitions,
+                        replies,
+                        depth - 1,
+                        -perspective,
+                        leaves,
+                        leaf_keys,
+                    )
+                else:
+                    child = -float(MAX_ASSESSMENT_VALUE)
+            else:
+                captures = position.get_captures(position.turn_of)
+                if captures:
+                    # Pending captures are resolved by the quiescence search
+                    self._quiescence_budget = self.quiescence_node_limit
+                    child = self._quiescence(
+                        position,
+                        captures,
+                        -float(MAX_ASSESSMENT_VALUE),
+                        float(MAX_ASSESSMENT_VALUE),
+                        -perspective,
+                    )
+                elif not position.has_any_move(position.turn_of):
+                    child = -float(MAX_ASSESSMENT_VALUE)
+                else:
+                    cached = self._probe_evaluation_cache(position.zobrist_hash)
+                    if cached is not None:
+                        child = -perspective * cached
+                    else:
+                        leaves.append((position.orange, position.blue, position.kings))
+                        leaf_keys.append(position.zobrist_hash)
+                        child = (len(leaves) - 1, -perspective)
+
+            repetitions.pop()
+            position.unmake_move(undo)
+            children.append((move, child))
+        return children
+
+    def _subtree_value(self, node: _SubtreeNode, leaf_scores: List[float]) -> float:
+        """Back up the Negamax value of an expanded node.
+
+        Args:
+            node: Node built by `_expand_subtree`.
+            leaf_scores: Evaluations of the leaves from the computer's
+                perspective.
+
+        Returns:
+            Value of the node from its side to move's perspective.
+        """
+        if isinstance(node, float):
+            return node
+        if isinstance(node, tuple):
+            index, perspective = node
+            return perspective * leaf_scores[index]
+
+        best_value = -float(MAX_ASSESSMENT_VALUE)
+        for _, child in node:
+            best_value = max(best_value, -self._subtree_value(child, leaf_scores))
+        return best_value
+
+    def _search_child(
+        self,
+        position: SearchPosition,
+        repetitions: RepetitionTracker,
+        depth: int,
+        alpha: float,
+        beta: float,
+        perspective: int,
+        ply: int,
+    ) -> Tuple[float, int]:
+        """Search the position reached by a move from the parent's side.
+
+        Args:
+            position: Position after the move.
+            repetitions: Positions reached so far, for draw detection.
+            depth: Remaining search depth of the child.
+            alpha: Alpha value of the parent.
+            beta: Beta value of the parent.
+            perspective: Perspective of the parent.
+            ply: Distance of the parent from the root.
+
+        Returns:
+            Tuple of (score from the parent's perspective, max depth reached).
+        """
+        _, child_value, child_depth = self._negamax(
+            position=position,
+            repetitions=repetitions,
+            depth=depth,
+            alpha=-beta,
+            beta=-alpha,
+            perspective=-perspective,
+            ply=ply + 1,
+        )
+        return -child_value, child_depth
+
+    def _quiescence(
+        self,
+        position: SearchPosition,
+        captures: List[List[int]],
+        alpha: float,
+        beta: float,
+        perspective: int,
+    ) -> float:
+        """Search capture sequences past the nominal depth.
+
+        A position is only evaluated once the side to move has no capture,
+        so the evaluation never misses a piece that is about to be taken.
+        Captures are mandatory, so there is no standing pat while one is
+        available. Every capture is irreversible, so the repetition history
+        does not need to be extended. When the node budget of the leaf runs
+        out, positions are evaluated as they are. Only captures are
+        generated; for the other positions it is enough to know that a move
+        exists.
+
+        Args:
+            position: Current position, which has a legal move; restored
+                before returning.
+            captures: Capture sequences of the position, or an empty list.
+            alpha: Alpha value for pruning.
+            beta: Beta value for pruning.
+            perspective: 1 for maximizing, -1 for minimizing.
+
+        Returns:
+            Evaluation score from the perspective of the side to move.
+        """
+        if not captures or self._quiescence_budget <= 0:
+            return perspective * self._evaluate_position(position)
+
+        best_value = -float(MAX_ASSESSMENT_VALUE)
+        for move in captures:
+            self._count_node()
+            self._quiescence_nodes += 1
+            self._quiescence_budget -= 1
+
+            undo = position.make_move(move)
+            replies = position.get_captures(position.turn_of)
+            if replies or position.has_any_move(position.turn_of):
+                value = -self._quiescence(
+                    position, replies, -beta, -alpha, -perspective
+                )
+            else:
+                value = float(MAX_ASSESSMENT_VALUE)
+            position.unmake_move(undo)
+
+            best_value = max(best_value, value)
+            alpha = max(alpha, best_value)
+            if alpha >= beta:
+                break
+
+        return best_value
+
+    def _evaluate_position(self, position: SearchPosition) -> float:
         """Evaluate the board position from the computer's perspective.
 
-        The evaluation is based on piece count, with kings weighted more heavily.
         Positive values favor the computer, negative values favor the opponent.
+        Evaluations are looked up in and added to the evaluation cache.
 
         Args:
-            game_state: Current board state.
+            position: Current board position.
 
         Returns:
             Evaluation score.
         """
+        cached = self._probe_evaluation_cache(position.zobrist_hash)
+        if cached is not None:
+            return cached
+
+        score = self.evaluator.evaluate_position(position)
+        if self.evaluation_cache is not None:
+            self.evaluation_cache.put(position.zobrist_hash, score)
         if self.computer_color == Color.ORANGE:
-            return float(np.sum(game_state))
-        return float(-np.sum(game_state))
+            return score
+        return -score
 
-    def _is_draw_by_repetition(
-        self,
-        color: Color,
-        game_state: np.ndarray,
-        draw_log: List[Tuple[Color, np.ndarray]],
-    ) -> bool:
-        """Check if the current position has repeated enough times to be a draw.
+    def _probe_evaluation_cache(self, position_hash: int) -> Optional[float]:
+        """Look up a position in the evaluation cache.
 
         Args:
-            color: The color whose turn it is.
-            game_state: Current board state.
-            draw_log: History of states.
+            position_hash: Zobrist hash of the position.
 
         Returns:
-            True if the position has repeated DRAW_REPETITION_THRESHOLD times.
+            Evaluation score from the computer's perspective, or None if the
+            position is not cached or there is no cache.
         """
-        repetition_count = sum(
-            1
-            for logged_color, logged_state in draw_log
-            if logged_color == color and np.array_equal(logged_state, game_state)
-        )
-        return repetition_count >= DRAW_REPETITION_THRESHOLD
+        if self.evaluation_cache is None:
+            return None
 
-    def _extend_draw_log(
-        self,
-        draw_log: List[Tuple[Color, np.ndarray]],
-        color: Color,
-        new_state: np.ndarray,
-    ) -> List[Tuple[Color, np.ndarray]]:
-        """Create a new draw log with the current state appended.
+        self._evaluation_cache_probes += 1
+        score = self.evaluation_cache.get(position_hash)
+        if score is None:
+            return None
+
+        self._evaluation_cache_hits += 1
+        if self.computer_color == Color.ORANGE:
+            return score
+        return -score
+
+    @staticmethod
+    def _tablebase_value(result: TablebaseResult, distance: int, ply: int) -> float:
+        """Convert a tablebase result into a search score.
+
+        Wins and losses score close to `MAX_ASSESSMENT_VALUE`, closer the
+        sooner the game ends, so the search heads for the quickest win and
+        the slowest loss.
 
         Args:
-            draw_log: Existing draw log.
-            color: The color that just moved.
-            new_state: The resulting board state.
+            result: Result for the side to move.
+            distance: Plies until the game ends with best play.
+            ply: Distance of the position from the search root.
 
         Returns:
-            A new draw log with the state appended.
+            Score from the perspective of the side to move.
+        """
+        if result == TablebaseResult.DRAW:
+            return 0.0
+
+        value = float(MAX_ASSESSMENT_VALUE - ply - distance)
+        return value if result == TablebaseResult.WIN else -value
+
+    @staticmethod
+    def _score_to_table(score: float, ply: int) -> float:
+        """Convert a score for storing it in the transposition table.
+
+        A tablebase win or loss counts the plies from the search root, which
+        differ between the paths to a position and between decisions. The
+        table holds the plies from the position itself instead.
+
+        Args:
+            score: Score from the perspective of the side to move.
+            ply: Distance of the position from the search root.
+
+        Returns:
+            Score to store.
+        """
+        if TABLEBASE_SCORE_FLOOR < abs(score) < MAX_ASSESSMENT_VALUE:
+            return score + ply if score > 0 else score - ply
+        return score
+
+    @staticmethod
+    def _score_from_table(score: float, ply: int) -> float:
+        """Convert a score read from the transposition table for a position.
+
+        Undoes `_score_to_table`.
+
+        Args:
+            score: Score stored in the table.
+            ply: Distance of the position from the search root.
+
+        Returns:
+            Score from the perspective of the side to move.
+        """
+        if TABLEBASE_SCORE_FLOOR < abs(score) < MAX_ASSESSMENT_VALUE:
+            return score - ply if score > 0 else score + ply
+        return score
+
+    def _is_draw_by_repetition(
+        self, position_hash: int, repetitions: RepetitionTracker
+    ) -> bool:
+        """Check if the current position has repeated enough times to be a draw.
+
+        The hash covers the side to move, so equal hashes mean the same
+        position with the same player to move.
+
+        Args:
+            position_hash: Zobrist hash of the current position.
+            repetitions: Positions reached since the last irreversible move.
+
+        Returns:
+            True if the position has repeated DRAW_REPETITION_THRESHOLD times.
         """
-        return draw_log + [(color, deepcopy(new_state))]
+        return repetitions.count(position_hash) >= DRAW_REPETITION_THRESHOLD
 
     def _opponent_color(self) -> Color:
         """Return the color opposite to the computer's color.
@@ -0,0 +1,219 @@
+"""Opening book for the checkers engine.
+
+The first moves of every game start from the same positions, so searching
+them again in each game is wasted time. The opening book stores good moves
+for those positions, found offline by deep self-play searches (see
+`src.checkers_game.tools.build_opening_book`), and the engine plays them
+without searching.
+
+The book is a binary file of fixed-size records sorted by position hash:
+
+    header:  magic b"CKOB", version (u16), record size (u16), record count (u32)
+    record:  position hash (u64), move key (u64), weight (u32)
+
+All numbers are little-endian. A position with several book moves has one
+record per move. The file is opened with `mmap`, so opening is instant and
+a lookup is a binary search over the records that only touches the pages
+it reads.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import random
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from src.checkers_game.bitboard import move_key
+from src.common.exceptions import OpeningBookError
+
+__all__ = ["OpeningBook", "load_opening_book", "write_opening_book"]
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_OPENING_BOOK_PATH = Path("assets") / "opening_book.bin"
+BOOK_MAGIC = b"CKOB"
+BOOK_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHHI")
+RECORD_FORMAT = struct.Struct("<QQI")
+
+
+class OpeningBook:
+    """Read-only view of an opening book file.
+
+    Can be used as a context manager, which closes the file on exit.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Open and validate a book file.
+
+        Args:
+            path: Path of the book file.
+
+        Raises:
+            OpeningBookError: If the file is not a valid opening book.
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as book_file:
+            header = book_file.read(HEADER_FORMAT.size)
+            if len(header) < HEADER_FORMAT.size:
+                raise OpeningBookError(f"{self.path} is too short for a book header.")
+
+            magic, version, record_size, self.record_count = HEADER_FORMAT.unpack(
+                header
+            )
+            if magic != BOOK_MAGIC or version != BOOK_VERSION:
+                raise OpeningBookError(f"{self.path} is not a version 1 opening book.")
+            if record_size != RECORD_FORMAT.size:
+                raise OpeningBookError(
+                    f"{self.path} has records of {record_size} bytes, "
+                    f"expected {RECORD_FORMAT.size}."
+                )
+
+            expected_size = HEADER_FORMAT.size + self.record_count * RECORD_FORMAT.size
+            book_file.seek(0, 2)
+            if book_file.tell() != expected_size:
+                raise OpeningBookError(
+                    f"{self.path} holds {book_file.tell()} bytes, "
+                    f"expected {expected_size}."
+                )
+            self._data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> OpeningBook:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of records in the book."""
+        return self.record_count
+
+    def close(self) -> None:
+        """Close the memory mapping of the file."""
+        self._data.close()
+
+    def lookup(self, position_hash: int) -> List[Tuple[int, int]]:
+        """Return the book moves of a position.
+
+        Args:
+            position_hash: Zobrist hash of the position.
+
+        Returns:
+            List of (move_key, weight) pairs, highest weight first, or an
+            empty list if the position is not in the book.
+        """
+        # Binary search for the first record of the position
+        low, high = 0, self.record_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._read_record(middle)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        entries = []
+        for index in range(low, self.record_count):
+            record_hash, key, weight = self._read_record(index)
+            if record_hash != position_hash:
+                break
+            entries.append((key, weight))
+        return entries
+
+    def choose_move(
+        self,
+        position_hash: int,
+        legal_moves: List[List[int]],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[List[int]]:
+        """Pick a book move for a position.
+
+        Book moves that are not legal in the position, which can only happen
+        with a hash collision or a stale book, are ignored.
+
+        Args:
+            position_hash: Zobrist hash of the position.
+            legal_moves: Legal moves of the position.
+            rng: Random generator to choose among the book moves in
+                proportion to their weights. If None, the move with the
+                highest weight is chosen.
+
+        Returns:
+            The book move, or None if the position has no legal book move.
+        """
+        moves_by_key = {move_key(move): move for move in legal_moves}
+        candidates = [
+            (moves_by_key[key], weight)
+            for key, weight in self.lookup(position_hash)
+            if key in moves_by_key
+        ]
+        if not candidates:
+            return None
+        if rng is None:
+            return candidates[0][0]
+
+        moves, weights = zip(*candidates)
+        return rng.choices(moves, weights=weights)[0]
+
+    def _read_record(self, index: int) -> Tuple[int, int, int]:
+        """Read the record at an index as (position hash, move key, weight)."""
+        return RECORD_FORMAT.unpack_from(
+            self._data, HEADER_FORMAT.size + index * RECORD_FORMAT.size
+        )
+
+
+def write_opening_book(
+    path: Union[str, Path], entries: Dict[int, Dict[int, int]]
+) -> int:
+    """Write an opening book file.
+
+    Args:
+        path: Path of the book file to create or overwrite.
+        entries: Book moves as {position hash: {move key: weight}}.
+
+    Returns:
+        Number of records written.
+    """
+    records = sorted(
+        (position_hash, -weight, key)
+        for position_hash, moves in entries.items()
+        for key, weight in moves.items()
+    )
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as book_file:
+        book_file.write(
+            HEADER_FORMAT.pack(
+                BOOK_MAGIC, BOOK_VERSION, RECORD_FORMAT.size, len(records)
+            )
+        )
+        for position_hash, negative_weight, key in records:
+            book_file.write(RECORD_FORMAT.pack(position_hash, key, -negative_weight))
+    return len(records)
+
+
+def load_opening_book(
+    path: Union[str, Path] = DEFAULT_OPENING_BOOK_PATH,
+) -> Optional[OpeningBook]:
+    """Open an opening book if it is available.
+
+    Args:
+        path: Path of the book file.
+
+    Returns:
+        The opened book, or None if the file does not exist or is invalid.
+    """
+    try:
+        book = OpeningBook(path)
+    except FileNotFoundError:
+        logger.info("No opening book at %s", path)
+        return None
+    except OpeningBookError as e:
+        logger.warning("Ignoring opening book: %s", e)
+        return None
+
+    logger.info("Loaded opening book %s with %d moves", path, len(book))
+    return book
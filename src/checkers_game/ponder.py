@@ -0,0 +1,169 @@
+"""Pondering: searching on the opponent's time.
+
+After the robot has moved, the opponent needs a while to think and to move a
+piece by hand. The ponderer uses that time to decide the robot's answer to
+each likely reply in a background thread, most likely reply first. When the
+actual reply arrives, a finished answer is used directly; otherwise the
+search starts from a transposition table that is already warm.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from copy import deepcopy
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.search_position import SearchPosition
+from src.checkers_game.search_stats import SearchStats
+from src.common.enums import GameStatus
+
+__all__ = ["Ponderer"]
+
+logger = logging.getLogger(__name__)
+
+# Constants
+PONDER_PAUSE_S = 0.01
+
+
+class Ponderer:
+    """Searches the robot's answers to the opponent's replies in the background.
+
+    The ponderer has its own engine with the settings of the robot's engine.
+    Both engines share one transposition table and one evaluation cache. The
+    robot's engine keeps the table for the whole game, so what the pondering
+    found is there when the robot's next decision is made.
+
+    The search sleeps for `PONDER_PAUSE_S` after every few hundred positions,
+    so the GUI and the camera keep running while the ponderer thinks.
+    """
+
+    def __init__(self, engine: NegamaxDecisionEngine) -> None:
+        """Initialize the ponderer.
+
+        Args:
+            engine: Engine that decides the robot's moves. It must not be
+                created with `keep_tables=True`, since the ponderer relies on
+                it to age the shared table as the game advances.
+        """
+        self._main_engine = engine
+        self._engine = NegamaxDecisionEngine(
+            computer_color=engine.computer_color,
+            search_depth=engine.search_depth,
+            time_budget_s=engine.time_budget_s,
+            quiescence_node_limit=engine.quiescence_node_limit,
+            principal_variation=engine.principal_variation,
+            aspiration_window=engine.aspiration_window,
+            search_policy=engine.search_policy,
+            evaluator=engine.evaluator,
+            batch_depth=engine.batch_depth,
+            evaluation_cache=engine.evaluation_cache,
+            opening_book=engine.opening_book,
+            tablebase=engine.tablebase,
+            transposition_table=engine.transposition_table,
+            keep_tables=True,
+            node_pause_s=PONDER_PAUSE_S,
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._results: Dict[int, SearchStats] = {}
+
+    def is_running(self) -> bool:
+        """Return True while the background search is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, game: CheckersGame) -> None:
+        """Start pondering on a position with the opponent to move.
+
+        Replies are searched in the robot's move ordering, with the reply
+        the robot's own search expected, taken from the transposition table,
+        searched first.
+
+        Args:
+            game: Game right after the robot's move. It is copied, so it can
+                keep changing while the ponderer runs.
+        """
+        self.stop()
+        self._results = {}
+
+        replies = self._order_replies(game)
+        self._engine.move_orderer.clear()
+        self._engine.stop_event.clear()
+
+        self._thread = threading.Thread(
+            target=self._run, args=(deepcopy(game), replies), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop pondering and wait for the background search to finish."""
+        if self._thread is None:
+            return
+
+        self._engine.request_stop()
+        self._thread.join()
+        self._thread = None
+
+    def take_result(self, game: CheckersGame) -> Optional[SearchStats]:
+        """Stop pondering and return the answer found for a position.
+
+        Args:
+            game: Game after the opponent's actual reply.
+
+        Returns:
+            Statistics of the decision, marked as pondered, with the robot's
+            move as `best_move` if pondering finished deciding it,
+            otherwise None.
+        """
+        self.stop()
+        stats = self._results.get(game.get_position_hash())
+        if stats is None or stats.best_move not in game.get_possible_opts():
+            return None
+
+        logger.info("Ponder hit: %s", stats.best_move)
+        return replace(stats, from_ponder=True)
+
+    def _order_replies(self, game: CheckersGame) -> List[List[int]]:
+        """Return the opponent's replies, most likely first.
+
+        Args:
+            game: Game with the opponent to move.
+
+        Returns:
+            The legal replies.
+        """
+        position = SearchPosition.from_array(game.get_game_state(), game.get_turn_of())
+        entry = self._main_engine.transposition_table.probe(position.zobrist_hash)
+        return self._main_engine.move_orderer.order_moves(
+            position,
+            position.get_possible_opts(),
+            0,
+            entry[3] if entry is not None else None,
+        )
+
+    def _run(self, game: CheckersGame, replies: List[List[int]]) -> None:
+        """Decide the robot's answer to each reply until stopped.
+
+        Args:
+            game: Copy of the game with the opponent to move.
+            replies: Replies to search, in order.
+        """
+        for reply in replies:
+            if self._engine.stop_event.is_set():
+                return
+
+            reply_game = deepcopy(game)
+            reply_game.perform_move(reply)
+            if reply_game.get_status() != GameStatus.IN_PROGRESS:
+                continue
+
+            stats = self._engine.decide(reply_game)
+
+            # A stopped search may not have reached its full depth
+            if stats.best_move is None or self._engine.stop_event.is_set():
+                return
+
+            self._results[reply_game.get_position_hash()] = stats
+            logger.debug("Pondered reply %s: answer %s", reply, stats.best_move)
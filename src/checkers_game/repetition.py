@@ -0,0 +1,86 @@
+"""Hash-counted repetition tracking for draw detection.
+
+A position can only repeat positions reached since the last irreversible move
+(a capture or a man move), so the tracker keeps one hash counter per such
+scope. Pushing, popping and counting are O(1), which lets the game and every
+level of the search stack share the same structure.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+__all__ = ["RepetitionTracker"]
+
+
+class RepetitionTracker:
+    """Counts position hashes reached since the last irreversible move.
+
+    Positions are pushed as moves are made and popped when they are taken
+    back, so a searcher can extend the game history along its current path
+    and restore it afterwards.
+    """
+
+    __slots__ = ("_history", "_scopes")
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        self._history: List[Tuple[int, bool]] = []
+        self._scopes: List[Dict[int, int]] = [{}]
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def push(self, position_hash: int, irreversible: bool = False) -> None:
+        """Record a newly reached position.
+
+        Args:
+            position_hash: Zobrist hash of the position, including side to move.
+            irreversible: Whether the move leading to the position was a capture
+                or a man move. Earlier positions are then no longer counted.
+        """
+        self._history.append((position_hash, irreversible))
+        if irreversible:
+            self._scopes.append({position_hash: 1})
+        else:
+            scope = self._scopes[-1]
+            scope[position_hash] = scope.get(position_hash, 0) + 1
+
+    def pop(self) -> int:
+        """Remove the most recently pushed position.
+
+        Returns:
+            Hash of the removed position.
+
+        Raises:
+            IndexError: If the tracker is empty.
+        """
+        position_hash, irreversible = self._history.pop()
+        if irreversible:
+            self._scopes.pop()
+        else:
+            scope = self._scopes[-1]
+            remaining = scope[position_hash] - 1
+            if remaining:
+                scope[position_hash] = remaining
+            else:
+                del scope[position_hash]
+        return position_hash
+
+    def count(self, position_hash: int) -> int:
+        """Return how often a position occurred since the last irreversible move.
+
+        Args:
+            position_hash: Zobrist hash of the position, including side to move.
+
+        Returns:
+            Number of occurrences in the current scope.
+        """
+        return self._scopes[-1].get(position_hash, 0)
+
+    def copy(self) -> RepetitionTracker:
+        """Return an independent copy of the tracker."""
+        tracker = RepetitionTracker()
+        tracker._history = list(self._history)
+        tracker._scopes = [dict(scope) for scope in self._scopes]
+        return tracker
@@ -0,0 +1,214 @@
+"""Depth reduction and extension policies for the Negamax search.
+
+Once moves are well ordered, moves searched late in a node rarely turn out
+best, so they can be searched less deeply first (late move reductions).
+Forcing lines, on the other hand, deserve more depth than the nominal one
+(extensions). A policy decides both for every move of the search.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List
+
+from src.checkers_game.bitboard import BLUE_PROMOTION_MASK, ORANGE_PROMOTION_MASK
+from src.checkers_game.search_position import SearchPosition
+from src.common.enums import Color
+
+__all__ = ["ReductionExtensionPolicy", "SearchPolicy"]
+
+# Constants
+LMR_TABLE_DEPTHS = 65
+LMR_TABLE_MOVES = 64
+
+
+class SearchPolicy:
+    """Base policy that searches every move to the nominal depth.
+
+    Subclasses override `extension` and `reduction` to implement a policy.
+    """
+
+    def extension(
+        self,
+        position: SearchPosition,
+        moves: List[List[int]],
+        move: List[int],
+        ply: int,
+        root_depth: int,
+    ) -> int:
+        """Return how many plies to add to the search of a move.
+
+        Args:
+            position: Position the move is played from.
+            moves: Legal moves of the position.
+            move: Move about to be searched.
+            ply: Distance of the position from the search root.
+            root_depth: Depth of the current iteration at the root.
+
+        Returns:
+            Number of extra plies.
+        """
+        return 0
+
+    def reduction(
+        self,
+        position: SearchPosition,
+        move: List[int],
+        move_index: int,
+        depth: int,
+        is_killer: bool,
+    ) -> int:
+        """Return how many plies to take off the first search of a move.
+
+        A reduced move that beats alpha is searched again at full depth.
+
+        Args:
+            position: Position the move is played from.
+            move: Move about to be searched.
+            move_index: Position of the move in the search order.
+            depth: Remaining depth of the node.
+            is_killer: Whether the move is a killer move of the node's ply.
+
+        Returns:
+            Number of plies to reduce by.
+        """
+        return 0
+
+
+class ReductionExtensionPolicy(SearchPolicy):
+    """Late move reductions with single-reply and promotion extensions.
+
+    Quiet moves searched late in a node are reduced by an amount that grows
+    with the logarithms of the remaining depth and of the move's index, taken
+    from a precomputed table. Close to the leaves a move loses at most one
+    ply, since a reduction there drops a large share of its tree. Captures,
+    promotions and killer moves are never reduced.
+
+    A node with a single legal move is extended, since the move costs the
+    side to move nothing to find and usually leads to a forced sequence. A
+    man reaching the last row is extended too. Extensions stop once the
+    search is `max_extension_ratio` times deeper than the iteration depth, so
+    chains of forced moves cannot make the search explode.
+    """
+
+    def __init__(
+        self,
+        reduction_min_depth: int = 3,
+        reduction_min_move_index: int = 4,
+        reduction_base: float = 0.5,
+        reduction_divisor: float = 2.5,
+        reduction_full_depth: int = 6,
+        single_reply_extension: bool = True,
+        promotion_extension: bool = True,
+        max_extension_ratio: int = 2,
+    ) -> None:
+        """Initialize the policy and build the reduction table.
+
+        Args:
+            reduction_min_depth: Smallest remaining depth at which moves are
+                reduced.
+            reduction_min_move_index: Index in the search order of the first
+                move that may be reduced.
+            reduction_base: Constant term of the reduction formula.
+            reduction_divisor: Divisor of the logarithmic term of the
+                reduction formula.
+            reduction_full_depth: Smallest remaining depth at which moves may
+                be reduced by more than one ply.
+            single_reply_extension: Extend nodes with a single legal move.
+            promotion_extension: Extend moves that promote a man.
+            max_extension_ratio: Extensions are only applied while the ply is
+                below this multiple of the iteration depth.
+        """
+        self.reduction_min_depth = reduction_min_depth
+        self.reduction_min_move_index = reduction_min_move_index
+        self.reduction_full_depth = reduction_full_depth
+        self.single_reply_extension = single_reply_extension
+        self.promotion_extension = promotion_extension
+        self.max_extension_ratio = max_extension_ratio
+
+        self._reductions = [
+            [
+                int(
+                    reduction_base
+                    + math.log(max(depth, 1)) * math.log(index + 1) / reduction_divisor
+                )
+                for index in range(LMR_TABLE_MOVES)
+            ]
+            for depth in range(LMR_TABLE_DEPTHS)
+        ]
+
+    def extension(
+        self,
+        position: SearchPosition,
+        moves: List[List[int]],
+        move: List[int],
+        ply: int,
+        root_depth: int,
+    ) -> int:
+        """Extend single replies and promotions.
+
+        Args:
+            position: Position the move is played from.
+            moves: Legal moves of the position.
+            move: Move about to be searched.
+            ply: Distance of the position from the search root.
+            root_depth: Depth of the current iteration at the root.
+
+        Returns:
+            1 if the move is extended, otherwise 0.
+        """
+        if ply >= self.max_extension_ratio * root_depth:
+            return 0
+        if self.single_reply_extension and len(moves) == 1:
+            return 1
+        if self.promotion_extension and self._is_promotion(position, move):
+            return 1
+        return 0
+
+    def reduction(
+        self,
+        position: SearchPosition,
+        move: List[int],
+        move_index: int,
+        depth: int,
+        is_killer: bool,
+    ) -> int:
+        """Reduce late quiet moves according to the reduction table.
+
+        Args:
+            position: Position the move is played from.
+            move: Move about to be searched.
+            move_index: Position of the move in the search order.
+            depth: Remaining depth of the node.
+            is_killer: Whether the move is a killer move of the node's ply.
+
+        Returns:
+            Number of plies to reduce by; the move keeps at least one ply.
+        """
+        if (
+            depth < self.reduction_min_depth
+            or move_index < self.reduction_min_move_index
+            or len(move) > 2
+            or is_killer
+            or self._is_promotion(position, move)
+        ):
+            return 0
+
+        reduction = self._reductions[min(depth, LMR_TABLE_DEPTHS - 1)][
+            min(move_index, LMR_TABLE_MOVES - 1)
+        ]
+        if depth < self.reduction_full_depth:
+            reduction = min(reduction, 1)
+        return min(reduction, depth - 2)
+
+    @staticmethod
+    def _is_promotion(position: SearchPosition, move: List[int]) -> bool:
+        """Check if a move takes a man to the last row."""
+        start = move[0] - 1
+        end = move[-1] - 1
+        promotion_mask = (
+            ORANGE_PROMOTION_MASK
+            if position.turn_of == Color.ORANGE
+            else BLUE_PROMOTION_MASK
+        )
+        return bool(~position.kings >> start & 1 and promotion_mask >> end & 1)
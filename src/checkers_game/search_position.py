@@ -0,0 +1,198 @@
+"""Mutable search position for the checkers engine.
+
+This module extends the bitboard representation with the side to move and an
+in-place make/unmake move API. Searchers apply a move, recurse, and restore the
+position from the returned undo record instead of copying the board per node.
+"""
+
+from __future__ import annotations
+
+from typing import List, NamedTuple
+
+import numpy as np
+
+from src.checkers_game.bitboard import (
+    BLUE_PROMOTION_MASK,
+    ORANGE_PROMOTION_MASK,
+    BitboardPosition,
+)
+from src.checkers_game.zobrist import (
+    BLUE_KING_KEYS,
+    BLUE_MAN_KEYS,
+    ORANGE_KING_KEYS,
+    ORANGE_MAN_KEYS,
+    SIDE_TO_MOVE_KEY,
+    hash_position,
+)
+from src.common.enums import Color
+
+__all__ = ["SearchPosition", "UndoRecord"]
+
+
+class UndoRecord(NamedTuple):
+    """State needed to take back a move made on a `SearchPosition`.
+
+    Attributes:
+        orange: Orange mask before the move.
+        blue: Blue mask before the move.
+        kings: Kings mask before the move.
+        turn_of: Side to move before the move.
+        zobrist_hash: Position hash before the move.
+    """
+
+    orange: int
+    blue: int
+    kings: int
+    turn_of: Color
+    zobrist_hash: int
+
+
+class SearchPosition(BitboardPosition):
+    """Bitboard position with side to move and in-place make/unmake.
+
+    Attributes:
+        turn_of: Color of the player whose turn it is.
+        zobrist_hash: Zobrist hash of the pieces and the side to move,
+            updated incrementally by `make_move`.
+    """
+
+    __slots__ = ("turn_of", "zobrist_hash")
+
+    def __init__(
+        self,
+        orange: int = 0,
+        blue: int = 0,
+        kings: int = 0,
+        turn_of: Color = Color.BLUE,
+    ) -> None:
+        """Initialize a search position from raw masks.
+
+        Args:
+            orange: Mask of orange pieces.
+            blue: Mask of blue pieces.
+            kings: Mask of kings (subset of orange | blue).
+            turn_of: Side to move.
+        """
+        super().__init__(orange, blue, kings)
+        self.turn_of = turn_of
+        self.zobrist_hash = hash_position(self, turn_of)
+
+    @classmethod
+    def from_array(
+        cls, game_state: np.ndarray, turn_of: Color = Color.BLUE
+    ) -> SearchPosition:
+        """Build a search position from the 8x8 `CheckersGame` board.
+
+        Args:
+            game_state: 8x8 board indexed as `game_state[x][y]`.
+            turn_of: Side to move.
+
+        Returns:
+            Equivalent search position.
+        """
+        board = BitboardPosition.from_array(game_state)
+        return cls(board.orange, board.blue, board.kings, turn_of)
+
+    def copy(self) -> SearchPosition:
+        """Return an independent copy of the position."""
+        return SearchPosition(self.orange, self.blue, self.kings, self.turn_of)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SearchPosition):
+            return NotImplemented
+        return (
+            self.orange == other.orange
+            and self.blue == other.blue
+            and self.kings == other.kings
+            and self.turn_of == other.turn_of
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.orange, self.blue, self.kings, self.turn_of))
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchPosition(orange={self.orange:#010x}, "
+            f"blue={self.blue:#010x}, kings={self.kings:#010x}, "
+            f"turn_of={self.turn_of.name})"
+        )
+
+    def get_possible_opts(self) -> List[List[int]]:
+        """Return all possible moves for the side to move."""
+        return self.get_color_poss_opts(self.turn_of)
+
+    def make_move(self, move: List[int]) -> UndoRecord:
+        """Apply a move in place and pass the turn to the opponent.
+
+        Args:
+            move: Sequence of tile IDs representing the move.
+
+        Returns:
+            Record that restores the position when passed to `unmake_move`.
+        """
+        kings = self.kings
+        undo = UndoRecord(
+            self.orange, self.blue, kings, self.turn_of, self.zobrist_hash
+        )
+
+        start_square = move[0] - 1
+        end_square = move[-1] - 1
+        start_bit = 1 << start_square
+        end_bit = 1 << end_square
+
+        if self.turn_of == Color.ORANGE:
+            man_keys, king_keys = ORANGE_MAN_KEYS, ORANGE_KING_KEYS
+            opponent_man_keys, opponent_king_keys = BLUE_MAN_KEYS, BLUE_KING_KEYS
+            promotion_mask = ORANGE_PROMOTION_MASK
+        else:
+            man_keys, king_keys = BLUE_MAN_KEYS, BLUE_KING_KEYS
+            opponent_man_keys, opponent_king_keys = ORANGE_MAN_KEYS, ORANGE_KING_KEYS
+            promotion_mask = BLUE_PROMOTION_MASK
+
+        zobrist_hash = self.zobrist_hash ^ SIDE_TO_MOVE_KEY
+        captured = 0
+        for tile in move[1:-1]:
+            if tile < 0:
+                square = -tile - 1
+                captured |= 1 << square
+                if kings >> square & 1:
+                    zobrist_hash ^= opponent_king_keys[square]
+                else:
+                    zobrist_hash ^= opponent_man_keys[square]
+
+        if kings & start_bit:
+            zobrist_hash ^= king_keys[start_square] ^ king_keys[end_square]
+            kings = (kings & ~(start_bit | captured)) | end_bit
+        elif end_bit & promotion_mask:
+            zobrist_hash ^= man_keys[start_square] ^ king_keys[end_square]
+            kings = (kings & ~captured) | end_bit
+        else:
+            zobrist_hash ^= man_keys[start_square] ^ man_keys[end_square]
+            kings &= ~captured
+
+        if self.turn_of == Color.ORANGE:
+            self.orange = (self.orange & ~start_bit) | end_bit
+            self.blue &= ~captured
+            self.turn_of = Color.BLUE
+        else:
+            self.blue = (self.blue & ~start_bit) | end_bit
+            self.orange &= ~captured
+            self.turn_of = Color.ORANGE
+
+        self.kings = kings
+        self.zobrist_hash = zobrist_hash
+        return undo
+
+    def unmake_move(self, undo: UndoRecord) -> None:
+        """Take back the move that produced an undo record.
+
+        Args:
+            undo: Record returned by the matching `make_move` call.
+        """
+        (
+            self.orange,
+            self.blue,
+            self.kings,
+            self.turn_of,
+            self.zobrist_hash,
+        ) = undo
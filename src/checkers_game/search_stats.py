@@ -0,0 +1,210 @@
+"""Statistics collected by the decision engine for a single decision."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+__all__ = ["SearchStats"]
+
+
+def _plain_move(move: List[int]) -> List[int]:
+    """Return a move with its tiles as Python ints, not NumPy integers."""
+    return [int(tile) for tile in move]
+
+
+def _format_move(move: List[int]) -> str:
+    """Write a move in checkers notation, e.g. "9-13" or "9x18x27"."""
+    separator = "x" if len(move) > 2 else "-"
+    return separator.join(str(tile) for tile in move if tile > 0)
+
+
+@dataclass
+class SearchStats:
+    """Summary of the search behind one decision.
+
+    Attributes:
+        best_move: Move chosen by the engine.
+        score: Score of the chosen move from the engine's perspective.
+        depth_reached: Depth of the last completed iteration.
+        nodes: Number of positions visited by the search.
+        worker_nodes: Number of positions visited by the worker processes
+            of a parallel search, which are not counted in `nodes`.
+        elapsed_s: Wall-clock time spent deciding, in seconds.
+        cutoffs: Number of beta cutoffs.
+        first_move_cutoffs: Number of beta cutoffs caused by the first move
+            searched, a measure of move ordering quality.
+        quiescence_nodes: Number of the visited positions that were searched
+            by the quiescence search past the nominal depth.
+        null_window_searches: Number of moves searched with a null window by
+            the principal variation search.
+        researches: Number of null-window searches that had to be repeated
+            with a full window because the move turned out better.
+        aspiration_researches: Number of iterations repeated because the
+            score fell outside the aspiration window.
+        reductions: Number of moves first searched at reduced depth.
+        reduction_researches: Number of reduced moves searched again at full
+            depth because they turned out better.
+        extensions: Number of moves searched deeper than the nominal depth.
+        batches: Number of batched leaf evaluations.
+        batched_leaves: Number of leaves scored by batched evaluations.
+        evaluation_cache_probes: Number of static evaluations looked up in
+            the evaluation cache.
+        evaluation_cache_hits: Number of lookups answered by the cache.
+        tablebase_hits: Number of positions scored by the endgame tablebase.
+        tt_probes: Number of transposition table lookups.
+        tt_hits: Number of lookups that found the position.
+        iteration_times_s: Time taken by each completed iteration of the
+            iterative deepening, in seconds.
+        iteration_nodes: Positions visited by each completed iteration.
+        principal_variation: Expected continuation, starting with the chosen
+            move, as far as the transposition table still holds it.
+        from_book: Whether the move was taken from the opening book without
+            searching.
+        from_ponder: Whether the move was found while pondering on the
+            opponent's time.
+    """
+
+    best_move: Optional[List[int]] = None
+    score: float = 0.0
+    depth_reached: int = 0
+    nodes: int = 0
+    worker_nodes: int = 0
+    elapsed_s: float = 0.0
+    cutoffs: int = 0
+    first_move_cutoffs: int = 0
+    quiescence_nodes: int = 0
+    null_window_searches: int = 0
+    researches: int = 0
+    aspiration_researches: int = 0
+    reductions: int = 0
+    reduction_researches: int = 0
+    extensions: int = 0
+    batches: int = 0
+    batched_leaves: int = 0
+    evaluation_cache_probes: int = 0
+    evaluation_cache_hits: int = 0
+    tablebase_hits: int = 0
+    tt_probes: int = 0
+    tt_hits: int = 0
+    iteration_times_s: List[float] = field(default_factory=list)
+    iteration_nodes: List[int] = field(default_factory=list)
+    principal_variation: List[List[int]] = field(default_factory=list)
+    from_book: bool = False
+    from_ponder: bool = False
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Return the search speed in nodes per second."""
+        if self.elapsed_s <= 0.0:
+            return 0.0
+        return self.nodes / self.elapsed_s
+
+    @property
+    def branching_factor(self) -> float:
+        """Return the effective branching factor of the search.
+
+        The ratio between the nodes of the last two completed iterations,
+        that is how much one more ply of depth costs; 0.0 with fewer than
+        two iterations.
+        """
+        if len(self.iteration_nodes) < 2 or self.iteration_nodes[-2] == 0:
+            return 0.0
+        return self.iteration_nodes[-1] / self.iteration_nodes[-2]
+
+    @property
+    def tt_hit_rate(self) -> float:
+        """Return the fraction of transposition table lookups that hit."""
+        if self.tt_probes == 0:
+            return 0.0
+        return self.tt_hits / self.tt_probes
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Return the fraction of cutoffs caused by the first move searched."""
+        if self.cutoffs == 0:
+            return 0.0
+        return self.first_move_cutoffs / self.cutoffs
+
+    @property
+    def research_rate(self) -> float:
+        """Return the fraction of null-window searches that were repeated."""
+        if self.null_window_searches == 0:
+            return 0.0
+        return self.researches / self.null_window_searches
+
+    @property
+    def evaluation_cache_hit_rate(self) -> float:
+        """Return the fraction of evaluation cache lookups that hit."""
+        if self.evaluation_cache_probes == 0:
+            return 0.0
+        return self.evaluation_cache_hits / self.evaluation_cache_probes
+
+    def add_counters(self, other: SearchStats) -> None:
+        """Add the node and cutoff counters of another search to this one.
+
+        Args:
+            other: Statistics of a search of part of the same tree.
+        """
+        self.nodes += other.nodes
+        self.worker_nodes += other.worker_nodes
+        self.cutoffs += other.cutoffs
+        self.first_move_cutoffs += other.first_move_cutoffs
+        self.quiescence_nodes += other.quiescence_nodes
+        self.null_window_searches += other.null_window_searches
+        self.researches += other.researches
+        self.aspiration_researches += other.aspiration_researches
+        self.reductions += other.reductions
+        self.reduction_researches += other.reduction_researches
+        self.extensions += other.extensions
+        self.batches += other.batches
+        self.batched_leaves += other.batched_leaves
+        self.evaluation_cache_probes += other.evaluation_cache_probes
+        self.evaluation_cache_hits += other.evaluation_cache_hits
+        self.tablebase_hits += other.tablebase_hits
+        self.tt_probes += other.tt_probes
+        self.tt_hits += other.tt_hits
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics and the rates derived from them.
+
+        The score and the moves may hold NumPy scalars, which come from the
+        batched evaluation and the board arrays, so they are converted to
+        Python numbers here; any other value that JSON cannot hold is left
+        as it is and makes the serialization fail.
+
+        Returns:
+            Dictionary of plain values, ready to be serialized as JSON.
+        """
+        record = asdict(self)
+        record.update(
+            best_move=(
+                _plain_move(self.best_move) if self.best_move is not None else None
+            ),
+            score=float(self.score),
+            principal_variation=[
+                _plain_move(move) for move in self.principal_variation
+            ],
+            nodes_per_second=self.nodes_per_second,
+            branching_factor=self.branching_factor,
+            tt_hit_rate=self.tt_hit_rate,
+            first_move_cutoff_rate=self.first_move_cutoff_rate,
+            research_rate=self.research_rate,
+            evaluation_cache_hit_rate=self.evaluation_cache_hit_rate,
+        )
+        return record
+
+    def summary(self) -> str:
+        """Return a one-line description of the decision for display."""
+        if self.from_book:
+            return f"Move {self.best_move} from the opening book"
+
+        source = " (pondered)" if self.from_ponder else ""
+        return (
+            f"Move {self.best_move}{source}: score {self.score:.0f}, "
+            f"depth {self.depth_reached}, {self.nodes} nodes in "
+            f"{self.elapsed_s:.2f}s ({self.nodes_per_second:.0f} nps), "
+            f"branching {self.branching_factor:.1f}, "
+            f"TT hits {100.0 * self.tt_hit_rate:.0f}%, "
+            f"PV {' '.join(_format_move(move) for move in self.principal_variation)}"
+        )
@@ -0,0 +1,73 @@
+"""JSON-lines log of the robot's decisions.
+
+Every decision of the robot is appended to the log as one JSON object per
+line: when it was made, in which game and at which move, and the statistics
+of its search (see `SearchStats.to_dict`). The log shows whether a slow
+robot turn was spent searching, and lets the search behaviour be compared
+between games or engine versions.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Self, Union
+
+from src.checkers_game.search_stats import SearchStats
+
+__all__ = ["SearchTelemetryLog"]
+
+# Constants
+DEFAULT_TELEMETRY_PATH = Path("logs") / "search_telemetry.jsonl"
+
+
+class SearchTelemetryLog:
+    """Appends decision records to a JSON-lines file.
+
+    The file is opened for every record and closed right after it, so it is
+    complete even if the application is killed. Can be used as a context
+    manager, which stops the log on exit.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_TELEMETRY_PATH) -> None:
+        """Create the directory of the log file if needed.
+
+        Args:
+            path: Path of the log file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop logging; later records are dropped."""
+        with self._lock:
+            self._closed = True
+
+    def record(self, stats: SearchStats, **context: Any) -> None:
+        """Append the record of one decision.
+
+        Args:
+            stats: Statistics of the decision.
+            **context: Further values to store with the record, such as the
+                game ID or the move number.
+
+        Raises:
+            TypeError: If a value cannot be serialized as JSON.
+        """
+        entry = {"timestamp": time.time(), **context, **stats.to_dict()}
+        line = json.dumps(entry)
+        with self._lock:
+            if self._closed:
+                return
+            with open(self.path, "a", encoding="utf-8") as log_file:
+                log_file.write(line + "\n")
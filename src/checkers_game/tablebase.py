@@ -0,0 +1,201 @@
+"""Endgame tablebase for the checkers engine.
+
+With few pieces left, mostly kings, the search sees long sequences of king
+moves without captures and can neither find the win nor prove the draw
+before the repetition rule ends the game. The tablebase holds the exact
+result of every position with up to a given number of pieces, computed
+offline by retrograde analysis (see `src.checkers_game.tools.build_tablebase`),
+so the search can stop at such positions.
+
+The file stores one entry per position, keyed by its Zobrist hash, in three
+arrays:
+
+    header:     magic b"CKTB", version (u16), max pieces (u16), count (u64)
+    keys:       position hashes (u64), sorted
+    distances:  plies until the game ends with best play (u16)
+    results:    `TablebaseResult` for the side to move (u8)
+
+All numbers are little-endian. The file is opened with `mmap` and the
+arrays are read in place, so a probe is a binary search that only touches
+the pages it reads.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import struct
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from src.common.enums import TablebaseResult
+from src.common.exceptions import TablebaseError
+
+__all__ = ["EndgameTablebase", "load_tablebase", "write_tablebase"]
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_TABLEBASE_PATH = Path("assets") / "endgame_tablebase.bin"
+TABLEBASE_MAGIC = b"CKTB"
+TABLEBASE_VERSION = 1
+HEADER_FORMAT = struct.Struct("<4sHHQ")
+KEY_DTYPE = np.dtype("<u8")
+DISTANCE_DTYPE = np.dtype("<u2")
+RESULT_DTYPE = np.dtype("u1")
+ENTRY_SIZE_BYTES = KEY_DTYPE.itemsize + DISTANCE_DTYPE.itemsize + RESULT_DTYPE.itemsize
+
+
+class EndgameTablebase:
+    """Read-only view of an endgame tablebase file.
+
+    Can be used as a context manager, which closes the file on exit.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Open and validate a tablebase file.
+
+        Args:
+            path: Path of the tablebase file.
+
+        Raises:
+            TablebaseError: If the file is not a valid tablebase.
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as tablebase_file:
+            header = tablebase_file.read(HEADER_FORMAT.size)
+            if len(header) < HEADER_FORMAT.size:
+                raise TablebaseError(f"{self.path} is too short for a header.")
+
+            magic, version, self.max_pieces, count = HEADER_FORMAT.unpack(header)
+            if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+                raise TablebaseError(f"{self.path} is not a version 1 tablebase.")
+
+            expected_size = HEADER_FORMAT.size + count * ENTRY_SIZE_BYTES
+            tablebase_file.seek(0, 2)
+            if tablebase_file.tell() != expected_size:
+                raise TablebaseError(
+                    f"{self.path} holds {tablebase_file.tell()} bytes, "
+                    f"expected {expected_size}."
+                )
+            self._data = mmap.mmap(tablebase_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        offset = HEADER_FORMAT.size
+        self._keys = np.frombuffer(self._data, KEY_DTYPE, count, offset)
+        offset += count * KEY_DTYPE.itemsize
+        self._distances = np.frombuffer(self._data, DISTANCE_DTYPE, count, offset)
+        offset += count * DISTANCE_DTYPE.itemsize
+        self._results = np.frombuffer(self._data, RESULT_DTYPE, count, offset)
+
+    def __enter__(self) -> EndgameTablebase:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Worker processes reopen the file instead of copying its contents
+        return (EndgameTablebase, (self.path,))
+
+    def __len__(self) -> int:
+        """Return the number of positions in the tablebase."""
+        return len(self._keys)
+
+    def close(self) -> None:
+        """Close the memory mapping of the file."""
+        # The arrays export the mapping's buffer and must go first
+        del self._keys, self._distances, self._results
+        self._data.close()
+
+    def covers(self, orange: int, blue: int) -> bool:
+        """Check whether a position has few enough pieces to be in the tablebase.
+
+        Args:
+            orange: Mask of orange pieces.
+            blue: Mask of blue pieces.
+
+        Returns:
+            True if the position has at most `max_pieces` pieces.
+        """
+        return (orange | blue).bit_count() <= self.max_pieces
+
+    def probe(self, position_hash: int) -> Optional[Tuple[TablebaseResult, int]]:
+        """Look up a position.
+
+        Args:
+            position_hash: Zobrist hash of the position.
+
+        Returns:
+            Tuple of (result for the side to move, plies until the game ends
+            with best play), or None if the position is not stored.
+        """
+        index = int(np.searchsorted(self._keys, np.uint64(position_hash)))
+        if index == len(self._keys) or int(self._keys[index]) != position_hash:
+            return None
+        return TablebaseResult(int(self._results[index])), int(self._distances[index])
+
+
+def write_tablebase(
+    path: Union[str, Path],
+    max_pieces: int,
+    keys: np.ndarray,
+    results: np.ndarray,
+    distances: np.ndarray,
+) -> None:
+    """Write a tablebase file.
+
+    Args:
+        path: Path of the file to create or overwrite.
+        max_pieces: Largest number of pieces of the stored positions.
+        keys: Position hashes, in any order.
+        results: `TablebaseResult` of each position.
+        distances: Plies until the game ends for each position.
+    """
+    order = np.argsort(keys)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as tablebase_file:
+        tablebase_file.write(
+            HEADER_FORMAT.pack(
+                TABLEBASE_MAGIC, TABLEBASE_VERSION, max_pieces, len(keys)
+            )
+        )
+        tablebase_file.write(keys[order].astype(KEY_DTYPE).tobytes())
+        tablebase_file.write(distances[order].astype(DISTANCE_DTYPE).tobytes())
+        tablebase_file.write(results[order].astype(RESULT_DTYPE).tobytes())
+
+
+def load_tablebase(
+    path: Union[str, Path] = DEFAULT_TABLEBASE_PATH,
+) -> Optional[EndgameTablebase]:
+    """Open an endgame tablebase if it is available.
+
+    Args:
+        path: Path of the tablebase file.
+
+    Returns:
+        The opened tablebase, or None if the file does not exist or is
+        invalid.
+    """
+    try:
+        tablebase = EndgameTablebase(path)
+    except FileNotFoundError:
+        logger.warning(
+            "No endgame tablebase at %s; endgames are searched without it. "
+            "Build it with `python -m src.checkers_game.tools.build_tablebase`.",
+            path,
+        )
+        return None
+    except TablebaseError as e:
+        logger.warning("Ignoring endgame tablebase: %s", e)
+        return None
+
+    logger.info(
+        "Loaded endgame tablebase %s with %d positions of up to %d pieces",
+        path,
+        len(tablebase),
+        tablebase.max_pieces,
+    )
+    return tablebase
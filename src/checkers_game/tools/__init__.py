@@ -0,0 +1,5 @@
+"""Command-line tools for measuring and checking the checkers engine.
+
+Run a tool as a module from the repository root, for example
+``python -m src.checkers_game.tools.parallel_benchmark``.
+"""
@@ -0,0 +1,317 @@
+"""Headless arena for engine-versus-engine matches.
+
+Two engine configurations play a number of games against each other
+without the robot or the camera, spread over a pool of worker processes.
+Every game starts with a few random legal moves, so the games cover many
+different openings. Each opening is played twice, once with each engine as
+orange, so neither side profits from a lucky opening.
+
+The report shows the candidate's wins, draws and losses, the Elo difference
+to the baseline with its 95% confidence margin, and each side's average
+time per move and search speed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.tools.search_comparison import SEARCH_CONFIGURATIONS
+from src.checkers_game.tools.self_play import DEFAULT_MAX_PLIES, MatchResult
+from src.common.enums import Color, GameStatus
+
+__all__ = [
+    "ArenaResult",
+    "SideTotals",
+    "elo_difference",
+    "random_opening",
+    "run_arena",
+]
+
+# Constants
+DEFAULT_GAMES = 40
+DEFAULT_DEPTH = 4
+DEFAULT_OPENING_PLIES = 4
+DEFAULT_SEED = 0
+ELO_SCALE = 400.0
+CONFIDENCE_Z = 1.96
+
+
+@dataclass
+class SideTotals:
+    """Search totals of one engine over all its moves.
+
+    Attributes:
+        moves: Number of moves decided.
+        elapsed_s: Total time spent deciding, in seconds.
+        nodes: Total number of positions searched.
+    """
+
+    moves: int = 0
+    elapsed_s: float = 0.0
+    nodes: int = 0
+
+    @property
+    def time_per_move(self) -> float:
+        """Return the average time per move in seconds."""
+        if self.moves == 0:
+            return 0.0
+        return self.elapsed_s / self.moves
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Return the search speed in nodes per second."""
+        if self.elapsed_s <= 0.0:
+            return 0.0
+        return self.nodes / self.elapsed_s
+
+    def add(self, other: SideTotals) -> None:
+        """Add the totals of another game to these.
+
+        Args:
+            other: Totals to add.
+        """
+        self.moves += other.moves
+        self.elapsed_s += other.elapsed_s
+        self.nodes += other.nodes
+
+
+@dataclass
+class ArenaResult:
+    """Results of an arena match from the candidate's point of view.
+
+    Attributes:
+        match: Wins, draws and losses of the candidate.
+        candidate: Search totals of the candidate.
+        baseline: Search totals of the baseline.
+    """
+
+    match: MatchResult = field(default_factory=MatchResult)
+    candidate: SideTotals = field(default_factory=SideTotals)
+    baseline: SideTotals = field(default_factory=SideTotals)
+
+    @property
+    def elo(self) -> float:
+        """Return the candidate's Elo difference to the baseline."""
+        return elo_difference(self.match.score)
+
+    @property
+    def elo_margin(self) -> float:
+        """Return the half-width of the 95% confidence interval of the Elo."""
+        games = self.match.games
+        if games == 0 or math.isinf(self.elo):
+            return math.inf
+
+        score = self.match.score
+        variance = (
+            self.match.wins * (1.0 - score) ** 2
+            + self.match.draws * (0.5 - score) ** 2
+            + self.match.losses * score**2
+        ) / games
+        margin = CONFIDENCE_Z * math.sqrt(variance / games)
+        return (
+            elo_difference(min(score + margin, 1.0))
+            - elo_difference(max(score - margin, 0.0))
+        ) / 2
+
+
+def elo_difference(score: float) -> float:
+    """Convert a match score into an Elo difference.
+
+    Args:
+        score: Fraction of the points won, counting a draw as half.
+
+    Returns:
+        Elo difference; infinite for a score of 0 or 1.
+    """
+    if score <= 0.0:
+        return -math.inf
+    if score >= 1.0:
+        return math.inf
+    return -ELO_SCALE * math.log10(1.0 / score - 1.0)
+
+
+def random_opening(plies: int, seed: int) -> CheckersGame:
+    """Play random legal moves from the initial position.
+
+    Args:
+        plies: Number of random moves.
+        seed: Seed of the random choices.
+
+    Returns:
+        The game after the random moves, or earlier if it ended.
+    """
+    rng = random.Random(seed)
+    game = CheckersGame()
+    for _ in range(plies):
+        if game.get_status() != GameStatus.IN_PROGRESS:
+            break
+        game.perform_move(rng.choice(game.get_possible_opts()))
+    return game
+
+
+def _play_arena_game(
+    candidate_kwargs: Dict[str, Any],
+    baseline_kwargs: Dict[str, Any],
+    candidate_color: Color,
+    opening_plies: int,
+    seed: int,
+    max_plies: int,
+) -> Tuple[Optional[bool], SideTotals, SideTotals]:
+    """Play one arena game in a worker process.
+
+    Args:
+        candidate_kwargs: Engine keyword arguments of the candidate.
+        baseline_kwargs: Engine keyword arguments of the baseline.
+        candidate_color: Color played by the candidate.
+        opening_plies: Number of random opening moves.
+        seed: Seed of the opening.
+        max_plies: Number of plies after which the game counts as a draw.
+
+    Returns:
+        Tuple of (True if the candidate won, False if it lost, None for a
+        draw; candidate totals; baseline totals).
+    """
+    baseline_color = Color.BLUE if candidate_color == Color.ORANGE else Color.ORANGE
+    engines = {
+        candidate_color: NegamaxDecisionEngine(candidate_color, **candidate_kwargs),
+        baseline_color: NegamaxDecisionEngine(baseline_color, **baseline_kwargs),
+    }
+    totals = {candidate_color: SideTotals(), baseline_color: SideTotals()}
+
+    game = random_opening(opening_plies, seed)
+    for _ in range(max_plies):
+        if game.get_status() != GameStatus.IN_PROGRESS:
+            break
+
+        color = game.get_turn_of()
+        start_time = time.perf_counter()
+        move = engines[color].decide_move(game)
+        totals[color].elapsed_s += time.perf_counter() - start_time
+        totals[color].nodes += engines[color].get_last_stats().nodes
+        totals[color].moves += 1
+        game.perform_move(move)
+
+    winner = None
+    if game.get_status() == GameStatus.WON:
+        winner = game.get_winning_player() == candidate_color
+    return winner, totals[candidate_color], totals[baseline_color]
+
+
+def run_arena(
+    candidate_kwargs: Dict[str, Any],
+    baseline_kwargs: Dict[str, Any],
+    games: int = DEFAULT_GAMES,
+    opening_plies: int = DEFAULT_OPENING_PLIES,
+    workers: Optional[int] = None,
+    seed: int = DEFAULT_SEED,
+    max_plies: int = DEFAULT_MAX_PLIES,
+) -> ArenaResult:
+    """Play a match between two engine configurations.
+
+    Args:
+        candidate_kwargs: Engine keyword arguments of the candidate, without
+            the computer color.
+        baseline_kwargs: Engine keyword arguments of the baseline, without
+            the computer color.
+        games: Number of games; consecutive pairs share an opening.
+        opening_plies: Number of random opening moves of every game.
+        workers: Number of worker processes; defaults to the CPU count.
+        seed: Seed of the first opening; later openings use the next seeds.
+        max_plies: Number of plies after which a game counts as a draw.
+
+    Returns:
+        Results from the candidate's point of view.
+    """
+    tasks: List[Tuple[Any, ...]] = [
+        (
+            candidate_kwargs,
+            baseline_kwargs,
+            Color.ORANGE if index % 2 == 0 else Color.BLUE,
+            opening_plies,
+            seed + index // 2,
+            max_plies,
+        )
+        for index in range(games)
+    ]
+
+    result = ArenaResult()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [executor.submit(_play_arena_game, *task) for task in tasks]
+        for future in futures:
+            winner, candidate_totals, baseline_totals = future.result()
+            if winner is None:
+                result.match.draws += 1
+            elif winner:
+                result.match.wins += 1
+            else:
+                result.match.losses += 1
+            result.candidate.add(candidate_totals)
+            result.baseline.add(baseline_totals)
+    return result
+
+
+def main() -> None:
+    """Play the match and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("candidate", choices=list(SEARCH_CONFIGURATIONS))
+    parser.add_argument("baseline", choices=list(SEARCH_CONFIGURATIONS))
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES)
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument("--candidate-depth", type=int, default=None)
+    parser.add_argument("--baseline-depth", type=int, default=None)
+    parser.add_argument("--candidate-time", type=float, default=None)
+    parser.add_argument("--baseline-time", type=float, default=None)
+    parser.add_argument("--opening-plies", type=int, default=DEFAULT_OPENING_PLIES)
+    parser.add_argument("--max-plies", type=int, default=DEFAULT_MAX_PLIES)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    candidate_kwargs = {
+        **SEARCH_CONFIGURATIONS[args.candidate],
+        "search_depth": args.candidate_depth or args.depth,
+        "time_budget_s": args.candidate_time,
+    }
+    baseline_kwargs = {
+        **SEARCH_CONFIGURATIONS[args.baseline],
+        "search_depth": args.baseline_depth or args.depth,
+        "time_budget_s": args.baseline_time,
+    }
+    result = run_arena(
+        candidate_kwargs,
+        baseline_kwargs,
+        args.games,
+        args.opening_plies,
+        args.workers,
+        args.seed,
+        args.max_plies,
+    )
+
+    match = result.match
+    print(
+        f"{args.candidate} vs {args.baseline}: +{match.wins} ={match.draws} "
+        f"-{match.losses} (score {match.score:.1%}, "
+        f"Elo {result.elo:+.0f} +/- {result.elo_margin:.0f})"
+    )
+    for name, totals in (
+        (args.candidate, result.candidate),
+        (args.baseline, result.baseline),
+    ):
+        print(
+            f"  {name:<16} {totals.moves:>5} moves, "
+            f"{totals.time_per_move * 1000:>7.1f} ms/move, "
+            f"{totals.nodes_per_second:>8.0f} nodes/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Build the opening book from deep self-play searches.
+
+Self-play games start from the initial position. For the first plies of
+each game, the side to move searches the position deeply and the move it
+finds is added to the book. Each game searches to a depth drawn from the
+given depths, so positions where the depths disagree get several book
+moves, weighted by how many games chose each one. To reach more than one
+line, the move played is replaced by a random legal move with the given
+exploration probability; random moves are played but not added to the
+book. Search results are reused for positions and depths already searched.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from src.checkers_game.bitboard import move_key
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.opening_book import (
+    DEFAULT_OPENING_BOOK_PATH,
+    write_opening_book,
+)
+from src.common.enums import Color, GameStatus
+
+__all__ = ["build_opening_book"]
+
+# Constants
+DEFAULT_GAMES = 32
+DEFAULT_BOOK_PLIES = 10
+DEFAULT_DEPTHS = (8, 9)
+DEFAULT_EXPLORATION = 0.25
+DEFAULT_SEED = 0
+
+
+def build_opening_book(
+    games: int = DEFAULT_GAMES,
+    plies: int = DEFAULT_BOOK_PLIES,
+    depths: Sequence[int] = DEFAULT_DEPTHS,
+    exploration: float = DEFAULT_EXPLORATION,
+    seed: int = DEFAULT_SEED,
+) -> Dict[int, Dict[int, int]]:
+    """Play the self-play games and collect the book moves.
+
+    Args:
+        games: Number of self-play games.
+        plies: Number of plies of each game covered by the book.
+        depths: Search depths; each game uses one of them for both sides.
+        exploration: Probability of playing a random move instead of the
+            searched one.
+        seed: Seed of the random choices.
+
+    Returns:
+        Book moves as {position hash: {move key: weight}}.
+    """
+    rng = random.Random(seed)
+    engines = {
+        (color, depth): NegamaxDecisionEngine(color, depth)
+        for color in (Color.ORANGE, Color.BLUE)
+        for depth in depths
+    }
+    searched: Dict[Tuple[int, int], List[int]] = {}
+    entries: Dict[int, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    for _ in range(games):
+        depth = rng.choice(depths)
+        game = CheckersGame()
+        for _ in range(plies):
+            if game.get_status() != GameStatus.IN_PROGRESS:
+                break
+
+            position_hash = game.get_position_hash()
+            if (position_hash, depth) not in searched:
+                engine = engines[(game.get_turn_of(), depth)]
+                searched[(position_hash, depth)] = engine.decide_move(game)
+            move = searched[(position_hash, depth)]
+            entries[position_hash][move_key(move)] += 1
+
+            if rng.random() < exploration:
+                move = rng.choice(game.get_possible_opts())
+            game.perform_move(move)
+
+    for engine in engines.values():
+        engine.close()
+    return {position_hash: dict(moves) for position_hash, moves in entries.items()}
+
+
+def main() -> None:
+    """Build the book and write it to a file."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES)
+    parser.add_argument("--plies", type=int, default=DEFAULT_BOOK_PLIES)
+    parser.add_argument("--depths", type=int, nargs="+", default=list(DEFAULT_DEPTHS))
+    parser.add_argument("--exploration", type=float, default=DEFAULT_EXPLORATION)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OPENING_BOOK_PATH)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    entries = build_opening_book(
+        args.games, args.plies, args.depths, args.exploration, args.seed
+    )
+    records = write_opening_book(args.output, entries)
+    print(
+        f"Wrote {records} moves for {len(entries)} positions to {args.output} "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Differential check of the iterative jump generator.
+
+`find_longest_jumps` finds the capture sequences of both move generators
+with an explicit stack. The recursive `CheckersGame._get_man_jumps` and
+`_get_king_jumps` are kept as the reference implementation of the capture
+rules, and this tool compares the two on many positions: every piece of
+every position must get the same sequences in the same order.
+
+Positions come from two sources: random placements of men and kings, which
+are mostly open boards where flying kings have long capture chains, and
+positions reached by random games from the initial position. The tool
+prints the number of pieces compared and the time each generator took, and
+exits with 1 on any mismatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.checkers_game.bitboard import BitboardPosition, find_longest_jumps
+from src.checkers_game.checkers_game import CheckersGame
+from src.common.enums import GameStatus
+from src.common.utils import tile_id_to_grid_coords
+
+__all__ = ["check_position"]
+
+# Constants
+DEFAULT_POSITIONS = 2000
+DEFAULT_SEED = 0
+MAX_RANDOM_PIECES = 24
+KING_PROBABILITY = 0.4
+RANDOM_GAME_PLIES = 80
+
+
+def _random_placement(rng: random.Random) -> np.ndarray:
+    """Place a random number of men and kings on random squares.
+
+    Men are never placed on the row where they would have been promoted.
+
+    Args:
+        rng: Random generator.
+
+    Returns:
+        8x8 board indexed as `game_state[x][y]`.
+    """
+    game_state = np.zeros((8, 8), dtype=int)
+    piece_count = rng.randint(2, MAX_RANDOM_PIECES)
+    for tile_id in rng.sample(range(1, 33), piece_count):
+        x, y = tile_id_to_grid_coords(tile_id)
+        sign = rng.choice((1, -1))
+        is_king = rng.random() < KING_PROBABILITY or y == (7 if sign > 0 else 0)
+        game_state[x][y] = sign * (2 if is_king else 1)
+    return game_state
+
+
+def _random_game_positions(rng: random.Random) -> Iterator[np.ndarray]:
+    """Yield the positions of a game of random moves.
+
+    Args:
+        rng: Random generator.
+    """
+    game = CheckersGame()
+    for _ in range(RANDOM_GAME_PLIES):
+        if game.get_status() != GameStatus.IN_PROGRESS:
+            return
+        game.perform_move(rng.choice(game.get_possible_opts()))
+        yield game.get_game_state()
+
+
+def check_position(
+    game_state: np.ndarray,
+) -> Tuple[int, float, float, Optional[str]]:
+    """Compare both jump generators on every piece of a position.
+
+    Args:
+        game_state: 8x8 board indexed as `game_state[x][y]`.
+
+    Returns:
+        Tuple of (pieces compared, seconds taken by the reference, seconds
+        taken by `find_longest_jumps`, description of the first mismatch
+        or None).
+    """
+    position = BitboardPosition.from_array(game_state)
+    occupied = position.orange | position.blue
+    pieces = 0
+    reference_s = 0.0
+    iterative_s = 0.0
+
+    for tile_id in range(1, 33):
+        x, y = tile_id_to_grid_coords(tile_id)
+        value = int(game_state[x][y])
+        if value == 0:
+            continue
+
+        square = tile_id - 1
+        is_king = abs(value) == 2
+        opponents = position.blue if value > 0 else position.orange
+
+        start_time = time.perf_counter()
+        if is_king:
+            expected = CheckersGame._get_king_jumps(tile_id, game_state)
+        else:
+            expected = CheckersGame._get_man_jumps(tile_id, game_state)
+        middle_time = time.perf_counter()
+        actual = find_longest_jumps(
+            square, is_king, opponents, occupied & ~(1 << square)
+        )
+        end_time = time.perf_counter()
+
+        pieces += 1
+        reference_s += middle_time - start_time
+        iterative_s += end_time - middle_time
+        if actual != expected:
+            return (
+                pieces,
+                reference_s,
+                iterative_s,
+                f"tile {tile_id}: expected {expected}, got {actual}",
+            )
+
+    return pieces, reference_s, iterative_s, None
+
+
+def main() -> None:
+    """Compare the generators on random positions and report the timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--positions", type=int, default=DEFAULT_POSITIONS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    game_states: List[np.ndarray] = []
+    while len(game_states) < args.positions:
+        game_states.append(_random_placement(rng))
+        game_states.extend(_random_game_positions(rng))
+    del game_states[args.positions :]
+
+    pieces = 0
+    reference_s = 0.0
+    iterative_s = 0.0
+    mismatches = 0
+    for game_state in game_states:
+        position_pieces, position_reference_s, position_iterative_s, mismatch = (
+            check_position(game_state)
+        )
+        pieces += position_pieces
+        reference_s += position_reference_s
+        iterative_s += position_iterative_s
+        if mismatch is not None:
+            mismatches += 1
+            print(f"MISMATCH {mismatch}\n{game_state.T[::-1]}")
+
+    print(
+        f"{len(game_states)} positions, {pieces} pieces: "
+        f"reference {reference_s:.2f}s, iterative {iterative_s:.2f}s "
+        f"({reference_s / max(iterative_s, 1e-9):.1f}x)"
+    )
+    if mismatches:
+        print(f"FAIL: {mismatches} positions differ from the reference")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
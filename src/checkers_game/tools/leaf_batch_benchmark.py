@@ -0,0 +1,61 @@
+"""Benchmark batched leaf evaluation against per-leaf evaluation.
+
+Every batch depth searches each suite position to the same depth with a
+fresh engine. The table shows the nodes searched, the total time, the nodes
+per second, the average number of leaves scored per batch and the number of
+positions where the root score differs from per-leaf evaluation (batch
+depth 0), which must be zero since the batched subtrees are searched
+exactly.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from src.checkers_game.tools.position_suite import load_position_suite
+from src.checkers_game.tools.search_comparison import run_suite
+
+__all__ = []
+
+# Constants
+DEFAULT_DEPTH = 6
+DEFAULT_BATCH_DEPTHS = (0, 1, 2)
+
+
+def main() -> None:
+    """Run every batch depth and print the comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument(
+        "--batch-depths", type=int, nargs="+", default=list(DEFAULT_BATCH_DEPTHS)
+    )
+    args = parser.parse_args()
+
+    games = load_position_suite()
+    print(f"{len(games)} positions, depth {args.depth}")
+    print(
+        f"{'batch depth':<12} {'nodes':>10} {'time [s]':>9} {'nodes/s':>9} "
+        f"{'leaves/batch':>12} {'diff':>4}"
+    )
+
+    baseline = None
+    for batch_depth in args.batch_depths:
+        result = run_suite(games, args.depth, {"batch_depth": batch_depth})
+        if baseline is None:
+            baseline = result
+
+        stats = result.stats
+        leaves_per_batch = stats.batched_leaves / stats.batches if stats.batches else 0
+        differences = sum(
+            score != baseline_score
+            for score, baseline_score in zip(result.scores, baseline.scores)
+        )
+        print(
+            f"{batch_depth:<12} {stats.nodes:>10} {result.elapsed_s:>9.2f} "
+            f"{stats.nodes / result.elapsed_s:>9.0f} {leaves_per_batch:>12.1f} "
+            f"{differences:>4}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark of the parallel (root split) search against the worker count.
+
+Every worker count searches the positions of the fixed suite to the same
+depth from empty tables, twice. The speedup of a worker count is the serial
+time divided by the time of its first run. The node overhead is the number
+of nodes the engine and its workers visit together divided by the serial
+node count. The parallel search is deterministic, so both runs must choose
+the same moves; any move that differs between the runs or from the serial
+search is reported. The engine uses at most one worker per usable core, so
+larger worker counts repeat the largest one that fits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.negamax import NegamaxDecisionEngine, usable_cores
+from src.checkers_game.tools.position_suite import load_position_suite
+
+__all__ = ["run_benchmark"]
+
+# Constants
+DEFAULT_DEPTH = 7
+DEFAULT_POSITION_COUNT = 6
+
+
+def run_benchmark(
+    games: List[CheckersGame], depth: int, workers: int
+) -> Tuple[float, int, int, List[Optional[List[int]]]]:
+    """Search every position with the given number of workers.
+
+    Args:
+        games: Positions to search.
+        depth: Search depth.
+        workers: Number of processes (1 runs the serial search).
+
+    Returns:
+        Tuple of (total time in seconds, nodes of the engine, nodes of the
+        workers, chosen moves).
+    """
+    engine = NegamaxDecisionEngine(search_depth=depth, workers=workers)
+    # Start the worker processes on another position so start-up is not
+    # measured
+    warm_up = CheckersGame()
+    engine.computer_color = warm_up.get_turn_of()
+    engine.decide(warm_up)
+
+    total_time = 0.0
+    nodes = 0
+    worker_nodes = 0
+    moves = []
+    for game in games:
+        engine.computer_color = game.turn_of
+        engine.clear_tables()
+        start_time = time.perf_counter()
+        stats = engine.decide(game)
+        total_time += time.perf_counter() - start_time
+        nodes += stats.nodes
+        worker_nodes += stats.worker_nodes
+        moves.append(stats.best_move)
+    engine.close()
+    return total_time, nodes, worker_nodes, moves
+
+
+def main() -> None:
+    """Run the benchmark and print a table of timings and speedups."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument("--positions", type=int, default=DEFAULT_POSITION_COUNT)
+    parser.add_argument("--max-workers", type=int, default=usable_cores())
+    args = parser.parse_args()
+
+    cores = usable_cores()
+    games = load_position_suite(args.positions)
+    print(f"{len(games)} positions, depth {args.depth}, {cores} usable cores")
+    print(
+        f"{'workers':>7} {'time [s]':>9} {'speedup':>8} {'engine nodes':>13} "
+        f"{'worker nodes':>13} {'node overhead':>14}"
+    )
+
+    serial_time = None
+    serial_nodes = None
+    serial_moves = None
+    for workers in range(1, args.max_workers + 1):
+        elapsed, nodes, worker_nodes, moves = run_benchmark(games, args.depth, workers)
+        _, _, _, repeated_moves = run_benchmark(games, args.depth, workers)
+        if serial_time is None:
+            serial_time, serial_nodes, serial_moves = elapsed, nodes, moves
+        notes = []
+        if workers > cores:
+            notes.append("capped at the core count")
+        differing = sum(move != serial for move, serial in zip(moves, serial_moves))
+        if differing:
+            notes.append(f"{differing} moves differ from the serial search")
+        unstable = sum(
+            move != repeated for move, repeated in zip(moves, repeated_moves)
+        )
+        if unstable:
+            notes.append(f"{unstable} moves differ between runs")
+        print(
+            f"{workers:>7} {elapsed:>9.2f} {serial_time / elapsed:>7.2f}x "
+            f"{nodes:>13} {worker_nodes:>13} "
+            f"{(nodes + worker_nodes) / serial_nodes:>13.2f}x"
+            + (f"  ({'; '.join(notes)})" if notes else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""Perft: move generation node counts and speed.
+
+Perft counts the positions reached after exactly N plies by playing every
+legal move, so it exercises the move generator on its own and gives node
+counts that any other move generator must reproduce. It runs on the
+initial position and on a catalogue of positions that hit the tricky parts
+of the rules. Only the longest capture sequences of each piece are legal;
+captured pieces stay on the board until the capture ends; men capture
+backwards and only promote when a move ends on the last row; kings fly.
+
+Each position is counted with the `CheckersGame` move generator, with the
+bitboard one used by the search, and with the reference generator. The
+first two share `find_longest_jumps` for captures, so the reference one
+builds the moves the way the game did before it: with the recursive,
+list-based `_get_man_jumps` and `_get_king_jumps`, which share no code with
+the other two. The known node counts are checked, and the nodes per second
+of each generator reported. The tool exits with 1 on any mismatch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.search_position import SearchPosition
+from src.common.enums import Color
+from src.common.utils import tile_id_to_grid_coords
+
+__all__ = [
+    "PERFT_POSITIONS",
+    "PerftPosition",
+    "perft_bitboard",
+    "perft_game",
+    "perft_reference",
+]
+
+# Constants
+BACKENDS = ("game", "bitboard", "reference")
+
+
+@dataclass(frozen=True)
+class PerftPosition:
+    """A position of the perft catalogue.
+
+    Attributes:
+        name: Short identifier.
+        description: What the position tests.
+        pieces: Tile value of every occupied tile, or None for the initial
+            position.
+        turn_of: Side to move.
+        node_counts: Known perft results for depths 1, 2, ...
+    """
+
+    name: str
+    description: str
+    pieces: Optional[Dict[int, int]]
+    turn_of: Color
+    node_counts: Tuple[int, ...]
+
+    def to_game(self) -> CheckersGame:
+        """Return a game starting at the position."""
+        if self.pieces is None:
+            return CheckersGame()
+
+        game_state = np.zeros((8, 8), dtype=int)
+        for tile_id, value in self.pieces.items():
+            x, y = tile_id_to_grid_coords(tile_id)
+            game_state[x][y] = value
+        return CheckersGame.from_position(game_state, self.turn_of)
+
+
+PERFT_POSITIONS: List[PerftPosition] = [
+    PerftPosition(
+        name="initial",
+        description="Initial position",
+        pieces=None,
+        turn_of=Color.BLUE,
+        node_counts=(7, 49, 302, 1469, 7482, 37976, 190020),
+    ),
+    PerftPosition(
+        name="king-multi-jump",
+        description="Flying king capturing four men, with two landing squares",
+        pieces={1: 2, 3: 1, 6: -1, 11: -1, 15: -1, 22: -1, 27: -1, 29: 1, 32: -1},
+        turn_of=Color.ORANGE,
+        node_counts=(2, 8, 42, 116, 477, 1365, 7273, 32770),
+    ),
+    PerftPosition(
+        name="man-ring-capture",
+        description="Man capturing four men in a ring back to its own square",
+        pieces={2: 1, 10: -1, 11: -1, 14: 1, 18: -1, 19: -1, 26: -1, 30: -1},
+        turn_of=Color.ORANGE,
+        node_counts=(2, 6, 24, 78, 240, 624, 1532, 3814),
+    ),
+    PerftPosition(
+        name="backward-capture",
+        description="Man choosing between a forward and a backward capture",
+        pieces={3: 1, 5: 1, 14: -2, 18: 1, 22: -1, 31: -1},
+        turn_of=Color.ORANGE,
+        node_counts=(2, 15, 63, 376, 2097, 14064, 99741),
+    ),
+    PerftPosition(
+        name="capture-past-last-row",
+        description="Man passing the last row mid-capture without promoting",
+        pieces={1: 1, 12: -1, 22: 1, 26: -1, 27: -1},
+        turn_of=Color.ORANGE,
+        node_counts=(1, 1, 4, 8, 28, 192, 800, 6337),
+    ),
+    PerftPosition(
+        name="longest-capture",
+        description=(
+            "Longest capture rule per piece: a shorter capture of the same "
+            "piece is dropped, a shorter capture of another piece is kept"
+        ),
+        pieces={4: 1, 6: -1, 8: -1, 9: 1, 14: -1, 22: -1, 23: -1, 30: -1, 31: -1},
+        turn_of=Color.ORANGE,
+        node_counts=(3, 4, 6, 59, 109, 536, 667, 3389),
+    ),
+    PerftPosition(
+        name="kings-endgame",
+        description="Two kings against two kings on open diagonals",
+        pieces={1: 2, 10: 2, 18: -2, 32: -2},
+        turn_of=Color.BLUE,
+        node_counts=(15, 159, 1861, 19425, 214912),
+    ),
+]
+
+
+def perft_game(game_state: np.ndarray, turn_of: Color, depth: int) -> int:
+    """Count the positions N plies ahead with the `CheckersGame` generator.
+
+    Args:
+        game_state: 8x8 board indexed as `game_state[x][y]`.
+        turn_of: Side to move.
+        depth: Number of plies.
+
+    Returns:
+        Number of positions reached after exactly `depth` plies.
+    """
+    moves = CheckersGame.get_color_poss_opts(turn_of, game_state)
+    if depth == 1:
+        return len(moves)
+
+    opponent = Color.BLUE if turn_of == Color.ORANGE else Color.ORANGE
+    return sum(
+        perft_game(
+            CheckersGame.get_outcome_of_move(game_state, move), opponent, depth - 1
+        )
+        for move in moves
+    )
+
+
+def _reference_color_opts(color: Color, game_state: np.ndarray) -> List[List[int]]:
+    """Get the legal moves of a color with the recursive jump generators.
+
+    Args:
+        color: Player color (ORANGE or BLUE).
+        game_state: Current board state.
+
+    Returns:
+        List of possible move sequences.
+    """
+    all_moves = []
+    all_jumps = []
+
+    for tile_id in range(1, 33):
+        x, y = tile_id_to_grid_coords(tile_id)
+        val = game_state[x][y]
+
+        if (color == Color.ORANGE and val > 0) or (color == Color.BLUE and val < 0):
+            if abs(val) == 1:
+                moves = CheckersGame._get_man_moves(tile_id, game_state)
+                jumps = CheckersGame._get_man_jumps(tile_id, game_state)
+            else:
+                moves = CheckersGame._get_king_moves(tile_id, game_state)
+                jumps = CheckersGame._get_king_jumps(tile_id, game_state)
+
+            if moves:
+                all_moves.extend(moves)
+            if jumps:
+                all_jumps.extend(jumps)
+
+    return all_jumps if all_jumps else all_moves
+
+
+def perft_reference(game_state: np.ndarray, turn_of: Color, depth: int) -> int:
+    """Count the positions N plies ahead with the reference generator.
+
+    Args:
+        game_state: 8x8 board indexed as `game_state[x][y]`.
+        turn_of: Side to move.
+        depth: Number of plies.
+
+    Returns:
+        Number of positions reached after exactly `depth` plies.
+    """
+    moves = _reference_color_opts(turn_of, game_state)
+    if depth == 1:
+        return len(moves)
+
+    opponent = Color.BLUE if turn_of == Color.ORANGE else Color.ORANGE
+    return sum(
+        perft_reference(
+            CheckersGame.get_outcome_of_move(game_state, move), opponent, depth - 1
+        )
+        for move in moves
+    )
+
+
+def perft_bitboard(position: SearchPosition, depth: int) -> int:
+    """Count the positions N plies ahead with the bitboard generator.
+
+    Args:
+        position: Position to count from; restored before returning.
+        depth: Number of plies.
+
+    Returns:
+        Number of positions reached after exactly `depth` plies.
+    """
+    moves = position.get_possible_opts()
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        undo = position.make_move(move)
+        nodes += perft_bitboard(position, depth - 1)
+        position.unmake_move(undo)
+    return nodes
+
+
+def _run_perft(game: CheckersGame, depth: int, backend: str) -> Tuple[int, float]:
+    """Run perft with one generator.
+
+    Args:
+        game: Position to count from.
+        depth: Number of plies.
+        backend: "game", "bitboard" or "reference".
+
+    Returns:
+        Tuple of (node count, elapsed seconds).
+    """
+    start_time = time.perf_counter()
+    if backend == "game":
+        nodes = perft_game(game.get_game_state(), game.get_turn_of(), depth)
+    elif backend == "reference":
+        nodes = perft_reference(game.get_game_state(), game.get_turn_of(), depth)
+    else:
+        position = SearchPosition.from_array(game.get_game_state(), game.get_turn_of())
+        nodes = perft_bitboard(position, depth)
+    return nodes, time.perf_counter() - start_time
+
+
+def main() -> None:
+    """Count every catalogue position and check the known node counts."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=None,
+        help="Depth of every position; defaults to the deepest known count.",
+    )
+    parser.add_argument(
+        "--positions",
+        nargs="+",
+        choices=[position.name for position in PERFT_POSITIONS],
+        default=[position.name for position in PERFT_POSITIONS],
+    )
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=BACKENDS)
+    args = parser.parse_args()
+
+    print(
+        f"{'position':<22} {'depth':>5} {'backend':<9} {'nodes':>10} "
+        f"{'time [s]':>9} {'nodes/s':>9} {'check':>8}"
+    )
+    mismatches = 0
+    for position in PERFT_POSITIONS:
+        if position.name not in args.positions:
+            continue
+
+        depth = args.depth if args.depth is not None else len(position.node_counts)
+        expected = (
+            position.node_counts[depth - 1]
+            if depth <= len(position.node_counts)
+            else None
+        )
+        for backend in args.backends:
+            nodes, elapsed_s = _run_perft(position.to_game(), depth, backend)
+            if expected is None:
+                check = "unknown"
+            elif nodes == expected:
+                check = "ok"
+            else:
+                check = "MISMATCH"
+                mismatches += 1
+            print(
+                f"{position.name:<22} {depth:>5} {backend:<9} {nodes:>10} "
+                f"{elapsed_s:>9.2f} {nodes / max(elapsed_s, 1e-9):>9.0f} {check:>8}"
+            )
+
+    if mismatches:
+        print(f"FAIL: {mismatches} node counts differ from the known results")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
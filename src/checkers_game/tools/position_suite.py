@@ -0,0 +1,284 @@
+"""Fixed suite of positions for comparing search configurations.
+
+Each position is given as the moves that lead to it from the initial
+position, so the suite stays valid as long as the rules do not change. The
+positions cover the opening to the early endgame and every one has at least
+two legal moves.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from src.checkers_game.checkers_game import CheckersGame
+
+__all__ = ["POSITION_SUITE", "load_position_suite"]
+
+POSITION_SUITE: List[List[List[int]]] = [
+    [
+        [22, 17],
+        [11, 15],
+        [23, 18],
+        [15, -18, 22, -17, 13],
+        [26, 22],
+        [10, 14],
+    ],
+    [
+        [22, 17],
+        [10, 14],
+        [17, -14, 10],
+        [7, -10, 14],
+        [24, 19],
+        [6, 10],
+        [19, 16],
+        [11, -16, 20],
+    ],
+    [
+        [23, 19],
+        [10, 14],
+        [24, 20],
+        [6, 10],
+        [27, 23],
+        [10, 15],
+        [19, -15, 10, -14, 17],
+        [7, 10],
+        [17, 14],
+        [10, -14, 17],
+    ],
+    [
+        [22, 18],
+        [9, 14],
+        [18, -14, 9],
+        [5, -9, 14],
+        [21, 17],
+        [14, -17, 21],
+        [24, 19],
+        [11, 15],
+        [19, 16],
+        [12, -16, 19],
+        [23, -19, 16],
+        [6, 9],
+    ],
+    [
+        [22, 17],
+        [10, 14],
+        [17, -14, 10],
+        [6, -10, 15],
+        [23, 18],
+        [15, -18, 22],
+        [25, -22, 18],
+        [7, 10],
+        [24, 19],
+        [11, 15],
+        [18, -15, 11],
+        [8, -11, 15, -19, 24],
+        [27, -24, 20],
+        [9, 14],
+    ],
+    [
+        [23, 18],
+        [11, 15],
+        [18, -15, 11],
+        [8, -11, 15],
+        [22, 17],
+        [7, 11],
+        [17, 13],
+        [10, 14],
+        [26, 22],
+        [14, 17],
+        [21, -17, 14],
+        [9, -14, 18],
+        [13, 9],
+        [6, -9, 13],
+        [24, 19],
+        [15, -19, 24],
+    ],
+    [
+        [23, 19],
+        [9, 13],
+        [26, 23],
+        [13, 17],
+        [21, -17, 14],
+        [10, -14, 17, -22, 26],
+        [31, -26, 22],
+        [12, 16],
+        [19, -16, 12],
+        [6, 10],
+        [23, 18],
+        [1, 6],
+        [30, 26],
+        [10, 14],
+        [18, -14, 9],
+        [5, -9, 14],
+        [26, 23],
+        [7, 10],
+    ],
+    [
+        [23, 18],
+        [12, 16],
+        [27, 23],
+        [16, 20],
+        [22, 17],
+        [20, -24, 27],
+        [31, -27, 24],
+        [11, 15],
+        [18, -15, 11],
+        [7, -11, 16],
+        [26, 22],
+        [9, 13],
+        [23, 18],
+        [3, 7],
+        [24, 20],
+        [5, 9],
+        [20, -16, 11],
+        [8, -11, 15],
+        [18, -15, 11],
+        [7, -11, 16],
+    ],
+    [
+        [23, 18],
+        [10, 14],
+        [26, 23],
+        [11, 16],
+        [24, 20],
+        [7, 10],
+        [20, -16, 11],
+        [8, -11, 15],
+        [18, -15, 11],
+        [14, 17],
+        [22, -17, 13],
+        [12, 16],
+        [11, -16, 20],
+        [9, 14],
+        [13, 9],
+        [6, -9, 13],
+        [30, 26],
+        [4, 8],
+        [23, 18],
+        [14, -18, 23, -26, 30],
+        [21, 17],
+        [13, -17, 22],
+        [25, -22, 18],
+        [2, 7],
+    ],
+    [
+        [22, 18],
+        [10, 14],
+        [25, 22],
+        [12, 16],
+        [22, 17],
+        [16, 19],
+        [17, -14, 10],
+        [6, -10, 15, -18, 22],
+        [23, -19, 16],
+        [11, -16, 20],
+        [26, -22, 17],
+        [2, 6],
+        [27, 23],
+        [20, -24, 27, -23, 18],
+        [17, 13],
+        [18, 22],
+        [29, 25],
+        [22, -25, 29],
+        [30, 25],
+        [29, -25, 18],
+        [21, 17],
+        [18, 11],
+        [31, 26],
+        [11, 18],
+        [28, 24],
+        [7, 11],
+        [32, 28],
+        [11, 15],
+    ],
+    [
+        [21, 17],
+        [11, 15],
+        [23, 18],
+        [9, 13],
+        [18, -15, 11],
+        [8, -11, 15],
+        [26, 23],
+        [4, 8],
+        [30, 26],
+        [10, 14],
+        [17, -14, 10, -15, 19],
+        [12, 16],
+        [19, -16, 12],
+        [13, 17],
+        [22, -17, 13],
+        [6, 10],
+        [24, 19],
+        [10, 15],
+        [19, -15, 10],
+        [7, -10, 14],
+        [25, 22],
+        [8, 11],
+        [29, 25],
+        [2, 7],
+        [22, 17],
+        [14, -17, 21, -25, 30],
+        [13, 9],
+        [5, -9, 14],
+        [28, 24],
+        [1, 6],
+        [12, 8],
+        [11, -8, 4],
+    ],
+    [
+        [22, 17],
+        [9, 13],
+        [24, 20],
+        [13, -17, 22],
+        [25, -22, 18],
+        [6, 9],
+        [18, 14],
+        [9, -14, 18],
+        [23, -18, 14],
+        [10, -14, 17],
+        [21, -17, 14],
+        [1, 6],
+        [27, 23],
+        [7, 10],
+        [14, -10, 7, -11, 16],
+        [12, -16, 19],
+        [23, -19, 16],
+        [5, 9],
+        [29, 25],
+        [3, 7],
+        [25, 22],
+        [9, 14],
+        [28, 24],
+        [8, 12],
+        [24, 19],
+        [6, 10],
+        [32, 28],
+        [10, 15],
+        [19, -15, 10, -14, 17],
+        [12, -16, 19],
+        [30, 25],
+        [7, 11],
+        [17, 14],
+        [11, 15],
+        [25, 21],
+        [15, 18],
+    ],
+]
+
+
+def load_position_suite(count: int = len(POSITION_SUITE)) -> List[CheckersGame]:
+    """Play out the move sequences of the suite.
+
+    Args:
+        count: Number of positions, taken from the start of the suite.
+
+    Returns:
+        Games in the suite positions.
+    """
+    games = []
+    for moves in POSITION_SUITE[:count]:
+        game = CheckersGame()
+        for move in moves:
+            game.perform_move(move)
+        games.append(game)
+    return games
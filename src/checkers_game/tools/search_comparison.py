@@ -0,0 +1,132 @@
+"""Compare search configurations on the fixed position suite.
+
+Every configuration searches each suite position to the same depth with a
+fresh engine. The table shows the nodes each configuration needed, the
+saving against the first configuration, the re-search counters of the
+principal variation search and aspiration windows, the number of reduced
+and extended moves, and the number of positions where the root score
+differs from the first configuration.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.search_policy import ReductionExtensionPolicy
+from src.checkers_game.search_stats import SearchStats
+from src.checkers_game.tools.position_suite import load_position_suite
+
+__all__ = ["SEARCH_CONFIGURATIONS", "SuiteResult", "run_suite"]
+
+# Constants
+DEFAULT_DEPTH = 6
+LMR_DISABLED = 1000
+
+# Engine keyword arguments of each configuration; the first one is the baseline
+SEARCH_CONFIGURATIONS: Dict[str, Dict[str, Any]] = {
+    "alpha-beta": {"principal_variation": False, "aspiration_window": None},
+    "pvs": {"aspiration_window": None},
+    "pvs+aspiration": {},
+    "lmr": {
+        "search_policy": ReductionExtensionPolicy(
+            single_reply_extension=False, promotion_extension=False
+        )
+    },
+    "extensions": {
+        "search_policy": ReductionExtensionPolicy(reduction_min_depth=LMR_DISABLED)
+    },
+    "lmr+extensions": {"search_policy": ReductionExtensionPolicy()},
+}
+
+
+@dataclass
+class SuiteResult:
+    """Totals of one configuration over the position suite.
+
+    Attributes:
+        stats: Summed node and cutoff counters.
+        elapsed_s: Total search time in seconds.
+        scores: Root score of every position.
+    """
+
+    stats: SearchStats
+    elapsed_s: float
+    scores: List[float]
+
+
+def run_suite(
+    games: List[CheckersGame], depth: int, engine_kwargs: Dict[str, Any]
+) -> SuiteResult:
+    """Search every position with one configuration.
+
+    Args:
+        games: Positions to search.
+        depth: Search depth.
+        engine_kwargs: Keyword arguments for `NegamaxDecisionEngine`.
+
+    Returns:
+        Totals of the configuration.
+    """
+    result = SuiteResult(stats=SearchStats(), elapsed_s=0.0, scores=[])
+    for game in games:
+        engine = NegamaxDecisionEngine(
+            computer_color=game.get_turn_of(), search_depth=depth, **engine_kwargs
+        )
+        start_time = time.perf_counter()
+        engine.decide_move(game)
+        result.elapsed_s += time.perf_counter() - start_time
+
+        stats = engine.get_last_stats()
+        result.stats.add_counters(stats)
+        result.scores.append(stats.score)
+    return result
+
+
+def main() -> None:
+    """Run every configuration and print the comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument(
+        "--configs",
+        nargs="+",
+        choices=list(SEARCH_CONFIGURATIONS),
+        default=list(SEARCH_CONFIGURATIONS),
+    )
+    args = parser.parse_args()
+
+    games = load_position_suite()
+    print(f"{len(games)} positions, depth {args.depth}")
+    print(
+        f"{'configuration':<16} {'nodes':>10} {'saving':>7} {'time [s]':>9} "
+        f"{'null-win':>9} {'re-search':>9} {'aspir.':>6} {'reduced':>8} "
+        f"{'extended':>8} {'diff':>4}"
+    )
+
+    baseline = None
+    for name in args.configs:
+        result = run_suite(games, args.depth, SEARCH_CONFIGURATIONS[name])
+        if baseline is None:
+            baseline = result
+
+        saving = 1.0 - result.stats.nodes / baseline.stats.nodes
+        differences = sum(
+            score != baseline_score
+            for score, baseline_score in zip(result.scores, baseline.scores)
+        )
+        print(
+            f"{name:<16} {result.stats.nodes:>10} {saving:>7.1%} "
+            f"{result.elapsed_s:>9.2f} {result.stats.null_window_searches:>9} "
+            f"{result.stats.research_rate:>9.1%} "
+            f"{result.stats.aspiration_researches:>6} "
+            f"{result.stats.reductions:>8} {result.stats.extensions:>8} "
+            f"{differences:>4}"
+        )
+
+
+if __name__ == "__main__":
+    main()
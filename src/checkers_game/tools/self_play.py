@@ -0,0 +1,157 @@
+"""Self-play regression harness for search changes.
+
+A candidate configuration plays a baseline configuration from every
+position of the fixed suite, once with each color, at the same depth. The
+harness prints the candidate's wins, draws and losses and fails (exit code
+1) if its score is below the required minimum, so a change that saves nodes
+can be checked not to lose strength.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.checkers_game.checkers_game import CheckersGame
+from src.checkers_game.negamax import NegamaxDecisionEngine
+from src.checkers_game.tools.position_suite import load_position_suite
+from src.checkers_game.tools.search_comparison import SEARCH_CONFIGURATIONS
+from src.common.enums import Color, GameStatus
+
+__all__ = ["MatchResult", "play_game", "play_match"]
+
+# Constants
+DEFAULT_DEPTH = 4
+DEFAULT_MAX_PLIES = 150
+DEFAULT_MIN_SCORE = 0.45
+
+
+@dataclass
+class MatchResult:
+    """Results of a match from the candidate's point of view.
+
+    Attributes:
+        wins: Games won by the candidate.
+        draws: Drawn games, including games stopped at the ply limit.
+        losses: Games lost by the candidate.
+    """
+
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    @property
+    def games(self) -> int:
+        """Return the number of games played."""
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        """Return the candidate's score, counting a draw as half a win."""
+        if self.games == 0:
+            return 0.0
+        return (self.wins + 0.5 * self.draws) / self.games
+
+
+def play_game(
+    start: CheckersGame,
+    engines: Dict[Color, NegamaxDecisionEngine],
+    max_plies: int = DEFAULT_MAX_PLIES,
+) -> Optional[Color]:
+    """Play a game between two engines.
+
+    Args:
+        start: Starting position; not modified.
+        engines: Engine playing each color.
+        max_plies: Number of plies after which the game counts as a draw.
+
+    Returns:
+        The winning color, or None for a draw.
+    """
+    game = deepcopy(start)
+    for _ in range(max_plies):
+        if game.get_status() != GameStatus.IN_PROGRESS:
+            break
+        game.perform_move(engines[game.get_turn_of()].decide_move(game))
+
+    if game.get_status() == GameStatus.WON:
+        return game.get_winning_player()
+    return None
+
+
+def play_match(
+    candidate_kwargs: Dict[str, Any],
+    baseline_kwargs: Dict[str, Any],
+    depth: int,
+    starts: List[CheckersGame],
+    max_plies: int = DEFAULT_MAX_PLIES,
+) -> MatchResult:
+    """Play the candidate against the baseline from every start, both colors.
+
+    Args:
+        candidate_kwargs: Engine keyword arguments of the candidate.
+        baseline_kwargs: Engine keyword arguments of the baseline.
+        depth: Search depth of both engines.
+        starts: Starting positions.
+        max_plies: Number of plies after which a game counts as a draw.
+
+    Returns:
+        Results from the candidate's point of view.
+    """
+    result = MatchResult()
+    for start in starts:
+        for candidate_color in (Color.ORANGE, Color.BLUE):
+            baseline_color = (
+                Color.BLUE if candidate_color == Color.ORANGE else Color.ORANGE
+            )
+            engines = {
+                candidate_color: NegamaxDecisionEngine(
+                    candidate_color, depth, **candidate_kwargs
+                ),
+                baseline_color: NegamaxDecisionEngine(
+                    baseline_color, depth, **baseline_kwargs
+                ),
+            }
+            winner = play_game(start, engines, max_plies)
+            if winner is None:
+                result.draws += 1
+            elif winner == candidate_color:
+                result.wins += 1
+            else:
+                result.losses += 1
+    return result
+
+
+def main() -> None:
+    """Play the match and exit with 1 if the candidate scores too low."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("candidate", choices=list(SEARCH_CONFIGURATIONS))
+    parser.add_argument("baseline", choices=list(SEARCH_CONFIGURATIONS))
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH)
+    parser.add_argument("--max-plies", type=int, default=DEFAULT_MAX_PLIES)
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE)
+    args = parser.parse_args()
+
+    result = play_match(
+        SEARCH_CONFIGURATIONS[args.candidate],
+        SEARCH_CONFIGURATIONS[args.baseline],
+        args.depth,
+        load_position_suite(),
+        args.max_plies,
+    )
+    print(
+        f"{args.candidate} vs {args.baseline} at depth {args.depth}: "
+        f"+{result.wins} ={result.draws} -{result.losses} "
+        f"(score {result.score:.1%})"
+    )
+    if result.score < args.min_score:
+        print(f"FAIL: score below {args.min_score:.1%}")
+        sys.exit(1)
+    print("PASS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Transposition table for the checkers search.
+
+The table remembers the result of every searched position, indexed by its
+Zobrist hash. Entries live in preallocated NumPy arrays sized from a memory
+budget, so the table never grows while the search runs.
+
+The table can be kept across the moves of a game. Every entry records the
+generation it was stored in, and starting a new generation after each move
+turns the older entries into stale ones: they are still found by a probe,
+but any new result may replace them.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.common.enums import BoundType, ReplacementPolicy
+
+__all__ = ["TranspositionTable"]
+
+# Constants
+DEFAULT_TT_SIZE_MB = 16.0
+BYTES_PER_MB = 1024 * 1024
+EMPTY_DEPTH = -1
+GENERATION_COUNT = 256
+
+# key, move key, score, depth, bound, generation
+ENTRY_SIZE_BYTES = 8 + 8 + 8 + 1 + 1 + 1
+
+
+class TranspositionTable:
+    """Fixed-size hash table of search results.
+
+    Each slot stores the full position hash, the search depth, the bound type,
+    the score and the key of the best move found. A slot is addressed by the
+    low bits of the hash, so two positions can compete for the same slot; the
+    replacement policy decides which one is kept, unless the stored entry is
+    from an older generation, which is always replaced.
+    """
+
+    def __init__(
+        self,
+        size_mb: float = DEFAULT_TT_SIZE_MB,
+        replacement_policy: ReplacementPolicy = ReplacementPolicy.DEPTH_PREFERRED,
+    ) -> None:
+        """Allocate the table.
+
+        Args:
+            size_mb: Memory budget in megabytes. The number of slots is the
+                largest power of two that fits the budget.
+            replacement_policy: Policy applied when a slot is already taken.
+        """
+        entries = max(1, int(size_mb * BYTES_PER_MB) // ENTRY_SIZE_BYTES)
+        self.capacity = 1 << (entries.bit_length() - 1)
+        self.replacement_policy = replacement_policy
+
+        self._mask = self.capacity - 1
+        self._keys = np.zeros(self.capacity, dtype=np.uint64)
+        self._moves = np.zeros(self.capacity, dtype=np.uint64)
+        self._scores = np.zeros(self.capacity, dtype=np.float64)
+        self._depths = np.full(self.capacity, EMPTY_DEPTH, dtype=np.int8)
+        self._bounds = np.zeros(self.capacity, dtype=np.int8)
+        self._generations = np.zeros(self.capacity, dtype=np.uint8)
+        self.generation = 0
+
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._depths.fill(EMPTY_DEPTH)
+        self._generations.fill(0)
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_generation(self) -> None:
+        """Mark all stored entries as stale.
+
+        Stale entries still answer probes, but the replacement policy no
+        longer protects them. Called after every move of a game whose table
+        is kept, so results of lines that can no longer occur age out.
+        """
+        self.generation = (self.generation + 1) % GENERATION_COUNT
+
+    def probe(self, key: int) -> Optional[Tuple[int, BoundType, float, int]]:
+        """Look up a position.
+
+        Args:
+            key: Zobrist hash of the position.
+
+        Returns:
+            Tuple of (depth, bound, score, move_key), or None if the position
+            is not stored.
+        """
+        self.probes += 1
+        index = key & self._mask
+        if self._depths[index] == EMPTY_DEPTH or int(self._keys[index]) != key:
+            return None
+
+        self.hits += 1
+        return (
+            int(self._depths[index]),
+            BoundType(int(self._bounds[index])),
+            float(self._scores[index]),
+            int(self._moves[index]),
+        )
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        bound: BoundType,
+        score: float,
+        move_key: int,
+    ) -> None:
+        """Store a search result, subject to the replacement policy.
+
+        Args:
+            key: Zobrist hash of the position.
+            depth: Remaining depth the position was searched to.
+            bound: How the score relates to the true value.
+            score: Score from the side to move's perspective.
+            move_key: Key of the best move found (see `move_key`), or 0.
+        """
+        index = key & self._mask
+        stored_depth = int(self._depths[index])
+
+        if stored_depth != EMPTY_DEPTH and int(self._keys[index]) != key:
+            if (
+                self.replacement_policy == ReplacementPolicy.DEPTH_PREFERRED
+                and depth < stored_depth
+                and self._generations[index] == self.generation
+            ):
+                return
+            self.overwrites += 1
+
+        self._keys[index] = key
+        self._depths[index] = depth
+        self._bounds[index] = bound
+        self._scores[index] = score
+        self._moves[index] = move_key
+        self._generations[index] = self.generation
+        self.stores += 1
+
+    def get_usage(self) -> float:
+        """Return the fraction of occupied slots (0.0 to 1.0)."""
+        return float(np.count_nonzero(self._depths != EMPTY_DEPTH)) / self.capacity
@@ -0,0 +1,146 @@
+"""Zobrist hashing of checkers positions.
+
+Every (square, piece) pair and the side to move get a fixed random 64-bit key.
+A position hash is the XOR of the keys of its pieces, so a move only changes
+the hash by the keys of the squares it touches and can be updated in O(1)
+per captured piece instead of being recomputed from the whole board.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.checkers_game.bitboard import (
+    BLUE_KING,
+    BLUE_MAN,
+    BOARD_SIZE,
+    EMPTY_TILE,
+    ORANGE_KING,
+    ORANGE_MAN,
+    SQUARE_COORDS,
+    SQUARE_COUNT,
+    BitboardPosition,
+    iter_squares,
+)
+from src.common.enums import Color
+
+__all__ = [
+    "hash_game_state",
+    "hash_position",
+    "move_hash_delta",
+    "piece_key",
+]
+
+ZOBRIST_SEED = 0x5EED_C4EC
+
+
+def _build_keys() -> Tuple[Tuple[Tuple[int, ...], ...], int]:
+    """Generate the piece keys and the side-to-move key."""
+    rng = np.random.default_rng(ZOBRIST_SEED)
+    raw = rng.integers(0, 2**64, size=4 * SQUARE_COUNT + 1, dtype=np.uint64)
+    values = [int(value) for value in raw]
+    pieces = tuple(
+        tuple(values[index * SQUARE_COUNT : (index + 1) * SQUARE_COUNT])
+        for index in range(4)
+    )
+    return pieces, values[-1]
+
+
+_PIECE_KEYS, SIDE_TO_MOVE_KEY = _build_keys()
+
+# Keys indexed by square, one table per piece type
+ORANGE_MAN_KEYS, ORANGE_KING_KEYS, BLUE_MAN_KEYS, BLUE_KING_KEYS = _PIECE_KEYS
+
+_KEYS_BY_VALUE = {
+    ORANGE_MAN: ORANGE_MAN_KEYS,
+    ORANGE_KING: ORANGE_KING_KEYS,
+    BLUE_MAN: BLUE_MAN_KEYS,
+    BLUE_KING: BLUE_KING_KEYS,
+}
+
+
+def piece_key(square: int, value: int) -> int:
+    """Return the key of a piece standing on a square.
+
+    Args:
+        square: 0-based square index (tile ID - 1).
+        value: `CheckersGame` tile value of the piece.
+
+    Returns:
+        64-bit key, or 0 for an empty tile.
+    """
+    if value == EMPTY_TILE:
+        return 0
+    return _KEYS_BY_VALUE[value][square]
+
+
+def hash_position(position: BitboardPosition, turn_of: Optional[Color]) -> int:
+    """Compute the hash of a bitboard position from scratch.
+
+    Args:
+        position: Position to hash.
+        turn_of: Side to move, or None to leave the side out of the hash.
+
+    Returns:
+        64-bit Zobrist hash.
+    """
+    kings = position.kings
+    result = SIDE_TO_MOVE_KEY if turn_of == Color.ORANGE else 0
+    for square in iter_squares(position.orange & ~kings):
+        result ^= ORANGE_MAN_KEYS[square]
+    for square in iter_squares(position.orange & kings):
+        result ^= ORANGE_KING_KEYS[square]
+    for square in iter_squares(position.blue & ~kings):
+        result ^= BLUE_MAN_KEYS[square]
+    for square in iter_squares(position.blue & kings):
+        result ^= BLUE_KING_KEYS[square]
+    return result
+
+
+def hash_game_state(game_state: np.ndarray, turn_of: Optional[Color]) -> int:
+    """Compute the hash of an 8x8 `CheckersGame` board.
+
+    Args:
+        game_state: 8x8 board indexed as `game_state[x][y]`.
+        turn_of: Side to move, or None to leave the side out of the hash.
+
+    Returns:
+        64-bit Zobrist hash.
+    """
+    return hash_position(BitboardPosition.from_array(game_state), turn_of)
+
+
+def move_hash_delta(game_state: np.ndarray, move: List[int]) -> int:
+    """Compute the hash change caused by a move on an 8x8 board.
+
+    XOR the result into the hash of the position before the move to obtain
+    the hash of the position after it, with the side to move switched.
+
+    Args:
+        game_state: Board before the move, indexed as `game_state[x][y]`.
+        move: Sequence of tile IDs representing the move.
+
+    Returns:
+        64-bit value to XOR into the current hash.
+    """
+    start_square = move[0] - 1
+    end_square = move[-1] - 1
+    start_x, start_y = SQUARE_COORDS[start_square]
+    piece = int(game_state[start_x][start_y])
+
+    landed = piece
+    end_y = SQUARE_COORDS[end_square][1]
+    if piece == ORANGE_MAN and end_y == BOARD_SIZE - 1:
+        landed = ORANGE_KING
+    elif piece == BLUE_MAN and end_y == 0:
+        landed = BLUE_KING
+
+    delta = SIDE_TO_MOVE_KEY
+    delta ^= piece_key(start_square, piece) ^ piece_key(end_square, landed)
+    for tile in move[1:-1]:
+        if tile < 0:
+            x, y = SQUARE_COORDS[-tile - 1]
+            delta ^= piece_key(-tile - 1, int(game_state[x][y]))
+    return delta
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from src.common.configs import ColorConfig, RecognitionConfig
+from src.common.configs import ColorConfig, EvaluationConfig, RecognitionConfig
 from src.common.enums import (
+    BoundType,
     CalibrationMethod,
     Color,
     GameReportField,
     GameStatus,
     MoveValidationResult,
+    ReplacementPolicy,
+    TablebaseResult,
 )
 from src.common.exceptions import (
     BoardDetectionError,
@@ -23,11 +26,15 @@ from src.common.exceptions import (
     DobotError,
     InsufficientDataError,
     NoStartTileError,
+    OpeningBookError,
+    SearchAbortedError,
+    TablebaseError,
 )
 
 __all__ = [
     # Configs
     "ColorConfig",
+    "EvaluationConfig",
     "RecognitionConfig",
     # Enums
     "Color",
@@ -35,6 +42,9 @@ __all__ = [
     "MoveValidationResult",
     "CalibrationMethod",
     "GameReportField",
+    "BoundType",
+    "ReplacementPolicy",
+    "TablebaseResult",
     # Exceptions
     "BoardError",
     "NoStartTileError",
@@ -47,5 +57,8 @@ __all__ = [
     "CheckersGameEndError",
     "CheckersGameNotPermittedMoveError",
     "DecisionEngineError",
+    "OpeningBookError",
+    "SearchAbortedError",
+    "TablebaseError",
     "DobotError",
 ]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from src.common.configs.color_config import ColorConfig
+from src.common.configs.evaluation_config import EvaluationConfig
 from src.common.configs.recognition_config import RecognitionConfig
 
-__all__ = ["ColorConfig", "RecognitionConfig"]
+__all__ = ["ColorConfig", "EvaluationConfig", "RecognitionConfig"]
@@ -0,0 +1,35 @@
+"""Configuration dataclass for the static evaluation of the checkers engine."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+__all__ = ["EvaluationConfig"]
+
+
+@dataclass
+class EvaluationConfig:
+    """Weights of the evaluation terms, in hundredths of a man.
+
+    Attributes:
+        man_value: Material value of a man.
+        king_value: Material value of a king.
+        advancement: Bonus per row a man has advanced from its back rank.
+        center_column: Bonus for a man on one of the four central columns.
+        back_rank_guard: Bonus for a man still guarding its own back rank.
+        mobility: Bonus per simple move available to a piece.
+        runaway: Bonus for a man on the promotion row's doorstep with no
+            opposing piece able to stop it; scaled down with the distance
+            still to go.
+        king_centralization: Bonus for a king in the center of the board,
+            scaled down towards the edges.
+    """
+
+    man_value: float = 100.0
+    king_value: float = 160.0
+    advancement: float = 3.0
+    center_column: float = 4.0
+    back_rank_guard: float = 10.0
+    mobility: float = 2.0
+    runaway: float = 50.0
+    king_centralization: float = 8.0
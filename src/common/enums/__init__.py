@@ -6,11 +6,14 @@ robot communication, color representation, and calibration configuration.
 
 from __future__ import annotations
 
+from src.common.enums.bound_type import BoundType
 from src.common.enums.calibration_method import CalibrationMethod
 from src.common.enums.color import Color
 from src.common.enums.game_report_field import GameReportField
 from src.common.enums.game_status import GameStatus
 from src.common.enums.move_validation_result import MoveValidationResult
+from src.common.enums.replacement_policy import ReplacementPolicy
+from src.common.enums.tablebase_result import TablebaseResult
 
 __all__ = [
     "Color",
@@ -18,6 +21,9 @@ __all__ = [
     "MoveValidationResult",
     "CalibrationMethod",
     "GameReportField",
+    "BoundType",
+    "ReplacementPolicy",
+    "TablebaseResult",
     # Backward compatibility aliases
     "Status",
     "GameStateResult",
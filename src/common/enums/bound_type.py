@@ -0,0 +1,21 @@
+"""Enumeration for transposition table bound types."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+__all__ = ["BoundType"]
+
+
+class BoundType(IntEnum):
+    """Describes how a stored search score relates to the true value.
+
+    Attributes:
+        EXACT: The score is the exact value of the position.
+        LOWER: The search failed high; the true value is at least the score.
+        UPPER: The search failed low; the true value is at most the score.
+    """
+
+    EXACT = 1
+    LOWER = 2
+    UPPER = 3
@@ -23,6 +23,8 @@ class GameReportField(Enum):
         ROBOT_COLOR: Color assigned to the robot player.
         ROBOT_MOVE: The move the robot plans to execute.
         IS_CROWNED: Whether the robot's move results in a king piece.
+        IS_PLANNING: Whether the robot's move is being searched for.
+        SEARCH_STATS: Statistics of the robot's most recent decision.
     """
 
     GAME_STATE = 1
@@ -34,3 +36,5 @@ class GameReportField(Enum):
     ROBOT_COLOR = 7
     ROBOT_MOVE = 8
     IS_CROWNED = 9
+    IS_PLANNING = 10
+    SEARCH_STATS = 11
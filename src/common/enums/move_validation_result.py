@@ -21,6 +21,8 @@ class MoveValidationResult(Enum):
         INVALID_OPPONENT_MOVE: The opponent attempted an illegal move.
         VALID_OPPONENT_MOVE: The opponent made a legal move.
         NO_OPPONENT_MOVE: No move was detected during the opponent's turn.
+        OPPONENT_MOVE_TAKEN_BACK: The opponent restored the board to the
+            position before their last move.
     """
 
     INVALID_ROBOT_MOVE = 1
@@ -30,3 +32,4 @@ class MoveValidationResult(Enum):
     INVALID_OPPONENT_MOVE = 5
     VALID_OPPONENT_MOVE = 6
     NO_OPPONENT_MOVE = 7
+    OPPONENT_MOVE_TAKEN_BACK = 8
@@ -0,0 +1,20 @@
+"""Enumeration for transposition table replacement policies."""
+
+from __future__ import annotations
+
+from enum import Enum
+
+__all__ = ["ReplacementPolicy"]
+
+
+class ReplacementPolicy(Enum):
+    """Decides whether a new search result may overwrite an occupied slot.
+
+    Attributes:
+        ALWAYS_REPLACE: The newest result always overwrites the slot.
+        DEPTH_PREFERRED: A different position only overwrites the slot if it
+            was searched at least as deep as the stored one.
+    """
+
+    ALWAYS_REPLACE = 1
+    DEPTH_PREFERRED = 2
@@ -0,0 +1,21 @@
+"""Enumeration for endgame tablebase results."""
+
+from __future__ import annotations
+
+from enum import IntEnum
+
+__all__ = ["TablebaseResult"]
+
+
+class TablebaseResult(IntEnum):
+    """Game-theoretic result of a position for the side to move.
+
+    Attributes:
+        WIN: The side to move wins with best play.
+        LOSS: The side to move loses with best play.
+        DRAW: Neither side can force a win.
+    """
+
+    WIN = 1
+    LOSS = 2
+    DRAW = 3
@@ -13,11 +13,17 @@ from src.common.exceptions.board import (
     InsufficientDataError,
     NoStartTileError,
 )
-from src.common.exceptions.decision import DecisionEngineError
+from src.common.exceptions.decision import (
+    DecisionEngineError,
+    OpeningBookError,
+    SearchAbortedError,
+    TablebaseError,
+)
 from src.common.exceptions.game import (
     CheckersError,
     CheckersGameEndError,
     CheckersGameNotPermittedMoveError,
+    GameRecordError,
 )
 from src.common.exceptions.robot import DobotError
 from src.common.exceptions.vision import CV2Error, CameraReadError
@@ -36,8 +42,12 @@ __all__ = [
     "CheckersError",
     "CheckersGameEndError",
     "CheckersGameNotPermittedMoveError",
+    "GameRecordError",
     # Decision engine exceptions
     "DecisionEngineError",
+    "OpeningBookError",
+    "SearchAbortedError",
+    "TablebaseError",
     # Robot manipulation exceptions
     "DobotError",
 ]
@@ -4,8 +4,23 @@ from __future__ import annotations
 
 __all__ = [
     "DecisionEngineError",
+    "OpeningBookError",
+    "SearchAbortedError",
+    "TablebaseError",
 ]
 
 
 class DecisionEngineError(Exception):
     """Raised when the AI decision engine encounters an invalid state or criteria."""
+
+
+class SearchAbortedError(DecisionEngineError):
+    """Raised inside the search when its time budget runs out or it is stopped."""
+
+
+class OpeningBookError(DecisionEngineError):
+    """Raised when an opening book file is missing data or has a bad format."""
+
+
+class TablebaseError(DecisionEngineError):
+    """Raised when an endgame tablebase file is missing data or has a bad format."""
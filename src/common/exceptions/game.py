@@ -6,6 +6,7 @@ __all__ = [
     "CheckersError",
     "CheckersGameEndError",
     "CheckersGameNotPermittedMoveError",
+    "GameRecordError",
 ]
 
 
@@ -19,3 +20,7 @@ class CheckersGameEndError(CheckersError):
 
 class CheckersGameNotPermittedMoveError(CheckersError):
     """Raised when a player attempts an illegal or unpermitted move."""
+
+
+class GameRecordError(CheckersError):
+    """Raised when a game record file is missing data or has a bad format."""